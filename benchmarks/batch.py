@@ -0,0 +1,36 @@
+"""apply_transaction in a loop versus apply_transactions in batches.
+
+Runs against ChildChain directly, so it measures the per-call overhead
+inside the child chain (writer hand-off and log sync) but not the HTTP
+round trips a batch also saves.
+
+Usage: python benchmarks/batch.py [num_transactions]
+"""
+import os
+import sys
+import tempfile
+from common import make_child_chain, make_transfers, timeit
+from plasma.child_chain.write_ahead_log import WriteAheadLog
+
+
+def main(num_transactions):
+    print('{:>12} {:>12} {:>14}'.format('batch size', 'seconds', 'txs / second'))
+    for batch_size in [1, 100, 1000]:
+        directory = tempfile.mkdtemp()
+        child_chain = make_child_chain(wal=WriteAheadLog(os.path.join(directory, 'wal')))
+        encoded_txs = make_transfers(child_chain, num_transactions)
+
+        def apply():
+            if batch_size == 1:
+                for encoded_tx in encoded_txs:
+                    child_chain.apply_transaction(encoded_tx)
+            else:
+                for start in range(0, len(encoded_txs), batch_size):
+                    child_chain.apply_transactions(encoded_txs[start:start + batch_size])
+
+        elapsed = timeit(apply)
+        print('{:>12} {:>12.3f} {:>14.0f}'.format(batch_size, elapsed, num_transactions / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,63 @@
+"""Fetching a full block over JSON-RPC versus the binary endpoint.
+
+Serves a committed 65,536 transaction block from a local werkzeug
+server and fetches it with ChildChainService, once forced onto JSON-RPC
+and once onto the binary endpoint. Bytes are the size of the response
+body; latency includes hex and JSON decoding on the client.
+
+Usage: python benchmarks/binary_rpc.py [num_transactions]
+"""
+import sys
+import threading
+import requests
+from jsonrpc import Dispatcher, JSONRPCResponseManager
+from werkzeug.serving import make_server
+from werkzeug.wrappers import Request, Response
+from common import AUTHORITY_KEY, make_child_chain, make_transactions, timeit
+from plasma.child_chain.binary_rpc import BINARY_PATH, handle_binary_request, make_binary_dispatcher
+from plasma.client.child_chain_service import ChildChainService
+
+
+def make_application(child_chain):
+    # The parts of server.py's application that serve blocks
+    dispatcher = Dispatcher()
+    dispatcher['get_block'] = child_chain.get_block
+    binary_dispatcher = make_binary_dispatcher(child_chain)
+
+    @Request.application
+    def application(request):
+        if request.path.startswith(BINARY_PATH):
+            return handle_binary_request(binary_dispatcher, request)
+        response = JSONRPCResponseManager.handle(request.data, dispatcher)
+        return Response(response.json, mimetype='application/json')
+    return application
+
+
+def main(num_transactions):
+    child_chain = make_child_chain()
+    blknum = child_chain.current_block_number
+    block = child_chain.current_block
+    for tx in make_transactions(num_transactions):
+        block.add_transaction(tx)
+    block.sign(AUTHORITY_KEY)
+    child_chain.submit_block(block.encode().hex())
+
+    server = make_server('127.0.0.1', 0, make_application(child_chain))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{}'.format(server.server_port)
+
+    json_service = ChildChainService(url, binary=False)
+    binary_service = ChildChainService(url, binary=True)
+    encoded_block = binary_service.get_encoded_block(blknum)
+    assert json_service.get_encoded_block(blknum) == encoded_block
+    payload = {'method': 'get_block', 'params': [blknum], 'jsonrpc': '2.0', 'id': 0}
+    json_bytes = len(requests.post(url, json=payload).content)
+
+    print('{:>10} {:>14} {:>12}'.format('', 'bytes', 'ms'))
+    print('{:>10} {:>14} {:>12.1f}'.format('json', json_bytes, timeit(lambda: json_service.get_encoded_block(blknum), repeat=5) * 1000))
+    print('{:>10} {:>14} {:>12.1f}'.format('binary', len(encoded_block), timeit(lambda: binary_service.get_encoded_block(blknum), repeat=5) * 1000))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 65536)
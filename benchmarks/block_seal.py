@@ -0,0 +1,41 @@
+"""Block seal latency for empty, small and full blocks.
+
+Sealing used to build a FixedMerkle over the submitted block and
+another one over the current block, and hash the submitted block to
+check its signature. Now the current block keeps an incremental tree
+and its transactions' encodings as transactions are added, and the
+submitted block is matched to it by hash, which the signature check
+needs anyway. Decoding the submitted block is the same either way and
+isn't timed.
+
+Usage: python benchmarks/block_seal.py
+"""
+import rlp
+from common import AUTHORITY_KEY, make_transactions, timeit
+from plasma.child_chain.block import Block
+
+SIZES = [0, 16, 1024, 65536]
+
+
+def main():
+    print('{:>14} {:>14} {:>16}'.format('transactions', 'fixed ms', 'incremental ms'))
+    for size in SIZES:
+        current_block = Block()
+        for tx in make_transactions(size, key=AUTHORITY_KEY):
+            tx.hash
+            current_block.add_transaction(tx)
+        encoded_block = rlp.encode(current_block)
+
+        def fixed(submitted_block=rlp.decode(encoded_block, Block)):
+            submitted_block.hash
+            assert submitted_block.merklize_transaction_set() == current_block.merklize_transaction_set()
+
+        def incremental(submitted_block=rlp.decode(encoded_block, Block)):
+            assert submitted_block.hash == current_block.hash
+            current_block.root
+
+        print('{:>14} {:>14.2f} {:>16.2f}'.format(size, timeit(fixed) * 1000, timeit(incremental) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Cold-start time and resident memory of a ChildChain backed by LevelDB.
+
+Usage: python benchmarks/block_store.py [num_txs ...]
+"""
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from common import make_child_chain, make_transactions
+from plasma.child_chain.block import Block
+from plasma.child_chain.block_store import LevelDBBlockStore
+
+TXS_PER_BLOCK = 1000
+DEFAULT_SIZES = [10000, 100000, 1000000]
+
+
+def populate(path, num_txs):
+    store = LevelDBBlockStore(path)
+    blknum = 1000
+    for start in range(0, num_txs, TXS_PER_BLOCK):
+        store[blknum] = Block(make_transactions(min(TXS_PER_BLOCK, num_txs - start), blknum))
+        blknum += 1000
+    store.close()
+
+
+def cold_start(path, results):
+    start = time.perf_counter()
+    child_chain = make_child_chain(block_store=LevelDBBlockStore(path))
+    elapsed = time.perf_counter() - start
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    results.put((elapsed, max_rss_mb, child_chain.current_block_number))
+
+
+def main(sizes):
+    print('{:>10} {:>14} {:>14}'.format('txs', 'cold start (s)', 'max RSS (MB)'))
+    for num_txs in sizes:
+        with tempfile.TemporaryDirectory() as path:
+            populate(path, num_txs)
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=cold_start, args=(path, results))
+            process.start()
+            elapsed, max_rss_mb, _ = results.get()
+            process.join()
+            print('{:>10} {:>14.3f} {:>14.1f}'.format(num_txs, elapsed, max_rss_mb))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
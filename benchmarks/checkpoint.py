@@ -0,0 +1,49 @@
+"""Restart time against chain length, with and without state checkpoints.
+
+Each run writes a checkpoint, then commits a short tail of blocks that
+have to be replayed on restart.
+
+Usage: python benchmarks/checkpoint.py [num_txs ...]
+"""
+import os
+import sys
+import tempfile
+from block_store import TXS_PER_BLOCK, populate
+from common import make_child_chain, make_transactions, timeit
+from plasma.child_chain.block import Block
+from plasma.child_chain.block_store import LevelDBBlockStore
+from plasma.child_chain.checkpoint import Checkpointer
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+TAIL_BLOCKS = 5
+
+
+def restart(path, checkpoint_dir=None):
+    checkpointer = Checkpointer(checkpoint_dir) if checkpoint_dir is not None else None
+    child_chain = make_child_chain(block_store=LevelDBBlockStore(path), checkpointer=checkpointer)
+    child_chain.blocks.close()
+
+
+def main(sizes):
+    print('{:>10} {:>18} {:>18}'.format('txs', 'full replay (s)', 'checkpoint (s)'))
+    for num_txs in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'db')
+            checkpoint_dir = os.path.join(directory, 'checkpoints')
+            populate(path, num_txs)
+
+            child_chain = make_child_chain(block_store=LevelDBBlockStore(path), checkpointer=Checkpointer(checkpoint_dir))
+            child_chain.checkpointer.write(child_chain)
+            for _ in range(TAIL_BLOCKS):
+                blknum = child_chain.current_block_number
+                child_chain.blocks[blknum] = Block(make_transactions(TXS_PER_BLOCK, blknum))
+                child_chain.current_block_number += child_chain.child_block_interval
+            child_chain.blocks.close()
+
+            full_replay = timeit(lambda: restart(path))
+            from_checkpoint = timeit(lambda: restart(path, checkpoint_dir))
+            print('{:>10} {:>18.3f} {:>18.3f}'.format(num_txs, full_replay, from_checkpoint))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
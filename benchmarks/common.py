@@ -0,0 +1,84 @@
+import time
+import rlp
+import plasma.child_chain.child_chain as child_chain_module
+from ethereum import utils
+from plasma.child_chain.child_chain import ChildChain
+from plasma.child_chain.transaction import Transaction
+
+NULL_ADDRESS = b'\x00' * 20
+AUTHORITY_KEY = utils.normalize_key(b'3bb369fecdc16b93b99514d8ed9c2e87c5824cf4a6a98d2e8e91b7dd0c063304')
+AUTHORITY = '0x' + utils.privtoaddr(AUTHORITY_KEY).hex()
+
+
+class NullEventListener(object):
+    """Stands in for RootEventListener so benchmarks don't need a root chain node."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def on(self, event_name, event_handler):
+        pass
+
+    def stop_all(self):
+        pass
+
+
+class NullRootChain(object):
+    """Accepts and discards root chain transactions."""
+
+    def transact(self, *args, **kwargs):
+        return self
+
+    def submitBlock(self, root):
+        pass
+
+
+def make_child_chain(**kwargs):
+    child_chain_module.RootEventListener = NullEventListener
+    return ChildChain(AUTHORITY, NullRootChain(), **kwargs)
+
+
+def make_transactions(count, blknum=1, key=None):
+    """Returns `count` distinct transactions, signed with `key` if given."""
+
+    transactions = []
+    for i in range(count):
+        tx = Transaction(blknum, i % 65536, 0,
+                         0, 0, 0,
+                         NULL_ADDRESS,
+                         i.to_bytes(20, 'big'), i + 1,
+                         NULL_ADDRESS, 0)
+        if key is not None:
+            tx.sign1(key)
+        transactions.append(tx)
+    return transactions
+
+
+def make_transfers(child_chain, count):
+    """Deposits `count` outputs on `child_chain` and returns a signed, hex
+    encoded transfer spending each of them, with varying fees."""
+
+    owner = utils.privtoaddr(AUTHORITY_KEY)
+    encoded_txs = []
+    for blknum in range(1, count + 1):
+        child_chain.apply_deposit({'args': {'depositor': owner, 'amount': 100, 'depositBlock': blknum}})
+        tx = Transaction(blknum, 0, 0,
+                         0, 0, 0,
+                         NULL_ADDRESS,
+                         owner, 100 - blknum % 100,
+                         NULL_ADDRESS, 0)
+        tx.sign1(AUTHORITY_KEY)
+        encoded_txs.append(rlp.encode(tx).hex())
+    return encoded_txs
+
+
+def timeit(fn, repeat=1):
+    """Returns the best wall-clock time of `repeat` calls to `fn`, in seconds."""
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
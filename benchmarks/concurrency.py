@@ -0,0 +1,49 @@
+"""Transaction throughput and latency with concurrent clients.
+
+Every client submits its share of transactions through
+ChildChain.apply_transaction from its own thread, the way werkzeug's
+threaded server calls it, while all state changes go through the
+chain's single writer thread.
+
+Usage: python benchmarks/concurrency.py [num_transactions]
+"""
+import sys
+import threading
+import time
+from common import make_child_chain, make_transfers
+
+
+def run(num_clients, num_transactions):
+    child_chain = make_child_chain()
+    encoded_txs = make_transfers(child_chain, num_transactions)
+
+    latencies = []
+
+    def client(encoded_txs):
+        for encoded_tx in encoded_txs:
+            start = time.perf_counter()
+            child_chain.apply_transaction(encoded_tx)
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(encoded_txs[i::num_clients],)) for i in range(num_clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    assert len(child_chain.mempool) == num_transactions
+    latencies.sort()
+    return num_transactions / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main(num_transactions):
+    print('{:>8} {:>12} {:>14} {:>14}'.format('clients', 'txs / second', 'p50 ms', 'p99 ms'))
+    for num_clients in [1, 8, 64]:
+        throughput, p50, p99 = run(num_clients, num_transactions)
+        print('{:>8} {:>12.0f} {:>14.2f} {:>14.2f}'.format(num_clients, throughput, p50 * 1000, p99 * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,42 @@
+"""Per-request cost of get_block and get_transaction on a committed block.
+
+Before, every call ran `rlp.encode(...).hex()` on the block or
+transaction. Now the hex encoding of a committed block is cached when
+it's committed, and a transaction's on its first read, so repeated
+polls of the same recent block are served from the cache.
+
+Usage: python benchmarks/encoded_cache.py
+"""
+import rlp
+from common import AUTHORITY_KEY, make_child_chain, make_transactions, timeit
+
+SIZES = [16, 1024, 16384]
+REQUESTS = 100
+
+
+def main():
+    print('{:>14} {:>16} {:>16} {:>16} {:>16}'.format(
+        'transactions', 'block encode us', 'block cached us', 'tx encode us', 'tx cached us'))
+    for size in SIZES:
+        child_chain = make_child_chain()
+        blknum = child_chain.current_block_number
+        block = child_chain.current_block
+        for tx in make_transactions(size):
+            block.add_transaction(tx)
+        block.sign(AUTHORITY_KEY)
+        child_chain.submit_block(block.encode().hex())
+        block = child_chain.blocks[blknum]
+        txindex = size // 2
+
+        row = [
+            timeit(lambda: [rlp.encode(block).hex() for _ in range(REQUESTS)]),
+            timeit(lambda: [child_chain.get_block(blknum) for _ in range(REQUESTS)]),
+            timeit(lambda: [rlp.encode(block.transaction_set[txindex]).hex() for _ in range(REQUESTS)]),
+            timeit(lambda: [child_chain.get_transaction(blknum, txindex) for _ in range(REQUESTS)]),
+        ]
+        print('{:>14} {:>16.1f} {:>16.1f} {:>16.1f} {:>16.1f}'.format(
+            size, *[elapsed / REQUESTS * 1e6 for elapsed in row]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Throughput of each installed keccak backend.
+
+Single calls are timed on 64-byte input, the size of a merkle node; a
+full depth-16 level of nodes is hashed both one call at a time and
+with the backend's `keccak_many`; and single calls are timed on a few
+larger inputs, like encoded transactions.
+
+Usage: python benchmarks/keccak.py
+"""
+import os
+from common import timeit
+from plasma.utils.keccak import available_backends, get_backend
+
+ROUNDS = 20000
+LEVEL = 65536
+LARGE_SIZES = [256, 4096]
+
+
+def hash_each(keccak, items):
+    return [keccak(item) for item in items]
+
+
+def main():
+    print('selected backend: {}'.format(get_backend()[0]))
+    node = os.urandom(64)
+    level = [os.urandom(64) for _ in range(LEVEL)]
+    large = {size: os.urandom(size) for size in LARGE_SIZES}
+
+    header = ['backend', '64B us', 'level ms', 'many ms'] + ['{}B us'.format(size) for size in LARGE_SIZES]
+    print(('{:>14}' * len(header)).format(*header))
+    for name, (keccak, keccak_many) in sorted(available_backends().items()):
+        row = [name]
+        row.append(timeit(lambda: [keccak(node) for _ in range(ROUNDS)], repeat=3) / ROUNDS * 1e6)
+        row.append(timeit(lambda: hash_each(keccak, level), repeat=3) * 1000)
+        row.append(timeit(lambda: keccak_many(level), repeat=3) * 1000)
+        for size in LARGE_SIZES:
+            row.append(timeit(lambda: [keccak(large[size]) for _ in range(ROUNDS)], repeat=3) / ROUNDS * 1e6)
+        print(('{:>14}' + '{:>14.2f}' * (len(row) - 1)).format(*row))
+
+
+if __name__ == '__main__':
+    main()
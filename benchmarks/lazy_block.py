@@ -0,0 +1,38 @@
+"""Reading one transaction, the hash and the merkle root of a full block.
+
+`rlp.decode(..., Block)` builds every `Transaction` up front, while
+`LazyBlock` records where each transaction starts and decodes only the
+one asked for. Hash and root are taken from the encoded bytes.
+
+Usage: python benchmarks/lazy_block.py [num_transactions]
+"""
+import sys
+import rlp
+from common import AUTHORITY_KEY, make_transactions, timeit
+from plasma.child_chain.block import Block
+from plasma.child_chain.lazy_block import LazyBlock
+
+
+def main(num_transactions):
+    block = Block()
+    for tx in make_transactions(num_transactions, key=AUTHORITY_KEY):
+        block.add_transaction(tx)
+    encoded_block = rlp.encode(block)
+    txindex = num_transactions // 2
+
+    rows = [
+        ('one transaction', lambda: rlp.decode(encoded_block, Block).transaction_set[txindex],
+         lambda: LazyBlock(encoded_block).transaction_set[txindex]),
+        ('block hash', lambda: rlp.decode(encoded_block, Block).hash,
+         lambda: LazyBlock(encoded_block).hash),
+        ('merkle root', lambda: rlp.decode(encoded_block, Block).root,
+         lambda: LazyBlock(encoded_block).root),
+    ]
+
+    print('{:>16} {:>14} {:>14}'.format('', 'decode ms', 'lazy ms'))
+    for name, decoded, lazy in rows:
+        print('{:>16} {:>14.1f} {:>14.1f}'.format(name, timeit(decoded) * 1000, timeit(lazy) * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 65536)
@@ -0,0 +1,46 @@
+"""Cost of repeated hash, merkle_hash and sender lookups on a full block.
+
+Simulates what a 65,536-transaction block goes through on its way to
+the root chain: every transaction is validated (hash and sender), looked
+up by hash and then merklized twice, once for the block built by the
+operator and once for the block it signs and submits. The unmemoized
+column drops the memoized values before each access, which is what
+every access cost before they were memoized.
+
+Usage: python benchmarks/memoization.py [num_transactions]
+"""
+import sys
+from common import AUTHORITY_KEY, make_transactions, timeit
+from plasma.child_chain.block import Block
+
+
+def main(num_transactions):
+    transactions = make_transactions(num_transactions, key=AUTHORITY_KEY)
+    block = Block(transactions)
+
+    def lifecycle(forget):
+        for tx in transactions:
+            forget(tx)
+            tx.sender1
+            forget(tx)
+            tx.hash
+        for _ in range(2):
+            for tx in transactions:
+                forget(tx)
+            block.merklize_transaction_set()
+
+    elapsed_unmemoized = timeit(lambda: lifecycle(lambda tx: tx.forget('blknum1')))
+    for tx in transactions:
+        tx.forget('blknum1')
+    elapsed_memoized = timeit(lambda: lifecycle(lambda tx: None))
+    # Every value is memoized by now, leaving only the merkle tree builds
+    elapsed_warm = timeit(lambda: lifecycle(lambda tx: None))
+
+    print('{:>16} {:>12}'.format('', 'seconds'))
+    print('{:>16} {:>12.3f}'.format('unmemoized', elapsed_unmemoized))
+    print('{:>16} {:>12.3f}'.format('memoized', elapsed_memoized))
+    print('{:>16} {:>12.3f}'.format('memoized, warm', elapsed_warm))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 65536)
@@ -0,0 +1,58 @@
+"""Mempool throughput with hundreds of thousands of pending transactions.
+
+Times adding transactions with random fees, replacing a tenth of them
+with higher-fee conflicting transactions, and pulling full blocks out
+in fee order.
+
+Usage: python benchmarks/mempool.py [num_pending]
+"""
+import random
+import sys
+from common import make_transactions, timeit
+from plasma.child_chain.mempool import Mempool
+
+BLOCK_SIZE = 65536
+
+
+def make_pending(count):
+    # make_transactions spends txindex 0..65535 of a single block, so spread
+    # the inputs over several blocks to keep them distinct
+    transactions = []
+    for blknum, start in enumerate(range(0, count, BLOCK_SIZE), 1):
+        transactions.extend(make_transactions(min(BLOCK_SIZE, count - start), blknum=blknum))
+    return transactions
+
+
+def main(num_pending):
+    rng = random.Random(0)
+    transactions = make_pending(num_pending)
+    fees = [rng.randrange(1, 1000) for _ in transactions]
+    # Same inputs as the first tenth of the transactions, with other outputs
+    replacements = make_pending(num_pending // 10)
+    for tx in replacements:
+        tx.amount1 += 1
+    mempool = Mempool(max_size=num_pending)
+
+    def add():
+        for tx, fee in zip(transactions, fees):
+            mempool.add(tx, fee)
+
+    def replace():
+        for tx, fee in zip(replacements, fees):
+            mempool.add(tx, fee + 1)
+
+    def assemble():
+        while len(mempool):
+            for _ in range(min(BLOCK_SIZE, len(mempool))):
+                mempool.pop_best()
+
+    print('{:>10} {:>12} {:>14}'.format('step', 'seconds', 'txs / second'))
+    for name, fn, count in [('add', add, num_pending),
+                            ('replace', replace, len(replacements)),
+                            ('assemble', assemble, num_pending)]:
+        elapsed = timeit(fn)
+        print('{:>10} {:>12.3f} {:>14.0f}'.format(name, elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,38 @@
+"""Build time and memory of FixedMerkle versus CompactMerkle.
+
+Both build a depth-16 tree, the size of a child block, over pre-hashed
+leaves. Memory is what tracemalloc sees still allocated by the finished
+tree.
+
+Usage: python benchmarks/merkle.py
+"""
+import os
+import tracemalloc
+from common import timeit
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.merkle.fixed_merkle import FixedMerkle
+
+SIZES = [0, 16, 1024, 65536]
+
+
+def measure(cls, leaves):
+    tracemalloc.start()
+    tree = cls(16, leaves, hashed=True)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return current
+
+
+def main():
+    print('{:>8} {:>14} {:>14} {:>14} {:>14}'.format('leaves', 'fixed ms', 'compact ms', 'fixed MB', 'compact MB'))
+    for size in SIZES:
+        leaves = [os.urandom(32) for _ in range(size)]
+        row = [size]
+        row += [timeit(lambda: cls(16, leaves, hashed=True)) * 1000 for cls in (FixedMerkle, CompactMerkle)]
+        row += [measure(cls, leaves) / 2 ** 20 for cls in (FixedMerkle, CompactMerkle)]
+        print('{:>8} {:>14.1f} {:>14.1f} {:>14.2f} {:>14.2f}'.format(*row))
+
+
+if __name__ == '__main__':
+    main()
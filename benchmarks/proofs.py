@@ -0,0 +1,45 @@
+"""Membership proofs for every transaction of a full block.
+
+Per-leaf proofs used to find each leaf with two linear scans of the
+65,536 leaves, which is quadratic over a block. That cost is measured
+on a sample of leaves and scaled up. Bulk proofs look leaves up in a
+map built once per tree and walk the levels once for all of them.
+
+Usage: python benchmarks/proofs.py [num_leaves] [sample]
+"""
+import os
+import sys
+from common import timeit
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.merkle.fixed_merkle import FixedMerkle
+
+
+def linear_proof(merkle, leaf):
+    # The lookup create_membership_proof used before the leaf index
+    assert leaf in merkle.leaves
+    index = merkle.leaves.index(leaf)
+    proof = b''
+    for level in range(merkle.depth):
+        proof += merkle.tree[level][index ^ 1].data
+        index = index // 2
+    return proof
+
+
+def main(num_leaves, sample):
+    leaves = [os.urandom(32) for _ in range(num_leaves)]
+    fixed_merkle = FixedMerkle(16, leaves, hashed=True)
+    compact_merkle = CompactMerkle(16, leaves, hashed=True)
+    sampled = leaves[::max(1, num_leaves // sample)]
+
+    linear = timeit(lambda: [linear_proof(fixed_merkle, leaf) for leaf in sampled]) * num_leaves / len(sampled)
+    fixed = timeit(lambda: fixed_merkle.create_membership_proofs(leaves))
+    compact = timeit(lambda: compact_merkle.create_membership_proofs(leaves))
+
+    print('{:>28} {:>12}'.format('', 'seconds'))
+    print('{:>28} {:>12.3f}'.format('linear lookups (estimated)', linear))
+    print('{:>28} {:>12.3f}'.format('FixedMerkle bulk', fixed))
+    print('{:>28} {:>12.3f}'.format('CompactMerkle bulk', compact))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 65536, int(sys.argv[2]) if len(sys.argv) > 2 else 256)
@@ -0,0 +1,89 @@
+"""Requests/sec and p99 latency of the werkzeug and asyncio RPC servers.
+
+The werkzeug server is run the way server.py used to run it: through
+werkzeug's single-threaded development server, with the dispatcher
+rebuilt on every request. The asyncio server registers its dispatcher
+once and keeps connections alive. Each client thread sends JSON-RPC
+`get_transaction` calls over its own session.
+
+Usage: python benchmarks/rpc_server.py [clients] [requests_per_client]
+"""
+import asyncio
+import sys
+import threading
+import time
+import requests
+from jsonrpc import JSONRPCResponseManager
+from werkzeug.serving import make_server
+from werkzeug.wrappers import Request, Response
+from common import AUTHORITY_KEY, make_child_chain, make_transactions
+from plasma.child_chain.async_server import AsyncServer
+from plasma.child_chain.binary_rpc import make_binary_dispatcher
+from plasma.child_chain.rpc import make_dispatcher
+
+
+def make_legacy_application(child_chain):
+    @Request.application
+    def application(request):
+        dispatcher = make_dispatcher(child_chain)
+        response = JSONRPCResponseManager.handle(request.data, dispatcher)
+        return Response(response.json, mimetype='application/json')
+    return application
+
+
+def start_werkzeug(child_chain):
+    server = make_server('127.0.0.1', 0, make_legacy_application(child_chain))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_port, server.shutdown
+
+
+def start_asyncio(child_chain):
+    server = AsyncServer(make_dispatcher(child_chain), make_binary_dispatcher(child_chain))
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(server.start('127.0.0.1', 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return listener.sockets[0].getsockname()[1], lambda: loop.call_soon_threadsafe(loop.stop)
+
+
+def load(port, blknum, clients, requests_per_client):
+    url = 'http://127.0.0.1:{}'.format(port)
+    latencies = []
+
+    def client():
+        session = requests.Session()
+        for i in range(requests_per_client):
+            payload = {'method': 'get_transaction', 'params': [blknum, i % 64], 'jsonrpc': '2.0', 'id': i}
+            start = time.perf_counter()
+            assert 'result' in session.post(url, json=payload).json()
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return len(latencies) / elapsed, latencies[int(len(latencies) * 0.99)] * 1000
+
+
+def main(clients, requests_per_client):
+    child_chain = make_child_chain()
+    blknum = child_chain.current_block_number
+    block = child_chain.current_block
+    for tx in make_transactions(64):
+        block.add_transaction(tx)
+    block.sign(AUTHORITY_KEY)
+    child_chain.submit_block(block.encode().hex())
+
+    print('{:>10} {:>12} {:>12}'.format('server', 'req/s', 'p99 ms'))
+    for name, start_server in [('werkzeug', start_werkzeug), ('asyncio', start_asyncio)]:
+        port, stop = start_server(child_chain)
+        print('{:>10} {:>12.0f} {:>12.1f}'.format(name, *load(port, blknum, clients, requests_per_client)))
+        stop()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 16, int(sys.argv[2]) if len(sys.argv) > 2 else 200)
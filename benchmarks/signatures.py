@@ -0,0 +1,34 @@
+"""Signature recovery throughput with a growing number of worker processes.
+
+Compares recovering transaction signers on the calling thread with
+SignaturePool at 1, 2, 4, ... workers up to the number of CPUs.
+
+Usage: python benchmarks/signatures.py [num_transactions]
+"""
+import os
+import sys
+import rlp
+from common import AUTHORITY_KEY, make_transactions, timeit
+from plasma.child_chain.signature_pool import SignaturePool, recover_senders
+
+
+def main(num_transactions):
+    encoded_txs = [rlp.encode(tx) for tx in make_transactions(num_transactions, key=AUTHORITY_KEY)]
+
+    print('{:>10} {:>12} {:>14}'.format('workers', 'seconds', 'txs / second'))
+    elapsed = timeit(lambda: recover_senders(encoded_txs))
+    print('{:>10} {:>12.3f} {:>14.0f}'.format('inline', elapsed, num_transactions / elapsed))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        signature_pool = SignaturePool(workers)
+        # Start the worker processes before timing
+        signature_pool.recover(encoded_txs[:workers])
+        elapsed = timeit(lambda: signature_pool.recover(encoded_txs))
+        signature_pool.close()
+        print('{:>10} {:>12.3f} {:>14.0f}'.format(workers, elapsed, num_transactions / elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
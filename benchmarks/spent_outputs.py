@@ -0,0 +1,56 @@
+"""Memory needed to answer "is this output spent?" per million outputs.
+
+Compares keeping every decoded Transaction in memory (the old layout,
+where spend state lived on the Transaction objects) with SpentOutputs
+bitmaps.
+
+Usage: python benchmarks/spent_outputs.py [num_outputs]
+"""
+import sys
+import tracemalloc
+from common import make_transactions
+from plasma.child_chain.block import Block
+from plasma.child_chain.spent_outputs import SpentOutputs
+
+TXS_PER_BLOCK = 65536
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def build_transactions(num_txs):
+    blocks = {}
+    for start in range(0, num_txs, TXS_PER_BLOCK):
+        blocks[start] = Block(make_transactions(min(TXS_PER_BLOCK, num_txs - start)))
+    return blocks
+
+
+def build_bitmaps(num_txs):
+    spent_outputs = SpentOutputs()
+    for i in range(num_txs):
+        blknum, txindex = divmod(i, TXS_PER_BLOCK)
+        spent_outputs.mark_spent(blknum, txindex, 0)
+        spent_outputs.mark_spent(blknum, txindex, 1)
+    return spent_outputs
+
+
+def main(num_outputs):
+    num_txs = num_outputs // 2
+    per_million = 1000000 / num_outputs
+
+    transactions_bytes, _ = measure(lambda: build_transactions(num_txs))
+    bitmaps_bytes, spent_outputs = measure(lambda: build_bitmaps(num_txs))
+
+    print('{:>28} {:>16}'.format('layout', 'MB / 1M outputs'))
+    print('{:>28} {:>16.2f}'.format('Transaction objects', transactions_bytes * per_million / 2 ** 20))
+    print('{:>28} {:>16.2f}'.format('SpentOutputs (traced)', bitmaps_bytes * per_million / 2 ** 20))
+    print('{:>28} {:>16.2f}'.format('SpentOutputs (bitmap only)', spent_outputs.nbytes() * per_million / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
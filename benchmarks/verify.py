@@ -0,0 +1,31 @@
+"""Verifying every membership proof of a full block.
+
+Compares calling `check_membership` once per proof, which hashes all
+16 levels each time, with `verify_many`, which stops hashing at the
+first node an earlier proof already proved.
+
+Usage: python benchmarks/verify.py [num_leaves]
+"""
+import os
+import sys
+from common import timeit
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.merkle.verify import verify_many
+
+
+def main(num_leaves):
+    leaves = [os.urandom(32) for _ in range(num_leaves)]
+    merkle = CompactMerkle(16, leaves, hashed=True)
+    items = list(zip(leaves, range(num_leaves), merkle.create_membership_proofs(leaves)))
+
+    loop = timeit(lambda: [merkle.check_membership(*item) for item in items])
+    batch = timeit(lambda: verify_many(merkle.root, items, hashed=True))
+    assert all(verify_many(merkle.root, items, hashed=True))
+
+    print('{:>20} {:>12} {:>12}'.format('', 'seconds', 'us/proof'))
+    print('{:>20} {:>12.3f} {:>12.1f}'.format('check_membership', loop, loop / num_leaves * 1e6))
+    print('{:>20} {:>12.3f} {:>12.1f}'.format('verify_many', batch, batch / num_leaves * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 65536)
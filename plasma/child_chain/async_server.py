@@ -0,0 +1,184 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from jsonrpc import JSONRPCResponseManager
+from .binary_rpc import BINARY_MIMETYPE, BINARY_PATH, dispatch_binary
+
+JSON_MIMETYPE = 'application/json'
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status):
+        super(HTTPError, self).__init__(status.phrase)
+        self.status = status
+
+
+class AsyncServer(object):
+    """HTTP/1.1 server for the JSON-RPC and binary endpoints, built on asyncio.
+
+    The event loop only parses requests and writes responses. Handlers,
+    including JSON parsing and everything the child chain does for a call
+    such as decoding, signature recovery and merkle building, run on a
+    pool of worker threads. Connections are kept alive between requests.
+
+    Args:
+        dispatcher (Dispatcher): JSON-RPC methods from `make_dispatcher`.
+        binary_dispatcher (dict): Binary methods from `make_binary_dispatcher`.
+        workers (int): Number of threads handlers run on.
+        max_connections (int): Connections accepted beyond this are answered
+            with 503 and closed.
+        max_body_size (int): Requests with a larger body are answered with 413.
+        keepalive_timeout (float): Seconds an idle connection is kept open
+            waiting for the head of the next request.
+        body_timeout (float): Seconds a request's body may take to arrive
+            before the request is answered with 408.
+    """
+
+    def __init__(self, dispatcher, binary_dispatcher, workers=8, max_connections=1024,
+                 max_body_size=2 ** 26, keepalive_timeout=15, body_timeout=60):
+        self.dispatcher = dispatcher
+        self.binary_dispatcher = binary_dispatcher
+        self.max_connections = max_connections
+        self.max_body_size = max_body_size
+        self.keepalive_timeout = keepalive_timeout
+        self.body_timeout = body_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.connections = 0
+
+    async def start(self, host, port):
+        """Starts listening.
+
+        Returns:
+            Server: The asyncio server.
+        """
+
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def serve(self, host, port):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    def run(self, host, port):
+        """Serves until the process is stopped.
+        """
+
+        asyncio.run(self.serve(host, port))
+
+    async def handle_connection(self, reader, writer):
+        self.connections += 1
+        try:
+            if self.connections > self.max_connections:
+                self.write_response(writer, HTTPStatus.SERVICE_UNAVAILABLE, b'', 'text/plain', False)
+                await writer.drain()
+                return
+
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await self.read_request(reader)
+                except HTTPError as e:
+                    self.write_response(writer, e.status, str(e).encode(), 'text/plain', False)
+                    await writer.drain()
+                    return
+                if request is None:
+                    return
+
+                version, headers, path, body = request
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+                try:
+                    status, content, content_type = await self.dispatch(path, body)
+                except Exception as e:
+                    self.write_response(writer, HTTPStatus.INTERNAL_SERVER_ERROR, str(e).encode(), 'text/plain', False)
+                    await writer.drain()
+                    return
+                self.write_response(writer, status, content, content_type, keep_alive)
+                await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def read_request(self, reader):
+        """Reads one request from a connection.
+
+        Returns:
+            (str, dict, str, bytes): HTTP version, lower-cased headers, path
+                and body, or None if the client closed the connection.
+
+        Raises:
+            HTTPError: The request can't be served.
+            asyncio.TimeoutError: The connection was idle for `keepalive_timeout`.
+        """
+
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.keepalive_timeout)
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise
+        except asyncio.LimitOverrunError:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, path, version = lines[0].split(' ')
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST)
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+        if method != 'POST':
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+        if 'transfer-encoding' in headers:
+            raise HTTPError(HTTPStatus.LENGTH_REQUIRED)
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST)
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST)
+        if length > self.max_body_size:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length), self.body_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(HTTPStatus.REQUEST_TIMEOUT)
+        return version, headers, path, body
+
+    async def dispatch(self, path, body):
+        """Runs a request's handler on the worker threads.
+
+        Returns:
+            (HTTPStatus, bytes, str): Status, body and content type of the response.
+        """
+
+        loop = asyncio.get_running_loop()
+        if path.startswith(BINARY_PATH):
+            status, content = await loop.run_in_executor(
+                self.executor, dispatch_binary, self.binary_dispatcher, path[len(BINARY_PATH):], body)
+            return HTTPStatus(status), content, BINARY_MIMETYPE
+
+        content = await loop.run_in_executor(self.executor, self.handle_json, body)
+        return HTTPStatus.OK, content, JSON_MIMETYPE
+
+    def handle_json(self, body):
+        # Invalid UTF-8 gets a JSON-RPC parse error rather than failing the connection
+        response = JSONRPCResponseManager.handle(body.decode('utf-8', 'replace'), self.dispatcher)
+        # Notifications don't get a response
+        return response.json.encode() if response is not None else b''
+
+    @staticmethod
+    def write_response(writer, status, content, content_type, keep_alive):
+        head = 'HTTP/1.1 {} {}\r\nContent-Type: {}\r\nContent-Length: {}\r\nConnection: {}\r\n\r\n'.format(
+            status.value, status.phrase, content_type, len(content), 'keep-alive' if keep_alive else 'close')
+        writer.write(head.encode('latin-1'))
+        writer.write(content)
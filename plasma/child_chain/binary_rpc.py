@@ -0,0 +1,86 @@
+import rlp
+from rlp.sedes import big_endian_int, CountableList
+from werkzeug.wrappers import Response
+
+# Requests to BINARY_PATH + method take and return raw RLP instead of hex in JSON
+BINARY_PATH = '/binary/'
+BINARY_MIMETYPE = 'application/octet-stream'
+
+
+def decode_args(body):
+    return rlp.decode(body, CountableList(big_endian_int))
+
+
+def make_binary_dispatcher(child_chain):
+    """Maps each method served over the binary endpoint to its handler.
+
+    A handler takes the request body and returns the response body. Block
+    and transaction numbers are sent as an RLP list of integers, and
+    transactions and blocks as their RLP encoding.
+
+    Args:
+        child_chain (ChildChain): Child chain to serve.
+
+    Returns:
+        dict: Map of method name to handler.
+    """
+
+    def apply_transaction(body):
+        child_chain.apply_encoded_transaction(body)
+        return b''
+
+    def get_block(body):
+        return child_chain.get_encoded_block(*decode_args(body))
+
+    def get_transaction(body):
+        return child_chain.get_encoded_transaction(*decode_args(body))
+
+    def get_block_range(body):
+        # Each transaction is a complete RLP item, so they're just concatenated
+        return b''.join(child_chain.get_encoded_block_range(*decode_args(body)))
+
+    return {
+        'apply_transaction': apply_transaction,
+        'get_block': get_block,
+        'get_block_range': get_block_range,
+        'get_transaction': get_transaction,
+    }
+
+
+def dispatch_binary(binary_dispatcher, method, body):
+    """Runs a binary method.
+
+    Args:
+        binary_dispatcher (dict): Handlers from `make_binary_dispatcher`.
+        method (str): Name of the method.
+        body (bytes): Request body.
+
+    Returns:
+        (int, bytes): HTTP status and response body. Errors have the
+            error message as their body.
+    """
+
+    if method not in binary_dispatcher:
+        return 404, 'method {} not found'.format(method).encode()
+    try:
+        return 200, binary_dispatcher[method](body)
+    except Exception as e:
+        return 500, '{}: {}'.format(type(e).__name__, e).encode()
+
+
+def handle_binary_request(binary_dispatcher, request):
+    """Serves a werkzeug request to the binary endpoint.
+
+    Every response, including errors, is sent as `BINARY_MIMETYPE` so
+    clients can tell the endpoint is supported.
+
+    Args:
+        binary_dispatcher (dict): Handlers from `make_binary_dispatcher`.
+        request (Request): The HTTP request.
+
+    Returns:
+        Response: The HTTP response.
+    """
+
+    status, body = dispatch_binary(binary_dispatcher, request.path[len(BINARY_PATH):], request.get_data())
+    return Response(body, status=status, mimetype=BINARY_MIMETYPE)
@@ -1,7 +1,9 @@
 import rlp
+from rlp.codec import length_prefix
 from rlp.sedes import binary, CountableList
-from ethereum import utils
-from plasma.utils.merkle.fixed_merkle import FixedMerkle
+from plasma.utils.keccak import keccak
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.merkle.incremental_merkle import IncrementalMerkle
 from plasma.utils.utils import sign, get_sender
 from plasma.child_chain.transaction import Transaction
 
@@ -13,25 +15,94 @@ class Block(rlp.Serializable):
         ('sig', binary),
     ]
 
-    def __init__(self, transaction_set=[], sig=b'\x00' * 65):
-        self.transaction_set = transaction_set
+    def __init__(self, transaction_set=None, sig=b'\x00' * 65):
+        # Avoid sharing one default list between every open block
+        self.transaction_set = transaction_set if transaction_set is not None else []
         self.sig = sig
         self.merkle = None
+        if transaction_set is None:
+            # An open block, so keep its tree up to date from the start
+            self.__dict__['_tree'] = IncrementalMerkle(16, hashed=True)
+
+    def __setattr__(self, attr, value):
+        super(Block, self).__setattr__(attr, value)
+        if attr == 'transaction_set':
+            self.forget()
+            self.__dict__.pop('_tree', None)
+        elif attr == 'sig':
+            self.__dict__.pop('_sender', None)
+
+    def forget(self):
+        """Drops the memoized hash and sender.
+        """
+
+        self.__dict__.pop('_hash', None)
+        self.__dict__.pop('_sender', None)
+
+    def make_mutable(self):
+        # The transaction list can be changed in place from here on
+        super(Block, self).make_mutable()
+        self.forget()
+        self.__dict__.pop('_tree', None)
+
+    def add_transaction(self, tx):
+        self.transaction_set.append(tx)
+        self.forget()
+        # Encode the transaction now so hashing the block at seal time is cheap
+        tx.encoded
+        tree = self.__dict__.get('_tree')
+        if tree is not None:
+            tree.add(tx.merkle_hash)
+
+    @property
+    def root(self):
+        """Merkle root of the transaction set.
+
+        The tree is kept up to date as transactions are added, so the
+        root of an open block costs O(depth) hashes.
+        """
+
+        tree = self.__dict__.get('_tree')
+        if tree is None:
+            hashed_transaction_set = [transaction.merkle_hash for transaction in self.transaction_set]
+            tree = self.__dict__['_tree'] = IncrementalMerkle(16, hashed_transaction_set, hashed=True)
+        return tree.root
+
+    def encode_transaction_set(self):
+        # Same as encoding the transaction set with its sedes, but reuses each transaction's encoding
+        encoded_transaction_set = b''.join(transaction.encoded for transaction in self.transaction_set)
+        return length_prefix(len(encoded_transaction_set), 0xc0) + encoded_transaction_set
+
+    def encode(self):
+        """Returns the RLP encoding of the block, the same as `rlp.encode(block)`.
+        """
+
+        encoded_fields = self.encode_transaction_set() + rlp.encode(self.sig)
+        return length_prefix(len(encoded_fields), 0xc0) + encoded_fields
 
     @property
     def hash(self):
-        return utils.sha3(rlp.encode(self, UnsignedBlock))
+        block_hash = self.__dict__.get('_hash')
+        if block_hash is None:
+            # Same as encoding with UnsignedBlock
+            encoded_transaction_set = self.encode_transaction_set()
+            encoded_block = length_prefix(len(encoded_transaction_set), 0xc0) + encoded_transaction_set
+            block_hash = self.__dict__['_hash'] = keccak(encoded_block)
+        return block_hash
 
     def sign(self, key):
         self.sig = sign(self.hash, key)
 
     @property
     def sender(self):
-        return get_sender(self.hash, self.sig)
+        sender = self.__dict__.get('_sender')
+        if sender is None:
+            sender = self.__dict__['_sender'] = get_sender(self.hash, self.sig)
+        return sender
 
     def merklize_transaction_set(self):
         hashed_transaction_set = [transaction.merkle_hash for transaction in self.transaction_set]
-        self.merkle = FixedMerkle(16, hashed_transaction_set, hashed=True)
+        self.merkle = CompactMerkle(16, hashed_transaction_set, hashed=True)
         return self.merkle.root
 
 
@@ -0,0 +1,228 @@
+import zlib
+import plyvel
+import rlp
+from plasma.utils.cache import LRUCache
+from .block import Block
+
+
+class BlockStore(object):
+    """Storage engine for child chain blocks.
+
+    Stores behave like a dict keyed by block number, so `ChildChain`
+    can keep using `self.blocks[blknum]`. Iterating a store yields
+    block numbers in ascending order.
+    """
+
+    def __getitem__(self, blknum):
+        raise NotImplementedError
+
+    def __setitem__(self, blknum, block):
+        raise NotImplementedError
+
+    def __contains__(self, blknum):
+        raise NotImplementedError
+
+    def __iter__(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def archive(self, blknum):
+        """Moves a block whose outputs are all spent to compressed cold storage.
+
+        Archived blocks can still be read; they're reloaded through an LRU cache.
+
+        Args:
+            blknum (int): Number of the block to archive.
+        """
+
+        pass
+
+    def stats(self):
+        """Returns block counts and sizes per storage tier, and cache counters.
+
+        Returns:
+            dict: Storage statistics.
+        """
+
+        return {}
+
+    def put_spent(self, blknum, bitmap):
+        """Persists the spent-output bitmap of a block.
+
+        Args:
+            blknum (int): Number of the block.
+            bitmap (bytes): Bitmap as kept by `SpentOutputs`.
+        """
+
+        pass
+
+    def spent_bitmaps(self):
+        """Yields every persisted spent-output bitmap.
+
+        Yields:
+            (int, bytes): Block number and bitmap.
+        """
+
+        return iter(())
+
+    def close(self):
+        """Releases any resources held by the store.
+        """
+
+        pass
+
+
+class MemoryBlockStore(BlockStore):
+    """Keeps blocks in process memory. Nothing survives a restart.
+
+    Live blocks are kept decoded. Archived blocks are kept as compressed
+    RLP and decoded on demand through an LRU cache.
+
+    Args:
+        cache_size (int): Number of decoded archived blocks kept in memory.
+    """
+
+    def __init__(self, cache_size=1024):
+        self.blocks = {}
+        self.archived = {}
+        self.archived_bytes = 0
+        self.cache = LRUCache(cache_size)
+
+    def __getitem__(self, blknum):
+        block = self.blocks.get(blknum)
+        if block is not None:
+            return block
+
+        block = self.cache.get(blknum)
+        if block is not None:
+            return block
+
+        block = rlp.decode(zlib.decompress(self.archived[blknum]), Block)
+        self.cache.put(blknum, block)
+        return block
+
+    def __setitem__(self, blknum, block):
+        self.blocks[blknum] = block
+
+    def __contains__(self, blknum):
+        return blknum in self.blocks or blknum in self.archived
+
+    def __iter__(self):
+        return iter(sorted(list(self.blocks) + list(self.archived)))
+
+    def __len__(self):
+        return len(self.blocks) + len(self.archived)
+
+    def archive(self, blknum):
+        block = self.blocks.get(blknum)
+        if block is None:
+            return
+        encoded_block = rlp.encode(block, Block)
+        # Readers don't lock, so the block is archived before it leaves the hot tier
+        self.archived[blknum] = zlib.compress(encoded_block)
+        self.archived_bytes += len(encoded_block)
+        del self.blocks[blknum]
+
+    def stats(self):
+        return {
+            'hot': {
+                'blocks': len(self.blocks),
+                'transactions': sum(len(block.transaction_set) for block in self.blocks.values()),
+            },
+            'cold': {
+                'blocks': len(self.archived),
+                'encoded_bytes': self.archived_bytes,
+                'compressed_bytes': sum(len(data) for data in self.archived.values()),
+            },
+            'cache': self.cache.stats(),
+        }
+
+
+class LevelDBBlockStore(BlockStore):
+    """Writes blocks through to LevelDB and reads them through an LRU cache.
+
+    Blocks are stored RLP encoded under their big-endian block number, so
+    LevelDB's key ordering doubles as the on-disk blknum index. Archived
+    blocks are compressed and moved under a separate prefix.
+
+    Args:
+        path (str): Directory of the LevelDB database.
+        cache_size (int): Number of decoded blocks kept in memory.
+    """
+
+    BLOCK_PREFIX = b'block:'
+    ARCHIVE_PREFIX = b'archive:'
+    SPENT_PREFIX = b'spent:'
+
+    def __init__(self, path, cache_size=1024):
+        self.db = plyvel.DB(path, create_if_missing=True)
+        self.cache = LRUCache(cache_size)
+
+    @staticmethod
+    def _key(prefix, blknum):
+        return prefix + blknum.to_bytes(8, 'big')
+
+    def __getitem__(self, blknum):
+        block = self.cache.get(blknum)
+        if block is not None:
+            return block
+
+        encoded_block = self.db.get(self._key(self.BLOCK_PREFIX, blknum))
+        if encoded_block is None:
+            archived_block = self.db.get(self._key(self.ARCHIVE_PREFIX, blknum))
+            if archived_block is None:
+                raise KeyError(blknum)
+            encoded_block = zlib.decompress(archived_block)
+
+        block = rlp.decode(encoded_block, Block)
+        self.cache.put(blknum, block)
+        return block
+
+    def __setitem__(self, blknum, block):
+        self.db.put(self._key(self.BLOCK_PREFIX, blknum), rlp.encode(block, Block), sync=True)
+        self.cache.put(blknum, block)
+
+    def __contains__(self, blknum):
+        if blknum in self.cache:
+            return True
+        return any(self.db.get(self._key(prefix, blknum)) is not None
+                   for prefix in (self.BLOCK_PREFIX, self.ARCHIVE_PREFIX))
+
+    def _blknums(self, prefix):
+        for key in self.db.iterator(prefix=prefix, include_value=False):
+            yield int.from_bytes(key[len(prefix):], 'big')
+
+    def __iter__(self):
+        return iter(sorted(list(self._blknums(self.BLOCK_PREFIX)) + list(self._blknums(self.ARCHIVE_PREFIX))))
+
+    def archive(self, blknum):
+        key = self._key(self.BLOCK_PREFIX, blknum)
+        encoded_block = self.db.get(key)
+        if encoded_block is None:
+            return
+        with self.db.write_batch() as batch:
+            batch.put(self._key(self.ARCHIVE_PREFIX, blknum), zlib.compress(encoded_block))
+            batch.delete(key)
+        self.cache.pop(blknum)
+
+    def stats(self):
+        tiers = {}
+        for tier, prefix in [('hot', self.BLOCK_PREFIX), ('cold', self.ARCHIVE_PREFIX)]:
+            tiers[tier] = {
+                'blocks': sum(1 for _ in self._blknums(prefix)),
+                'stored_bytes': self.db.approximate_size(prefix, prefix + b'\xff'),
+            }
+        tiers['cache'] = self.cache.stats()
+        return tiers
+
+    def put_spent(self, blknum, bitmap):
+        self.db.put(self._key(self.SPENT_PREFIX, blknum), bytes(bitmap))
+
+    def spent_bitmaps(self):
+        for key, bitmap in self.db.iterator(prefix=self.SPENT_PREFIX):
+            yield int.from_bytes(key[len(self.SPENT_PREFIX):], 'big'), bitmap
+
+    def close(self):
+        self.db.close()
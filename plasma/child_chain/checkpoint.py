@@ -0,0 +1,157 @@
+import os
+from itertools import islice
+import rlp
+from rlp.sedes import big_endian_int, binary, CountableList, List
+from plasma.utils.utils import pack_utxo_pos
+
+
+class Checkpointer(object):
+    """Writes periodic checkpoints of ChildChain's derived state.
+
+    A checkpoint holds the blocks it covers, the transaction index, the
+    unspent outputs, the current block number and the last processed root
+    chain height of each event. Most checkpoints are deltas holding only what changed
+    since the previous one; every `full_interval` checkpoints a full one
+    is written and older files are removed. Spent outputs aren't included
+    because the block store already persists them.
+
+    Args:
+        directory (str): Directory to keep checkpoint files in.
+        interval (int): Number of submitted blocks between checkpoints.
+        full_interval (int): Number of checkpoints between full checkpoints.
+    """
+
+    FULL = 0
+    DELTA = 1
+
+    sedes = List([
+        big_endian_int,
+        big_endian_int,
+        CountableList(List([binary, big_endian_int])),
+        CountableList(big_endian_int),
+        CountableList(List([binary, big_endian_int, big_endian_int])),
+        CountableList(List([binary, big_endian_int, binary, big_endian_int])),
+    ])
+
+    def __init__(self, directory, interval=100, full_interval=10):
+        self.directory = directory
+        self.interval = interval
+        self.full_interval = full_interval
+        os.makedirs(directory, exist_ok=True)
+
+        # Block numbers and tx index entries covered by written checkpoints
+        self.covered = set()
+        self.tx_count = 0
+
+        seqs = self.checkpoint_seqs()
+        self.seq = seqs[-1] if seqs else 0
+        # None until a full checkpoint has been loaded or written
+        self.checkpoints_since_full = None
+        self.blocks_since_checkpoint = 0
+
+    def path(self, seq):
+        return os.path.join(self.directory, 'checkpoint-{:010d}'.format(seq))
+
+    def checkpoint_seqs(self):
+        return sorted(int(name.split('-')[1]) for name in os.listdir(self.directory)
+                      if name.startswith('checkpoint-') and not name.endswith('.tmp'))
+
+    def load(self, child_chain):
+        """Restores child chain state from the newest full checkpoint and its deltas.
+
+        Args:
+            child_chain (ChildChain): Child chain to restore into.
+
+        Returns:
+            set: Block numbers covered by the checkpoints.
+        """
+
+        checkpoints = []
+        for seq in reversed(self.checkpoint_seqs()):
+            with open(self.path(seq), 'rb') as checkpoint_file:
+                checkpoint = rlp.decode(checkpoint_file.read(), self.sedes)
+            checkpoints.append((seq, checkpoint))
+            if checkpoint[0] == self.FULL:
+                break
+        else:
+            # No full checkpoint to start from
+            return self.covered
+
+        for seq, (kind, current_block_number, root_chain_heights, blknums, tx_positions, utxos) in reversed(checkpoints):
+            child_chain.current_block_number = max(child_chain.current_block_number, current_block_number)
+            for event_name, height in root_chain_heights:
+                event_name = event_name.decode()
+                child_chain.root_chain_heights[event_name] = max(child_chain.root_chain_heights.get(event_name, 0), height)
+            self.covered.update(blknums)
+            for tx_hash, blknum, txindex in tx_positions:
+                child_chain.tx_index.setdefault(tx_hash, (blknum, txindex))
+            for owner, utxo_pos, token, amount in utxos:
+                child_chain.utxo_index.add(owner, utxo_pos, token, amount)
+            self.checkpoints_since_full = 0 if kind == self.FULL else self.checkpoints_since_full + 1
+
+        self.tx_count = len(child_chain.tx_index)
+        return self.covered
+
+    def block_committed(self, child_chain):
+        """Counts a submitted block and writes a checkpoint once `interval` is reached.
+        """
+
+        self.blocks_since_checkpoint += 1
+        if self.blocks_since_checkpoint >= self.interval:
+            self.write(child_chain)
+
+    def write(self, child_chain):
+        """Writes a checkpoint of the child chain's current state.
+
+        Args:
+            child_chain (ChildChain): Child chain to checkpoint.
+        """
+
+        full = self.checkpoints_since_full is None or self.checkpoints_since_full + 1 >= self.full_interval
+        new_blknums = [blknum for blknum in child_chain.blocks if blknum not in self.covered]
+
+        if full:
+            blknums = list(self.covered) + new_blknums
+            tx_positions = child_chain.tx_index.items()
+            utxos = [(owner, utxo_pos, token, amount)
+                     for utxo_pos, (owner, token, amount) in child_chain.utxo_index.outputs.items()]
+        else:
+            blknums = new_blknums
+            tx_positions = islice(child_chain.tx_index.items(), self.tx_count, None)
+            utxos = []
+            for blknum in new_blknums:
+                for txindex in range(len(child_chain.blocks[blknum].transaction_set)):
+                    for oindex in range(2):
+                        utxo_pos = pack_utxo_pos(blknum, txindex, oindex)
+                        output = child_chain.utxo_index.outputs.get(utxo_pos)
+                        if output is not None:
+                            owner, token, amount = output
+                            utxos.append((owner, utxo_pos, token, amount))
+
+        checkpoint = [
+            self.FULL if full else self.DELTA,
+            child_chain.current_block_number,
+            [(event_name.encode(), height) for event_name, height in sorted(child_chain.root_chain_heights.items())],
+            blknums,
+            [(tx_hash, blknum, txindex) for tx_hash, (blknum, txindex) in tx_positions],
+            utxos,
+        ]
+
+        seq = self.seq + 1
+        path = self.path(seq)
+        with open(path + '.tmp', 'wb') as checkpoint_file:
+            checkpoint_file.write(rlp.encode(checkpoint, self.sedes))
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.rename(path + '.tmp', path)
+
+        if full:
+            for old_seq in self.checkpoint_seqs():
+                if old_seq < seq:
+                    os.remove(self.path(old_seq))
+
+        self.seq = seq
+        self.checkpoints_since_full = 0 if full else self.checkpoints_since_full + 1
+        self.covered.update(new_blknums)
+        self.tx_count = len(child_chain.tx_index)
+        self.blocks_since_checkpoint = 0
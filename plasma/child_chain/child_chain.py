@@ -1,47 +1,202 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import rlp
 from ethereum import utils
+from rlp.sedes import big_endian_int
 
-from plasma.utils.utils import unpack_utxo_pos
+from plasma.utils.cache import LRUCache
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.utils import pack_utxo_pos, sender_cache, unpack_utxo_pos
 from .block import Block
+from .block_store import MemoryBlockStore
+from .lazy_block import LazyBlock
+from .spent_outputs import SpentOutputs
 from .exceptions import (InvalidBlockMerkleException,
-                         InvalidBlockSignatureException,
-                         InvalidTxSignatureException, TxAlreadySpentException,
-                         TxAmountMismatchException)
+                         InvalidBlockSignatureException, InvalidTxInputException,
+                         InvalidTxSignatureException, MempoolFullException,
+                         TxAlreadySpentException, TxAmountMismatchException)
+from .mempool import Mempool
 from .transaction import Transaction
+from .utxo_index import UtxoIndex
+from .write_ahead_log import WriteAheadLog
 from .root_event_listener import RootEventListener
 
 ZERO_ADDRESS = b'\x00' * 20
+# Number of leaves in a child block's merkle tree
+MAX_BLOCK_SIZE = 2 ** 16
+# Block stores key blocks by 8-byte block numbers
+MAX_BLKNUM = 2 ** 64 - 1
+# Errors that reject a single transaction of a batch
+TRANSACTION_ERRORS = (rlp.RLPException, ValueError, KeyError, IndexError,
+                      InvalidTxInputException, InvalidTxSignatureException, MempoolFullException,
+                      TxAlreadySpentException, TxAmountMismatchException)
+
+
+def serialized(method):
+    """Runs a ChildChain method on the chain's writer thread.
+
+    Every change to chain state goes through one thread, in the order
+    the calls were made, so validation and the writes that depend on it
+    can't interleave. Calls made from the writer thread itself run
+    directly.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if threading.get_ident() == self.writer_ident:
+            return method(self, *args, **kwargs)
+        return self.writer.submit(method, self, *args, **kwargs).result()
+    return wrapper
 
 
 class ChildChain(object):
+    """Plasma child chain operated by a single authority.
+
+    State is changed by a single writer thread that RPC handlers and root
+    chain event handlers hand their calls to. Committed blocks are never
+    modified, so `get_block` and `get_transaction` read them without
+    going through the writer.
+    """
 
-    def __init__(self, authority, root_chain):
+    def __init__(self, authority, root_chain, block_store=None, wal=None, checkpointer=None, mempool=None,
+                 signature_pool=None, proof_cache_size=64, encoded_cache_size=256, encoded_tx_cache_size=4096):
         self.root_chain = root_chain
         self.authority = authority
-        self.blocks = {}
+        self.blocks = block_store if block_store is not None else MemoryBlockStore()
+        self.wal = wal
+        self.checkpointer = checkpointer
         self.child_block_interval = 1000
         self.current_block_number = self.child_block_interval
         self.current_block = Block()
-        self.pending_transactions = []
-
-        self.event_listener = RootEventListener(root_chain, confirmations=0)
+        self.mempool = mempool if mempool is not None else Mempool()
+        self.signature_pool = signature_pool
+        # Merkle trees of recently proven committed blocks
+        self.proof_cache = LRUCache(proof_cache_size)
+        # (encoding, hex encoding) of committed blocks, by blknum, and of their transactions, by
+        # (blknum, txindex), kept apart so reads of many transactions can't evict the blocks
+        self.encoded_block_cache = LRUCache(encoded_cache_size)
+        self.encoded_tx_cache = LRUCache(encoded_tx_cache_size)
+        self.spent_outputs = SpentOutputs()
+        # Spends that can't be lost on a restart, i.e. everything but the open block's
+        self.persisted_spent_outputs = SpentOutputs()
+        self.utxo_index = UtxoIndex()
+
+        # Map of transaction hash to (blknum, txindex) for committed blocks
+        self.tx_index = {}
+        # Map of transaction hash to txindex for the current block
+        self.pending_tx_index = {}
+
+        # Height of the last root chain event of each kind that was applied
+        self.root_chain_heights = {'Deposit': 0, 'ExitStarted': 0}
+
+        self.writer_ident = None
+        self.writer = ThreadPoolExecutor(max_workers=1, initializer=self.start_writer)
+
+        self.load_blocks()
+        if self.wal is not None:
+            self.replay_wal()
+
+        # Resume from the kind that's furthest behind so no event is skipped. A kind
+        # that was never seen is caught up from the first block
+        from_block = None
+        if any(self.root_chain_heights.values()):
+            from_block = min(self.root_chain_heights.values())
+        self.event_listener = RootEventListener(root_chain, confirmations=0, from_block=from_block)
 
         # Register event listeners
         self.event_listener.on('Deposit', self.apply_deposit)
         self.event_listener.on('ExitStarted', self.apply_exit)
 
+    def start_writer(self):
+        self.writer_ident = threading.get_ident()
+
+    def load_blocks(self):
+        """Rebuilds in-memory state from the blocks already in the block store.
+
+        State is restored from the newest checkpoint if there is one, so
+        only blocks committed after it have to be read.
+        """
+
+        for blknum, bitmap in self.blocks.spent_bitmaps():
+            self.spent_outputs.load(blknum, bitmap)
+            self.persisted_spent_outputs.load(blknum, bitmap)
+
+        covered = set()
+        if self.checkpointer is not None:
+            covered = self.checkpointer.load(self)
+
+        for blknum in self.blocks:
+            if blknum in covered:
+                continue
+            block = self.blocks[blknum]
+            for txindex, tx in enumerate(block.transaction_set):
+                self.tx_index.setdefault(tx.hash, (blknum, txindex))
+                self.utxo_index.add_transaction(blknum, txindex, tx)
+            if blknum % self.child_block_interval == 0:
+                self.current_block_number = max(self.current_block_number, blknum + self.child_block_interval)
+
+        for utxo_pos in list(self.utxo_index.outputs):
+            if self.spent_outputs.is_spent(*unpack_utxo_pos(utxo_pos)):
+                self.utxo_index.remove(utxo_pos)
+
+    def replay_wal(self):
+        """Rebuilds the mempool and the current block from the write-ahead log.
+
+        Transactions that were already assembled into the current block are
+        re-added without validation. Every other logged transaction is
+        re-validated in arrival order, and ones that are no longer valid,
+        e.g. because they were replaced or their inputs were exited, are
+        dropped again.
+        """
+
+        records = list(self.wal.records())
+
+        transactions = {}
+        for kind, payload in records:
+            if kind == WriteAheadLog.TRANSACTION:
+                tx = rlp.decode(payload, Transaction)
+                transactions[tx.hash] = tx
+
+        for kind, payload in records:
+            if kind == WriteAheadLog.ASSEMBLE:
+                self.add_transaction(transactions.pop(payload))
+            elif kind == WriteAheadLog.SPEND:
+                spend = unpack_utxo_pos(big_endian_int.deserialize(payload))
+                self.mark_utxo_spent(*spend)
+                self.persist_spent([spend])
+
+        for tx in transactions.values():
+            try:
+                self.mempool.add(tx, self.validate_tx(tx))
+            except TRANSACTION_ERRORS:
+                pass
+
+    @serialized
     def apply_exit(self, event):
+        self.root_chain_heights['ExitStarted'] = max(self.root_chain_heights['ExitStarted'], event.get('blockNumber') or 0)
         event_args = event['args']
         utxo_pos = event_args['utxoPos']
+        if self.wal is not None:
+            self.wal.wait(self.wal.append(WriteAheadLog.SPEND, big_endian_int.serialize(utxo_pos)))
         self.mark_utxo_spent(*unpack_utxo_pos(utxo_pos))
+        # The exit is already durable in the log, or replayed from the root chain without one
+        self.persist_spent([unpack_utxo_pos(utxo_pos)])
+        self.mempool.remove_spender(*unpack_utxo_pos(utxo_pos))
 
+    @serialized
     def apply_deposit(self, event):
+        self.root_chain_heights['Deposit'] = max(self.root_chain_heights['Deposit'], event.get('blockNumber') or 0)
         event_args = event['args']
 
         depositor = event_args['depositor']
         amount = event_args['amount']
         blknum = event_args['depositBlock']
 
+        # Deposits can be seen again when catching up from a checkpoint
+        if blknum in self.blocks:
+            return
+
         deposit_tx = Transaction(0, 0, 0,
                                  0, 0, 0,
                                  ZERO_ADDRESS,
@@ -50,21 +205,156 @@ class ChildChain(object):
         deposit_block = Block([deposit_tx])
 
         self.blocks[blknum] = deposit_block
+        self.cache_encoding(self.encoded_block_cache, blknum, deposit_block.encode())
+        self.tx_index.setdefault(deposit_tx.hash, (blknum, 0))
+        self.utxo_index.add_transaction(blknum, 0, deposit_tx)
 
     def apply_transaction(self, transaction):
-        tx = rlp.decode(utils.decode_hex(transaction), Transaction)
-
-        # Validate the transaction
-        self.validate_tx(tx)
-
+        self.apply_encoded_transaction(utils.decode_hex(transaction))
+
+    def apply_encoded_transaction(self, encoded_tx):
+        """Applies a transaction given as raw RLP bytes rather than hex.
+        """
+
+        tx = rlp.decode(encoded_tx, Transaction)
+
+        # A single transaction isn't worth a round trip to the signature pool
+        seq = self.accept_transaction(tx, encoded_tx)
+        if seq is not None:
+            self.wal.wait(seq)
+
+    def apply_transactions(self, transactions):
+        """Applies a batch of transactions in order.
+
+        A transaction that fails to decode or validate doesn't stop the
+        rest of the batch. Signers are recovered for the whole batch in
+        parallel, then it's validated in a single call to the writer and
+        waits for a single log sync.
+
+        Args:
+            transactions (list): RLP encoded transactions, hex encoded.
+
+        Returns:
+            list: One dict per transaction, either {'success': True} or
+                {'success': False, 'error': <exception name>, 'message': <message>}.
+        """
+
+        results = [None] * len(transactions)
+        decoded_txs = []
+        for i, transaction in enumerate(transactions):
+            try:
+                encoded_tx = utils.decode_hex(transaction)
+                decoded_txs.append((i, rlp.decode(encoded_tx, Transaction), encoded_tx, None))
+            except Exception as e:
+                # Bad input fails to decode in many ways, e.g. a TypeError for a non-string
+                # or a bare Exception from normalize_address for an empty address
+                results[i] = self.transaction_error(e)
+
+        if self.signature_pool is not None:
+            senders = self.signature_pool.recover([encoded_tx for _, _, encoded_tx, _ in decoded_txs])
+            decoded_txs = [(i, tx, encoded_tx, tx_senders)
+                           for (i, tx, encoded_tx, _), tx_senders in zip(decoded_txs, senders)]
+
+        accepted, seq = self.accept_transactions(decoded_txs)
+        for i, error in accepted:
+            results[i] = self.transaction_error(error) if error is not None else {'success': True}
+
+        if seq is not None:
+            self.wal.wait(seq)
+        return results
+
+    @staticmethod
+    def transaction_error(error):
+        return {'success': False, 'error': type(error).__name__, 'message': str(error)}
+
+    @serialized
+    def accept_transactions(self, decoded_txs):
+        """Validates decoded transactions in order and adds the valid ones to the mempool.
+
+        Returns:
+            (list, int): (index, exception or None) for every transaction, and
+                the sequence number of the last log record written, or None.
+        """
+
+        accepted = []
+        last_seq = None
+        for i, tx, encoded_tx, senders in decoded_txs:
+            try:
+                seq = self.accept_transaction(tx, encoded_tx, senders)
+            except TRANSACTION_ERRORS as e:
+                accepted.append((i, e))
+                continue
+            accepted.append((i, None))
+            last_seq = seq if seq is not None else last_seq
+        return accepted, last_seq
+
+    @serialized
+    def accept_transaction(self, tx, encoded_tx, senders=None):
+        """Validates a transaction and adds it to the mempool.
+
+        Args:
+            tx (Transaction): Decoded transaction.
+            encoded_tx (bytes): RLP encoded transaction.
+            senders (tuple): Signers recovered ahead of time, if any.
+
+        Returns:
+            int: Sequence number of the transaction's log record, or None.
+        """
+
+        fee = self.validate_tx(tx, senders)
+        self.mempool.add(tx, fee)
+
+        if self.wal is not None:
+            return self.wal.append(WriteAheadLog.TRANSACTION, encoded_tx)
+        return None
+
+    @serialized
+    def assemble_block(self):
+        """Moves the best non-conflicting pending transactions into the current block.
+
+        Transactions are pulled from the mempool by fee until the block is full.
+        """
+
+        last_seq = None
+        while len(self.current_block.transaction_set) < MAX_BLOCK_SIZE:
+            entry = self.mempool.pop_best()
+            if entry is None:
+                break
+            if self.wal is not None:
+                last_seq = self.wal.append(WriteAheadLog.ASSEMBLE, entry.tx_hash)
+            self.add_transaction(entry.tx)
+        # Nothing else waits on these records, and with no commit window nothing else fsyncs them
+        if last_seq is not None:
+            self.wal.wait(last_seq)
+
+    def add_transaction(self, tx):
         # Mark the inputs as spent
         self.mark_utxo_spent(tx.blknum1, tx.txindex1, tx.oindex1)
         self.mark_utxo_spent(tx.blknum2, tx.txindex2, tx.oindex2)
 
-        self.current_block.transaction_set.append(tx)
+        self.pending_tx_index.setdefault(tx.hash, len(self.current_block.transaction_set))
+        self.current_block.add_transaction(tx)
+
+    def validate_tx(self, tx, senders=None):
+        """Checks a transaction against the current state.
+
+        Args:
+            tx (Transaction): Transaction to validate.
+            senders (tuple): (sender1, sender2) recovered ahead of time, or None
+                to recover them here.
+
+        Returns:
+            int: Fee paid by the transaction.
+        """
 
-    def validate_tx(self, tx):
         inputs = [(tx.blknum1, tx.txindex1, tx.oindex1), (tx.blknum2, tx.txindex2, tx.oindex2)]
+        # Checked before anything is looked up, since the spent bitmaps index outputs by oindex
+        # and the block store can't look up block numbers that don't fit its keys
+        for (blknum, txindex, oindex) in inputs:
+            if blknum != 0 and (blknum > MAX_BLKNUM or txindex >= MAX_BLOCK_SIZE or oindex not in (0, 1)):
+                raise InvalidTxInputException('failed to validate tx')
+        if tx.blknum1 != 0 and inputs[0] == inputs[1]:
+            raise InvalidTxInputException('failed to validate tx')
 
         output_amount = tx.amount1 + tx.amount2
         input_amount = 0
@@ -77,14 +367,12 @@ class ChildChain(object):
             transaction = self.blocks[blknum].transaction_set[txindex]
 
             if oindex == 0:
-                valid_signature = tx.sig1 != b'\x00' * 65 and transaction.newowner1 == tx.sender1
-                spent = transaction.spent1
+                valid_signature = tx.sig1 != b'\x00' * 65 and transaction.newowner1 == (senders[0] if senders else tx.sender1)
                 input_amount += transaction.amount1
             else:
-                valid_signature = tx.sig2 != b'\x00' * 65 and transaction.newowner2 == tx.sender2
-                spent = transaction.spent2
+                valid_signature = tx.sig2 != b'\x00' * 65 and transaction.newowner2 == (senders[1] if senders else tx.sender2)
                 input_amount += transaction.amount2
-            if spent:
+            if self.spent_outputs.is_spent(blknum, txindex, oindex):
                 raise TxAlreadySpentException('failed to validate tx')
             if not valid_signature:
                 raise InvalidTxSignatureException('failed to validate tx')
@@ -92,50 +380,219 @@ class ChildChain(object):
         if input_amount < output_amount:
             raise TxAmountMismatchException('failed to validate tx')
 
+        return input_amount - output_amount
+
     def mark_utxo_spent(self, blknum, txindex, oindex):
         if blknum == 0:
             return
 
-        if oindex == 0:
-            self.blocks[blknum].transaction_set[txindex].spent1 = True
-        else:
-            self.blocks[blknum].transaction_set[txindex].spent2 = True
+        self.spent_outputs.mark_spent(blknum, txindex, oindex)
+        if self.utxo_index.remove(pack_utxo_pos(blknum, txindex, oindex)):
+            # Every output of the block is spent, so it's rarely read again
+            self.blocks.archive(blknum)
+
+    def persist_spent(self, spends):
+        """Writes spent outputs to the block store.
+
+        Spends made by the open block are kept in memory only until it's
+        committed, so a restart that loses the block doesn't leave its
+        inputs spent.
+
+        Args:
+            spends (list): (blknum, txindex, oindex) of each spent output.
+        """
+
+        blknums = set()
+        for blknum, txindex, oindex in spends:
+            if blknum == 0:
+                continue
+            self.persisted_spent_outputs.mark_spent(blknum, txindex, oindex)
+            blknums.add(blknum)
+        for blknum in sorted(blknums):
+            self.blocks.put_spent(blknum, self.persisted_spent_outputs.bitmaps[blknum])
 
     def submit_block(self, block):
-        block = rlp.decode(utils.decode_hex(block), Block)
-        if block.merklize_transaction_set() != self.current_block.merklize_transaction_set():
+        # Only the hash and signature are checked, so the transactions aren't decoded
+        block = LazyBlock(utils.decode_hex(block))
+        # Hash the submitted block before handing it to the writer
+        block.hash
+        self.commit_block(block)
+
+    @serialized
+    def commit_block(self, block):
+        # Equal hashes mean equal transaction sets, so the submitted block
+        # shares the current block's merkle root without rebuilding it
+        if block.hash != self.current_block.hash:
             raise InvalidBlockMerkleException('input block merkle mismatch with the current block')
 
         valid_signature = block.sig != b'\x00' * 65 and block.sender == bytes.fromhex(self.authority[2:])
         if not valid_signature:
             raise InvalidBlockSignatureException('failed to submit block')
 
-        self.root_chain.transact({'from': self.authority}).submitBlock(block.merkle.root)
+        self.root_chain.transact({'from': self.authority}).submitBlock(self.current_block.root)
         # TODO: iterate through block and validate transactions
         self.blocks[self.current_block_number] = self.current_block
+        spends = []
+        for tx in self.current_block.transaction_set:
+            spends += [(tx.blknum1, tx.txindex1, tx.oindex1), (tx.blknum2, tx.txindex2, tx.oindex2)]
+        self.persist_spent(spends)
+        self.cache_encoding(self.encoded_block_cache, self.current_block_number, self.current_block.encode())
+        for tx_hash, txindex in self.pending_tx_index.items():
+            self.tx_index.setdefault(tx_hash, (self.current_block_number, txindex))
+        for txindex, tx in enumerate(self.current_block.transaction_set):
+            self.utxo_index.add_transaction(self.current_block_number, txindex, tx)
+        self.pending_tx_index = {}
         self.current_block_number += self.child_block_interval
+        if self.wal is not None:
+            # Keep the transactions that are still pending
+            self.wal.truncate([(WriteAheadLog.TRANSACTION, rlp.encode(tx, Transaction)) for tx in self.mempool])
         self.current_block = Block()
+        if self.checkpointer is not None:
+            self.checkpointer.block_committed(self)
+
+    def is_spent(self, blknum, txindex, oindex):
+        return self.spent_outputs.is_spent(blknum, txindex, oindex)
+
+    @staticmethod
+    def cache_encoding(cache, key, encoded):
+        encoding = (encoded, encoded.hex())
+        cache.put(key, encoding)
+        return encoding
+
+    def get_encoding(self, cache, key, encode):
+        """Returns the cached (encoding, hex encoding) of a committed block or transaction.
+
+        Args:
+            cache (LRUCache): `encoded_block_cache` or `encoded_tx_cache`.
+            key (obj): blknum of a block, or (blknum, txindex) of a transaction.
+            encode (function): Returns the encoding on a cache miss.
+        """
+
+        encoding = cache.get(key)
+        if encoding is None:
+            encoding = self.cache_encoding(cache, key, encode())
+        return encoding
 
     def get_transaction(self, blknum, txindex):
-        return rlp.encode(self.blocks[blknum].transaction_set[txindex]).hex()
+        return self.get_encoding(self.encoded_tx_cache, (blknum, txindex),
+                                 lambda: self.blocks[blknum].transaction_set[txindex].encoded)[1]
+
+    def get_encoded_transaction(self, blknum, txindex):
+        return self.get_encoding(self.encoded_tx_cache, (blknum, txindex),
+                                 lambda: self.blocks[blknum].transaction_set[txindex].encoded)[0]
 
     def get_tx_pos(self, transaction):
         decoded_tx = rlp.decode(utils.decode_hex(transaction), Transaction)
+        return self.tx_index.get(decoded_tx.hash, (None, None))
+
+    @serialized
+    def get_utxos(self, address, start=0, count=100):
+        utxos = self.utxo_index.get_utxos(utils.normalize_address(address), start, count)
+        return [{
+            'blknum': blknum,
+            'txindex': txindex,
+            'oindex': oindex,
+            'token': '0x' + token.hex(),
+            'amount': amount,
+        } for (blknum, txindex, oindex, token, amount) in utxos]
+
+    @serialized
+    def get_balance(self, address, token=ZERO_ADDRESS):
+        return self.utxo_index.get_balance(utils.normalize_address(address), utils.normalize_address(token))
+
+    @serialized
+    def get_storage_stats(self):
+        return self.blocks.stats()
+
+    def get_cache_stats(self):
+        return {
+            'senders': sender_cache.stats(),
+            'proofs': self.proof_cache.stats(),
+            'encoded_blocks': self.encoded_block_cache.stats(),
+            'encoded_transactions': self.encoded_tx_cache.stats(),
+        }
+
+    def get_block_tree(self, blknum):
+        """Returns the merkle tree of a committed block, building it on a cache miss.
+        """
+
+        tree = self.proof_cache.get(blknum)
+        if tree is None:
+            hashed_transaction_set = [tx.merkle_hash for tx in self.blocks[blknum].transaction_set]
+            tree = CompactMerkle(16, hashed_transaction_set, hashed=True)
+            self.proof_cache.put(blknum, tree)
+        return tree
+
+    def get_proof(self, blknum, txindex):
+        tree = self.get_block_tree(blknum)
+        if not 0 <= txindex < tree.count:
+            raise IndexError('transaction index out of range')
+        return tree.create_proofs_at([txindex])[0].hex()
+
+    def get_block_root(self, blknum):
+        return self.get_block_tree(blknum).root.hex()
 
-        for blknum in self.blocks:
-            block = self.blocks[blknum]
-            for txindex in range(0, len(block.transaction_set)):
-                tx = block.transaction_set[txindex]
-                if (decoded_tx.hash == tx.hash):
-                    return blknum, txindex
+    def get_block(self, blknum):
+        return self.get_encoding(self.encoded_block_cache, blknum, lambda: self.blocks[blknum].encode())[1]
 
-        return None, None
+    def get_encoded_block(self, blknum):
+        return self.get_encoding(self.encoded_block_cache, blknum, lambda: self.blocks[blknum].encode())[0]
 
-    def get_block(self, blknum):
-        return rlp.encode(self.blocks[blknum]).hex()
+    def get_block_range(self, blknum, start=0, count=1024):
+        return [encoded_tx.hex() for encoded_tx in self.get_encoded_block_range(blknum, start, count)]
+
+    def get_encoded_block_range(self, blknum, start=0, count=1024):
+        """Returns a page of a committed block's transactions.
+
+        Large blocks can be fetched a page at a time instead of all at once.
+        A page shorter than `count` is the last one.
+
+        Args:
+            blknum (int): Number of the block.
+            start (int): Index of the first transaction to return.
+            count (int): Maximum number of transactions to return.
+
+        Returns:
+            list: RLP encoding of each transaction.
+        """
+
+        if start < 0 or count < 0:
+            raise ValueError('start and count should not be negative')
+        return [tx.encoded for tx in self.blocks[blknum].transaction_set[start:start + count]]
 
+    @serialized
     def get_current_block(self):
-        return rlp.encode(self.current_block).hex()
+        self.assemble_block()
+        return self.current_block.encode().hex()
+
+    @serialized
+    def get_current_block_since(self, blknum, txcount):
+        """Returns the transactions added to the open block since a poller last saw it.
+
+        The open block only ever grows until it's submitted, so a poller
+        that passes back the `blknum` and `txcount` of its previous poll
+        gets just the new transactions. If the block it saw has since been
+        submitted, the new open block is returned from its start.
+
+        Args:
+            blknum (int): Number of the block seen by the previous poll.
+            txcount (int): Number of its transactions seen by the previous poll.
+
+        Returns:
+            dict: Number, transaction count and merkle root of the open
+                block, and the index and hex encodings of the new transactions.
+        """
+
+        self.assemble_block()
+        transaction_set = self.current_block.transaction_set
+        start = txcount if blknum == self.current_block_number and 0 <= txcount <= len(transaction_set) else 0
+        return {
+            'blknum': self.current_block_number,
+            'txcount': len(transaction_set),
+            'root': self.current_block.root.hex(),
+            'start': start,
+            'transactions': [tx.encoded.hex() for tx in transaction_set[start:]],
+        }
 
     def get_current_block_num(self):
         return self.current_block_number
@@ -16,3 +16,15 @@ class TxAmountMismatchException(Exception):
 
 class InvalidBlockMerkleException(Exception):
     """merkle tree of a block is invalid"""
+
+
+class TxFeeTooLowException(TxAlreadySpentException):
+    """a pending tx spends the same input with an equal or higher fee"""
+
+
+class MempoolFullException(Exception):
+    """the mempool is full of txs paying an equal or higher fee"""
+
+
+class InvalidTxInputException(Exception):
+    """an input of a tx doesn't refer to an output that can be spent"""
@@ -0,0 +1,151 @@
+import rlp
+from rlp.codec import consume_length_prefix, length_prefix
+from plasma.utils.keccak import keccak, keccak_many
+from plasma.utils.merkle.incremental_merkle import IncrementalMerkle
+from plasma.utils.utils import get_sender
+from .block import Block
+from .transaction import Transaction
+
+# Fields of a transaction before its two signatures
+UNSIGNED_TX_FIELDS = 11
+
+
+def read_item(encoded, start, expected_type):
+    if start >= len(encoded):
+        raise rlp.DecodingError('missing rlp item', encoded)
+    item_type, length, payload_start = consume_length_prefix(encoded, start)
+    if item_type is not expected_type:
+        raise rlp.DecodingError('unexpected rlp item type', encoded)
+    end = payload_start + length
+    if end > len(encoded):
+        raise rlp.DecodingError('rlp item runs past the end of the data', encoded)
+    return payload_start, end
+
+
+def split_list(encoded, start, end):
+    """Returns the (start, end) span of each item of an RLP list payload.
+    """
+
+    spans = []
+    while start < end:
+        _, length, payload_start = consume_length_prefix(encoded, start)
+        spans.append((start, payload_start + length))
+        start = payload_start + length
+    if start != end:
+        raise rlp.DecodingError('rlp list items run past the end of the list', encoded)
+    return spans
+
+
+class LazyTransactionSet(object):
+    """Read-only sequence of a block's transactions, decoded on access.
+    """
+
+    def __init__(self, encoded, spans):
+        self.encoded = encoded
+        self.spans = spans
+        self.decoded = [None] * len(spans)
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        tx = self.decoded[index]
+        if tx is None:
+            tx = self.decoded[index] = rlp.decode(self.raw(index), Transaction)
+        return tx
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def raw(self, index):
+        """Returns the RLP encoding of a transaction without decoding it.
+        """
+
+        start, end = self.spans[index]
+        return self.encoded[start:end]
+
+
+class LazyBlock(object):
+    """Read-only view of an RLP encoded block.
+
+    One pass over the encoding records where each transaction starts and
+    ends; a transaction is only decoded into a `Transaction` when it's
+    accessed. The block hash, merkle hashes and root are computed straight
+    from the encoded bytes. Malformed transactions are only detected when
+    they're accessed.
+
+    Args:
+        encoded (bytes): RLP encoding of a `Block`.
+    """
+
+    def __init__(self, encoded):
+        encoded = bytes(encoded)
+        start, end = read_item(encoded, 0, list)
+        if end != len(encoded):
+            raise rlp.DecodingError('trailing bytes after the block', encoded)
+
+        set_start = start
+        payload_start, set_end = read_item(encoded, set_start, list)
+        self.transaction_set = LazyTransactionSet(encoded, split_list(encoded, payload_start, set_end))
+
+        sig_start, sig_end = read_item(encoded, set_end, str)
+        if sig_end != end:
+            raise rlp.DecodingError('unexpected fields after the block signature', encoded)
+
+        self.encoded = encoded
+        self.encoded_transaction_set = encoded[set_start:set_end]
+        self.sig = encoded[sig_start:sig_end]
+        self._hash = None
+        self._merkle_hashes = None
+
+    @property
+    def hash(self):
+        if self._hash is None:
+            # The unsigned block is a list holding just the encoded transaction set
+            self._hash = keccak(length_prefix(len(self.encoded_transaction_set), 0xc0) + self.encoded_transaction_set)
+        return self._hash
+
+    @property
+    def sender(self):
+        return get_sender(self.hash, self.sig)
+
+    @property
+    def merkle_hashes(self):
+        """Merkle leaf of each transaction, computed without decoding them.
+
+        A transaction's merkle hash is keccak(hash + sig1 + sig2), where its
+        hash is the keccak of its encoding without the signatures.
+        """
+
+        if self._merkle_hashes is None:
+            encoded = self.encoded
+            unsigned_txs = []
+            sigs = []
+            for tx_start, tx_end in self.transaction_set.spans:
+                payload_start, _ = read_item(encoded, tx_start, list)
+                fields = split_list(encoded, payload_start, tx_end)
+                if len(fields) != UNSIGNED_TX_FIELDS + 2:
+                    raise rlp.DecodingError('transaction has the wrong number of fields', encoded)
+                unsigned_end = fields[UNSIGNED_TX_FIELDS - 1][1]
+                unsigned_txs.append(length_prefix(unsigned_end - payload_start, 0xc0) + encoded[payload_start:unsigned_end])
+                sigs.append(b''.join(encoded[slice(*read_item(encoded, start, str))]
+                                     for start, _ in fields[UNSIGNED_TX_FIELDS:]))
+            tx_hashes = keccak_many(unsigned_txs)
+            self._merkle_hashes = keccak_many([tx_hash + sig for tx_hash, sig in zip(tx_hashes, sigs)])
+        return self._merkle_hashes
+
+    @property
+    def root(self):
+        return IncrementalMerkle(16, self.merkle_hashes, hashed=True).root
+
+    def decode(self):
+        """Decodes the whole block.
+
+        Returns:
+            Block: The decoded block.
+        """
+
+        return rlp.decode(self.encoded, Block)
@@ -0,0 +1,147 @@
+import heapq
+from .exceptions import MempoolFullException, TxFeeTooLowException
+
+
+class MempoolEntry(object):
+
+    def __init__(self, tx, tx_hash, fee, inputs, seq):
+        self.tx = tx
+        self.tx_hash = tx_hash
+        self.fee = fee
+        self.inputs = inputs
+        self.seq = seq
+
+
+class Mempool(object):
+    """Transactions waiting to be included in a block, ordered by fee.
+
+    A max-heap on fee gives the best transaction and a min-heap gives the
+    one to evict when the pool is full, both in O(log n). Removed entries
+    are left in the heaps and skipped when they surface. Each input maps
+    to the pending transaction spending it: a conflicting transaction
+    replaces it only if it pays a strictly higher fee.
+
+    Args:
+        max_size (int): Maximum number of pending transactions.
+    """
+
+    def __init__(self, max_size=2 ** 18):
+        self.max_size = max_size
+        self.entries = {}
+        self.spenders = {}
+        self.best = []
+        self.worst = []
+        self.seq = 0
+
+    @staticmethod
+    def get_inputs(tx):
+        inputs = [(tx.blknum1, tx.txindex1, tx.oindex1), (tx.blknum2, tx.txindex2, tx.oindex2)]
+        return [utxo for utxo in inputs if utxo[0] != 0]
+
+    def add(self, tx, fee):
+        """Adds a transaction, replacing any pending transactions it conflicts with.
+
+        Args:
+            tx (Transaction): A validated transaction.
+            fee (int): Fee paid by the transaction.
+
+        Raises:
+            TxFeeTooLowException: A conflicting transaction pays at least as much.
+            MempoolFullException: The pool is full of transactions paying at least as much.
+        """
+
+        tx_hash = tx.hash
+        inputs = self.get_inputs(tx)
+
+        conflicts = set(self.spenders[utxo] for utxo in inputs if utxo in self.spenders)
+        if tx_hash in self.entries:
+            conflicts.add(tx_hash)
+        if any(self.entries[conflict].fee >= fee for conflict in conflicts):
+            raise TxFeeTooLowException('failed to replace pending tx')
+
+        if not conflicts and len(self.entries) >= self.max_size:
+            lowest = self.peek_worst()
+            if lowest.fee >= fee:
+                raise MempoolFullException('mempool is full')
+            self.remove(lowest.tx_hash)
+
+        for conflict in conflicts:
+            self.remove(conflict)
+
+        self.seq += 1
+        entry = MempoolEntry(tx, tx_hash, fee, inputs, self.seq)
+        self.entries[tx_hash] = entry
+        for utxo in inputs:
+            self.spenders[utxo] = tx_hash
+        heapq.heappush(self.best, (-fee, entry.seq, tx_hash))
+        heapq.heappush(self.worst, (fee, -entry.seq, tx_hash))
+
+    def remove(self, tx_hash):
+        """Removes a pending transaction.
+
+        Args:
+            tx_hash (bytes): Hash of the transaction.
+
+        Returns:
+            MempoolEntry: The removed entry, or None.
+        """
+
+        entry = self.entries.pop(tx_hash, None)
+        if entry is None:
+            return None
+        for utxo in entry.inputs:
+            if self.spenders.get(utxo) == tx_hash:
+                del self.spenders[utxo]
+        self.compact()
+        return entry
+
+    def remove_spender(self, blknum, txindex, oindex):
+        """Drops the pending transaction spending an output, e.g. once it's exited.
+        """
+
+        tx_hash = self.spenders.get((blknum, txindex, oindex))
+        if tx_hash is not None:
+            self.remove(tx_hash)
+
+    def is_live(self, seq, tx_hash):
+        entry = self.entries.get(tx_hash)
+        return entry is not None and entry.seq == seq
+
+    def peek_worst(self):
+        while not self.is_live(-self.worst[0][1], self.worst[0][2]):
+            heapq.heappop(self.worst)
+        return self.entries[self.worst[0][2]]
+
+    def pop_best(self):
+        """Removes and returns the pending transaction paying the highest fee.
+
+        Ties are broken by arrival order.
+
+        Returns:
+            MempoolEntry: The best entry, or None if the pool is empty.
+        """
+
+        while self.best:
+            _, seq, tx_hash = heapq.heappop(self.best)
+            if self.is_live(seq, tx_hash):
+                return self.remove(tx_hash)
+        return None
+
+    def compact(self):
+        # Rebuild the heaps once removed entries outnumber live ones
+        if len(self.best) > 2 * len(self.entries) + 64:
+            self.best = [item for item in self.best if self.is_live(item[1], item[2])]
+            heapq.heapify(self.best)
+        if len(self.worst) > 2 * len(self.entries) + 64:
+            self.worst = [item for item in self.worst if self.is_live(-item[1], item[2])]
+            heapq.heapify(self.worst)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        """Yields pending transactions in arrival order.
+        """
+
+        for entry in sorted(self.entries.values(), key=lambda entry: entry.seq):
+            yield entry.tx
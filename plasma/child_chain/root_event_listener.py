@@ -20,12 +20,15 @@ class RootEventListener(object):
         root_chain (ConciseContract): A Web3 ConciseContract representing the root chain.
         w3 (Web3): A Web3 object.
         finality (int): Number of blocks before events should be considered final.
+        from_block (int): Root chain block to catch up from on the first pass, e.g.
+            the last height processed before a restart.
     """
 
-    def __init__(self, root_chain, w3=Web3(HTTPProvider('http://localhost:8545')), confirmations=6):
+    def __init__(self, root_chain, w3=Web3(HTTPProvider('http://localhost:8545')), confirmations=6, from_block=None):
         self.root_chain = root_chain
         self.w3 = w3
         self.confirmations = confirmations
+        self.from_block = from_block
 
         self.seen_events = {}
         self.active_events = {}
@@ -87,11 +90,17 @@ class RootEventListener(object):
             event_name (str): Name of event to watch.
         """
 
+        from_block = self.from_block
         while event_name in self.active_events:
             current_block = self.w3.eth.getBlock('latest')
 
+            window_start = current_block['number'] - (self.confirmations * 2 + 1)
+            if from_block is not None:
+                window_start = min(window_start, from_block)
+                from_block = None
+
             event_filter = self.root_chain.eventFilter(event_name, {
-                'fromBlock': current_block['number'] - (self.confirmations * 2 + 1),
+                'fromBlock': window_start,
                 'toBlock': current_block['number'] + 1 - self.confirmations
             })
 
@@ -0,0 +1,61 @@
+from jsonrpc import Dispatcher, JSONRPCResponseManager
+from werkzeug.wrappers import Request, Response
+from .binary_rpc import BINARY_PATH, handle_binary_request
+
+# ChildChain methods served over JSON-RPC
+RPC_METHODS = [
+    'submit_block',
+    'apply_transaction',
+    'apply_transactions',
+    'get_transaction',
+    'get_current_block',
+    'get_current_block_since',
+    'get_current_block_num',
+    'get_block',
+    'get_block_range',
+    'get_proof',
+    'get_block_root',
+    'get_tx_pos',
+    'get_utxos',
+    'get_balance',
+    'get_storage_stats',
+    'get_cache_stats',
+]
+
+
+def make_dispatcher(child_chain):
+    """Registers the child chain's RPC methods once, at startup.
+
+    Args:
+        child_chain (ChildChain): Child chain to serve.
+
+    Returns:
+        Dispatcher: Map of method name to bound ChildChain method.
+    """
+
+    dispatcher = Dispatcher()
+    for method in RPC_METHODS:
+        dispatcher[method] = getattr(child_chain, method)
+    return dispatcher
+
+
+def make_application(dispatcher, binary_dispatcher):
+    """Builds the WSGI application served by werkzeug.
+
+    Args:
+        dispatcher (Dispatcher): JSON-RPC methods from `make_dispatcher`.
+        binary_dispatcher (dict): Binary methods from `make_binary_dispatcher`.
+
+    Returns:
+        function: The WSGI application.
+    """
+
+    @Request.application
+    def application(request):
+        if request.path.startswith(BINARY_PATH):
+            return handle_binary_request(binary_dispatcher, request)
+
+        # Invalid UTF-8 gets a JSON-RPC parse error rather than a 500
+        response = JSONRPCResponseManager.handle(request.data.decode('utf-8', 'replace'), dispatcher)
+        return Response(response.json, mimetype='application/json')
+    return application
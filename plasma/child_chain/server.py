@@ -1,27 +1,59 @@
-from werkzeug.wrappers import Request, Response
 from werkzeug.serving import run_simple
-from jsonrpc import JSONRPCResponseManager, dispatcher
+from plasma.child_chain.async_server import AsyncServer
+from plasma.child_chain.binary_rpc import make_binary_dispatcher
+from plasma.child_chain.block_store import LevelDBBlockStore, MemoryBlockStore
+from plasma.child_chain.checkpoint import Checkpointer
 from plasma.child_chain.child_chain import ChildChain
+from plasma.child_chain.mempool import Mempool
+from plasma.child_chain.rpc import make_application, make_dispatcher
+from plasma.child_chain.signature_pool import SignaturePool
+from plasma.child_chain.write_ahead_log import WriteAheadLog
 from plasma.config import plasma_config
 from plasma.root_chain.deployer import Deployer
+from plasma.utils.utils import sender_cache
 
-root_chain = Deployer().get_contract_at_address("RootChain", plasma_config['ROOT_CHAIN_CONTRACT_ADDRESS'], concise=False)
-child_chain = ChildChain(plasma_config['AUTHORITY'], root_chain)
 
+def create_child_chain():
+    """Builds the child chain from `plasma_config`.
 
-@Request.application
-def application(request):
-    # Dispatcher is dictionary {<method_name>: callable}
-    dispatcher["submit_block"] = lambda block: child_chain.submit_block(block)
-    dispatcher["apply_transaction"] = lambda transaction: child_chain.apply_transaction(transaction)
-    dispatcher["get_transaction"] = lambda blknum, txindex: child_chain.get_transaction(blknum, txindex)
-    dispatcher["get_current_block"] = lambda: child_chain.get_current_block()
-    dispatcher["get_current_block_num"] = lambda: child_chain.get_current_block_num()
-    dispatcher["get_block"] = lambda blknum: child_chain.get_block(blknum)
-    response = JSONRPCResponseManager.handle(
-        request.data, dispatcher)
-    return Response(response.json, mimetype='application/json')
+    Nothing is set up at import time, since signature pool workers
+    import the main module when they start.
+    """
+
+    sender_cache.resize(plasma_config['SENDER_CACHE_SIZE'])
+    root_chain = Deployer().get_contract_at_address("RootChain", plasma_config['ROOT_CHAIN_CONTRACT_ADDRESS'], concise=False)
+    if plasma_config['CHILD_CHAIN_DB'] is not None:
+        block_store = LevelDBBlockStore(plasma_config['CHILD_CHAIN_DB'], plasma_config['BLOCK_CACHE_SIZE'])
+    else:
+        block_store = MemoryBlockStore(plasma_config['BLOCK_CACHE_SIZE'])
+    wal = None
+    if plasma_config['CHILD_CHAIN_WAL'] is not None:
+        # Logged transactions spend outputs of blocks that have to survive a restart
+        if isinstance(block_store, MemoryBlockStore):
+            raise ValueError('CHILD_CHAIN_WAL requires CHILD_CHAIN_DB to be set')
+        wal = WriteAheadLog(plasma_config['CHILD_CHAIN_WAL'], plasma_config['WAL_COMMIT_WINDOW'])
+    checkpointer = None
+    if plasma_config['CHECKPOINT_DIR'] is not None:
+        # Checkpoints only index blocks, so the blocks they cover have to survive a restart
+        if isinstance(block_store, MemoryBlockStore):
+            raise ValueError('CHECKPOINT_DIR requires CHILD_CHAIN_DB to be set')
+        checkpointer = Checkpointer(plasma_config['CHECKPOINT_DIR'], plasma_config['CHECKPOINT_INTERVAL'])
+    mempool = Mempool(plasma_config['MEMPOOL_SIZE'])
+    signature_pool = None
+    if plasma_config['SIGNATURE_WORKERS'] != 0:
+        signature_pool = SignaturePool(plasma_config['SIGNATURE_WORKERS'])
+    return ChildChain(plasma_config['AUTHORITY'], root_chain, block_store, wal, checkpointer, mempool,
+                      signature_pool, plasma_config['PROOF_CACHE_SIZE'], plasma_config['ENCODED_CACHE_SIZE'],
+                      plasma_config['ENCODED_TX_CACHE_SIZE'])
 
 
 if __name__ == '__main__':
-    run_simple('localhost', 8546, application)
+    child_chain = create_child_chain()
+    dispatcher = make_dispatcher(child_chain)
+    binary_dispatcher = make_binary_dispatcher(child_chain)
+    if plasma_config['RPC_SERVER'] == 'asyncio':
+        AsyncServer(dispatcher, binary_dispatcher, plasma_config['RPC_WORKERS'], plasma_config['RPC_MAX_CONNECTIONS'],
+                    plasma_config['RPC_MAX_BODY_SIZE'], plasma_config['RPC_KEEPALIVE_TIMEOUT'],
+                    plasma_config['RPC_BODY_TIMEOUT']).run('localhost', 8546)
+    else:
+        run_simple('localhost', 8546, make_application(dispatcher, binary_dispatcher))
@@ -0,0 +1,93 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import rlp
+from plasma.utils.utils import get_sender, sender_cache
+from .transaction import Transaction
+
+EMPTY_SIGNATURE = b'\x00' * 65
+
+
+def recover_chunk(encoded_txs):
+    """Recovers the signers of RLP encoded transactions.
+
+    Runs in a worker process, so the transactions are decoded and hashed
+    there as well.
+
+    Args:
+        encoded_txs (list): RLP encoded transactions.
+
+    Returns:
+        (list, list): (sender1, sender2) for each transaction, where a sender
+            is None if its signature is empty or can't be recovered, and the
+            ((hash, sig), sender) `sender_cache` entry of every recovered signer.
+    """
+
+    senders = []
+    recovered = []
+    for encoded_tx in encoded_txs:
+        tx = rlp.decode(encoded_tx, Transaction)
+        tx_hash = tx.hash
+        tx_senders = []
+        for sig in (tx.sig1, tx.sig2):
+            sender = None
+            if sig != EMPTY_SIGNATURE:
+                try:
+                    sender = get_sender(tx_hash, sig)
+                except Exception:
+                    pass
+                else:
+                    recovered.append(((tx_hash, sig), sender))
+            tx_senders.append(sender)
+        senders.append(tuple(tx_senders))
+    return senders, recovered
+
+
+def recover_senders(encoded_txs):
+    """Recovers the signers of RLP encoded transactions.
+
+    Returns:
+        list: (sender1, sender2) for each transaction, as returned by `recover_chunk`.
+    """
+
+    return recover_chunk(encoded_txs)[0]
+
+
+class SignaturePool(object):
+    """Recovers transaction signers in a pool of worker processes.
+
+    Signature recovery is the most expensive part of validating a
+    transaction and doesn't touch chain state, so it's done in parallel
+    ahead of the in-order state checks. Recovered signers are added to
+    the parent's `sender_cache`.
+
+    Args:
+        workers (int): Number of worker processes. Defaults to one per CPU.
+        chunk_size (int): Number of transactions handed to a worker at a time.
+    """
+
+    def __init__(self, workers=None, chunk_size=256):
+        # Forked workers could inherit locks held by the child chain's threads
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+        self.chunk_size = chunk_size
+
+    def recover(self, encoded_txs):
+        """Recovers the signers of a batch of transactions.
+
+        Args:
+            encoded_txs (list): RLP encoded transactions.
+
+        Returns:
+            list: (sender1, sender2) for each transaction, as returned by `recover_senders`.
+        """
+
+        chunks = [encoded_txs[i:i + self.chunk_size] for i in range(0, len(encoded_txs), self.chunk_size)]
+        senders = []
+        for chunk_senders, recovered in self.executor.map(recover_chunk, chunks):
+            senders.extend(chunk_senders)
+            for key, sender in recovered:
+                sender_cache.put(key, sender)
+        return senders
+
+    def close(self):
+        self.executor.shutdown()
@@ -0,0 +1,75 @@
+class SpentOutputs(object):
+    """Tracks which child chain outputs have been spent.
+
+    Each block gets a bitmap in which bit `txindex * 2 + oindex` is set
+    once that output is spent, so spend state can be queried without
+    keeping the block's transactions in memory.
+    """
+
+    def __init__(self):
+        self.bitmaps = {}
+
+    @staticmethod
+    def _position(txindex, oindex):
+        bit = txindex * 2 + oindex
+        return bit >> 3, 1 << (bit & 7)
+
+    def mark_spent(self, blknum, txindex, oindex):
+        """Marks an output as spent.
+
+        Args:
+            blknum (int): Block number of the output.
+            txindex (int): Index of the transaction in the block.
+            oindex (int): Index of the output in the transaction.
+
+        Returns:
+            bytearray: The updated bitmap of the block.
+        """
+
+        byte, mask = self._position(txindex, oindex)
+        bitmap = self.bitmaps.setdefault(blknum, bytearray())
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte + 1 - len(bitmap)))
+        bitmap[byte] |= mask
+        return bitmap
+
+    def is_spent(self, blknum, txindex, oindex):
+        """Checks whether an output has been spent.
+
+        Args:
+            blknum (int): Block number of the output.
+            txindex (int): Index of the transaction in the block.
+            oindex (int): Index of the output in the transaction.
+
+        Returns:
+            bool: True if the output is spent.
+        """
+
+        bitmap = self.bitmaps.get(blknum)
+        if bitmap is None:
+            return False
+        byte, mask = self._position(txindex, oindex)
+        return byte < len(bitmap) and bool(bitmap[byte] & mask)
+
+    def load(self, blknum, bitmap):
+        """Restores the bitmap of a block, e.g. from a block store.
+
+        Args:
+            blknum (int): Block number.
+            bitmap (bytes): Bitmap as returned by `mark_spent`.
+        """
+
+        self.bitmaps[blknum] = bytearray(bitmap)
+
+    def count_spent(self, blknum):
+        """Returns the number of spent outputs in a block.
+        """
+
+        bitmap = self.bitmaps.get(blknum, b'')
+        return sum(bin(byte).count('1') for byte in bitmap)
+
+    def nbytes(self):
+        """Returns the number of bytes used by the bitmaps themselves.
+        """
+
+        return sum(len(bitmap) for bitmap in self.bitmaps.values())
@@ -2,6 +2,7 @@ import rlp
 from rlp.sedes import big_endian_int, binary
 from ethereum import utils
 from plasma.utils.utils import get_sender, sign
+from plasma.utils.keccak import keccak
 
 
 class Transaction(rlp.Serializable):
@@ -21,6 +22,7 @@ class Transaction(rlp.Serializable):
         ('sig1', binary),
         ('sig2', binary),
     ]
+    field_names = frozenset(field for field, _ in fields)
 
     def __init__(self,
                  blknum1, txindex1, oindex1,
@@ -55,16 +57,43 @@ class Transaction(rlp.Serializable):
         self.confirmation1 = None
         self.confirmation2 = None
 
-        self.spent1 = False
-        self.spent2 = False
+    def __setattr__(self, attr, value):
+        changed = attr in self.field_names and self.__dict__.get(attr) != value
+        super(Transaction, self).__setattr__(attr, value)
+        if changed:
+            self.forget(attr)
+
+    def forget(self, field):
+        """Drops memoized values that depend on a field.
+        """
+
+        if field in ('sig1', 'sig2'):
+            stale = ('_encoded', '_merkle_hash', '_sender' + field[-1])
+        else:
+            stale = ('_encoded', '_hash', '_merkle_hash', '_sender1', '_sender2')
+        for key in stale:
+            self.__dict__.pop(key, None)
+
+    @property
+    def encoded(self):
+        encoded = self.__dict__.get('_encoded')
+        if encoded is None:
+            encoded = self.__dict__['_encoded'] = rlp.encode(self, Transaction)
+        return encoded
 
     @property
     def hash(self):
-        return utils.sha3(rlp.encode(self, UnsignedTransaction))
+        tx_hash = self.__dict__.get('_hash')
+        if tx_hash is None:
+            tx_hash = self.__dict__['_hash'] = keccak(rlp.encode(self, UnsignedTransaction))
+        return tx_hash
 
     @property
     def merkle_hash(self):
-        return utils.sha3(self.hash + self.sig1 + self.sig2)
+        merkle_hash = self.__dict__.get('_merkle_hash')
+        if merkle_hash is None:
+            merkle_hash = self.__dict__['_merkle_hash'] = keccak(self.hash + self.sig1 + self.sig2)
+        return merkle_hash
 
     def sign1(self, key):
         self.sig1 = sign(self.hash, key)
@@ -80,11 +109,17 @@ class Transaction(rlp.Serializable):
 
     @property
     def sender1(self):
-        return get_sender(self.hash, self.sig1)
+        sender = self.__dict__.get('_sender1')
+        if sender is None:
+            sender = self.__dict__['_sender1'] = get_sender(self.hash, self.sig1)
+        return sender
 
     @property
     def sender2(self):
-        return get_sender(self.hash, self.sig2)
+        sender = self.__dict__.get('_sender2')
+        if sender is None:
+            sender = self.__dict__['_sender2'] = get_sender(self.hash, self.sig2)
+        return sender
 
 
 UnsignedTransaction = Transaction.exclude(['sig1', 'sig2'])
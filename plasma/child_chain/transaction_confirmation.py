@@ -1,7 +1,7 @@
 import rlp
-from etheruem import utils
 from rlp.sedes import big_endian_int, binary
 from plasma.utils.utils import sign, get_sender
+from plasma.utils.keccak import keccak
 
 
 class TransactionConfirmation(rlp.Serializable):
@@ -24,7 +24,7 @@ class TransactionConfirmation(rlp.Serializable):
 
     @property
     def hash(self):
-        return utils.sha3(rlp.encode(self, TransactionConfirmation))
+        return keccak(rlp.encode(self, TransactionConfirmation))
 
     @property
     def sign(self, key):
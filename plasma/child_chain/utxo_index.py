@@ -0,0 +1,108 @@
+import bisect
+from plasma.utils.utils import pack_utxo_pos, unpack_utxo_pos
+
+ZERO_ADDRESS = b'\x00' * 20
+
+
+class UtxoIndex(object):
+    """Index of unspent outputs by owner.
+
+    Outputs are kept sorted by utxo position for each owner so they can
+    be paged through, and balances are kept per owner and token.
+    """
+
+    def __init__(self):
+        self.positions = {}
+        self.outputs = {}
+        self.balances = {}
+        # Number of unspent outputs left in each block
+        self.block_counts = {}
+
+    def add(self, owner, utxo_pos, token, amount):
+        """Adds an unspent output.
+
+        Args:
+            owner (bytes): Address of the output owner.
+            utxo_pos (int): Packed position of the output.
+            token (bytes): Address of the output's token.
+            amount (int): Amount of the output.
+        """
+
+        if utxo_pos in self.outputs:
+            return
+        self.outputs[utxo_pos] = (owner, token, amount)
+        blknum = unpack_utxo_pos(utxo_pos)[0]
+        self.block_counts[blknum] = self.block_counts.get(blknum, 0) + 1
+        bisect.insort(self.positions.setdefault(owner, []), utxo_pos)
+        balances = self.balances.setdefault(owner, {})
+        balances[token] = balances.get(token, 0) + amount
+
+    def add_transaction(self, blknum, txindex, tx):
+        """Adds the outputs of a committed transaction.
+
+        Outputs without an owner or with a zero amount can't be spent and
+        are skipped.
+        """
+
+        outputs = [(tx.newowner1, tx.amount1), (tx.newowner2, tx.amount2)]
+        for oindex, (owner, amount) in enumerate(outputs):
+            if owner != ZERO_ADDRESS and amount > 0:
+                self.add(owner, pack_utxo_pos(blknum, txindex, oindex), tx.cur12, amount)
+
+    def remove(self, utxo_pos):
+        """Removes an output once it's spent or exited.
+
+        Args:
+            utxo_pos (int): Packed position of the output.
+
+        Returns:
+            bool: True if this was the last unspent output of its block.
+        """
+
+        output = self.outputs.pop(utxo_pos, None)
+        if output is None:
+            return False
+        owner, token, amount = output
+
+        positions = self.positions[owner]
+        del positions[bisect.bisect_left(positions, utxo_pos)]
+        if not positions:
+            del self.positions[owner]
+
+        balances = self.balances[owner]
+        balances[token] -= amount
+        if balances[token] == 0:
+            del balances[token]
+        if not balances:
+            del self.balances[owner]
+
+        blknum = unpack_utxo_pos(utxo_pos)[0]
+        self.block_counts[blknum] -= 1
+        if self.block_counts[blknum] == 0:
+            del self.block_counts[blknum]
+            return True
+        return False
+
+    def get_utxos(self, owner, start=0, count=100):
+        """Returns a page of an owner's unspent outputs, ordered by position.
+
+        Args:
+            owner (bytes): Address of the owner.
+            start (int): Index of the first output to return.
+            count (int): Maximum number of outputs to return.
+
+        Returns:
+            list: (blknum, txindex, oindex, token, amount) tuples.
+        """
+
+        utxos = []
+        for utxo_pos in self.positions.get(owner, [])[start:start + count]:
+            _, token, amount = self.outputs[utxo_pos]
+            utxos.append(unpack_utxo_pos(utxo_pos) + (token, amount))
+        return utxos
+
+    def get_balance(self, owner, token=ZERO_ADDRESS):
+        """Returns the total unspent amount of a token held by an owner.
+        """
+
+        return self.balances.get(owner, {}).get(token, 0)
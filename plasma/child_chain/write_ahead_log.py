@@ -0,0 +1,170 @@
+import os
+import threading
+import rlp
+from rlp.sedes import big_endian_int, binary, List
+
+RECORD_LENGTH_BYTES = 4
+
+
+class WriteAheadLog(object):
+    """Durable log of changes made to the mempool and the open child block.
+
+    Records are appended to an in-memory buffer and written to disk in
+    groups: a single fsync covers every record appended during the commit
+    window. Callers that need durability wait on the sequence number
+    returned by `append`.
+
+    Each record is a 4-byte big-endian length followed by the RLP list
+    `[kind, payload]`. A torn record at the end of the file is ignored
+    on replay.
+
+    Args:
+        path (str): Path of the log file.
+        commit_window (float): Seconds to gather records before each fsync.
+            With a window of 0, every `wait` fsyncs immediately.
+    """
+
+    TRANSACTION = 0
+    SPEND = 1
+    ASSEMBLE = 2
+
+    record_sedes = List([big_endian_int, binary])
+
+    def __init__(self, path, commit_window=0.0):
+        self.path = path
+        self.commit_window = commit_window
+
+        self.file = open(path, 'ab')
+        # Drop a torn record left by a crash so new records stay readable
+        self.file.truncate(self.valid_length())
+        self.buffer = []
+        self.appended = 0
+        self.committed = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+        if commit_window > 0:
+            threading.Thread(target=self.commit_loop, daemon=True).start()
+
+    def append(self, kind, payload):
+        """Buffers a record for the next group commit.
+
+        Args:
+            kind (int): `TRANSACTION`, `SPEND` or `ASSEMBLE`.
+            payload (bytes): Record payload.
+
+        Returns:
+            int: Sequence number to pass to `wait`.
+        """
+
+        record = self.encode_record(kind, payload)
+        with self.condition:
+            self.buffer.append(record)
+            self.appended += 1
+            return self.appended
+
+    def encode_record(self, kind, payload):
+        record = rlp.encode([kind, payload], self.record_sedes)
+        return len(record).to_bytes(RECORD_LENGTH_BYTES, 'big') + record
+
+    def wait(self, seq):
+        """Blocks until the record with the given sequence number is on disk.
+
+        Args:
+            seq (int): Sequence number returned by `append`.
+        """
+
+        with self.condition:
+            if self.commit_window <= 0:
+                self.commit()
+            while self.committed < seq:
+                self.condition.wait()
+
+    def commit_loop(self):
+        """Writes and fsyncs buffered records once per commit window.
+        """
+
+        while not self.closed:
+            with self.condition:
+                self.condition.wait(self.commit_window)
+                self.commit()
+
+    def commit(self):
+        # Must be called with the condition held
+        if self.committed == self.appended:
+            return
+        self.file.write(b''.join(self.buffer))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.buffer = []
+        self.committed = self.appended
+        self.condition.notify_all()
+
+    def records(self):
+        """Yields every complete record in the log.
+
+        Yields:
+            (int, bytes): Kind and payload of each record.
+        """
+
+        for kind, payload, _ in self.scan():
+            yield kind, payload
+
+    def valid_length(self):
+        end = 0
+        for _, _, end in self.scan():
+            pass
+        return end
+
+    def scan(self):
+        with open(self.path, 'rb') as log_file:
+            data = log_file.read()
+
+        position = 0
+        while position + RECORD_LENGTH_BYTES <= len(data):
+            length = int.from_bytes(data[position:position + RECORD_LENGTH_BYTES], 'big')
+            start = position + RECORD_LENGTH_BYTES
+            if start + length > len(data):
+                break
+            kind, payload = rlp.decode(data[start:start + length], self.record_sedes)
+            position = start + length
+            yield kind, payload, position
+
+    def truncate(self, records=()):
+        """Replaces every record, e.g. once the open block has been committed.
+
+        The new log is written to a temporary file that's renamed over the
+        old one, so a crash leaves one or the other. Records waiting for a
+        commit are dropped, and their waiters only released, once the new
+        log is on disk.
+
+        Args:
+            records (list): (kind, payload) of each record to keep, such as
+                the transactions still pending.
+        """
+
+        with self.condition:
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'wb') as temp_file:
+                temp_file.write(b''.join(self.encode_record(kind, payload) for kind, payload in records))
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            self.file.close()
+            os.rename(temp_path, self.path)
+            directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+            self.file = open(self.path, 'ab')
+
+            self.buffer = []
+            self.committed = self.appended
+            self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.commit()
+            self.closed = True
+            self.file.close()
+            self.condition.notify_all()
@@ -113,23 +113,20 @@ def withdraw(client,
              blknum, txindex, oindex,
              key1, key2):
 
-    # Get the transaction's block, already decoded by client
-    block = client_call(client.get_block, [blknum])
-
-    # Create a Merkle proof
-    tx = block.transaction_set[txindex]
-    block.merklize_transaction_set()
-    proof = block.merkle.create_membership_proof(tx.merkle_hash)
+    # Get the transaction and its block's root, already decoded by client
+    tx = client_call(client.get_transaction, [blknum, txindex])
+    block_root = client_call(client.get_block_root, [blknum])
 
     # Create the confirmation signatures
     confirmSig1, confirmSig2 = b'', b''
     if key1:
-        confirmSig1 = confirm_tx(tx, block.merkle.root, utils.normalize_key(key1))
+        confirmSig1 = confirm_tx(tx, block_root, utils.normalize_key(key1))
     if key2:
-        confirmSig2 = confirm_tx(tx, block.merkle.root, utils.normalize_key(key2))
+        confirmSig2 = confirm_tx(tx, block_root, utils.normalize_key(key2))
     sigs = tx.sig1 + tx.sig2 + confirmSig1 + confirmSig2
 
-    client.withdraw(blknum, txindex, oindex, tx, proof, sigs)
+    # The client fetches the Merkle proof from the child chain
+    client.withdraw(blknum, txindex, oindex, tx, None, sigs)
     print("Submitted withdrawal")
 
 
@@ -1,15 +1,32 @@
+from urllib.parse import urljoin
 import requests
 import rlp
 from plasma.child_chain.child_chain import ChildChain
 from plasma.child_chain.transaction import Transaction
+from plasma.child_chain.binary_rpc import BINARY_MIMETYPE, BINARY_PATH
 from plasma.child_chain.block import Block
+from plasma.child_chain.lazy_block import split_list
 from .exceptions import ChildChainServiceError
 
 
 class ChildChainService(object):
+    """Client of the child chain's JSON-RPC and binary endpoints.
 
-    def __init__(self, url):
+    Transactions and blocks are sent over the binary endpoint when the
+    server supports it. By default the first such request finds out, and
+    the service falls back to JSON-RPC for good if it isn't supported.
+
+    Args:
+        url (str): URL of the child chain's JSON-RPC endpoint. The binary
+            endpoint is served from the root of the same server.
+        binary (bool): Whether to use the binary endpoint, or None to negotiate.
+    """
+
+    def __init__(self, url, binary=None):
         self.url = url
+        # BINARY_PATH is absolute, so this keeps only the server's origin from url
+        self.binary_url = urljoin(url, BINARY_PATH)
+        self.binary = binary
         self.methods = [func for func in dir(ChildChain) if callable(getattr(ChildChain, func)) and not func.startswith("__")]
 
     def send_request(self, method, args):
@@ -25,8 +42,39 @@ class ChildChainService(object):
 
         return response["result"]
 
+    def send_binary_request(self, method, body):
+        """Sends a request to the binary endpoint, if the server supports it.
+
+        Args:
+            method (str): Name of the method.
+            body (bytes): RLP encoded request.
+
+        Returns:
+            bytes: Body of the response, or None if JSON-RPC has to be used instead.
+        """
+
+        if self.binary is False:
+            return None
+
+        response = requests.post(self.binary_url + method, data=body, headers={'Content-Type': BINARY_MIMETYPE})
+        if response.headers.get('Content-Type') != BINARY_MIMETYPE:
+            # Servers without the binary endpoint answer with a JSON-RPC error
+            self.binary = False
+            return None
+        self.binary = True
+
+        if response.status_code != 200:
+            raise ChildChainServiceError(response.content.decode())
+        return response.content
+
     def apply_transaction(self, transaction):
-        return self.send_request("apply_transaction", [rlp.encode(transaction, Transaction).hex()])
+        encoded_tx = rlp.encode(transaction, Transaction)
+        if self.send_binary_request("apply_transaction", encoded_tx) is not None:
+            return None
+        return self.send_request("apply_transaction", [encoded_tx.hex()])
+
+    def apply_transactions(self, transactions):
+        return self.send_request("apply_transactions", [[rlp.encode(transaction, Transaction).hex() for transaction in transactions]])
 
     def submit_block(self, block):
         return self.send_request("submit_block", [rlp.encode(block, Block).hex()])
@@ -34,11 +82,53 @@ class ChildChainService(object):
     def get_transaction(self, blknum, txindex):
         return self.send_request("get_transaction", [blknum, txindex])
 
+    def get_encoded_transaction(self, blknum, txindex):
+        encoded_tx = self.send_binary_request("get_transaction", rlp.encode([blknum, txindex]))
+        if encoded_tx is None:
+            encoded_tx = bytes.fromhex(self.get_transaction(blknum, txindex))
+        return encoded_tx
+
     def get_current_block(self):
         return self.send_request("get_current_block", [])
 
+    def get_current_block_since(self, blknum, txcount):
+        return self.send_request("get_current_block_since", [blknum, txcount])
+
     def get_block(self, blknum):
         return self.send_request("get_block", [blknum])
 
+    def get_encoded_block(self, blknum):
+        encoded_block = self.send_binary_request("get_block", rlp.encode([blknum]))
+        if encoded_block is None:
+            encoded_block = bytes.fromhex(self.get_block(blknum))
+        return encoded_block
+
+    def get_block_range(self, blknum, start=0, count=1024):
+        return self.send_request("get_block_range", [blknum, start, count])
+
+    def get_encoded_block_range(self, blknum, start=0, count=1024):
+        encoded_txs = self.send_binary_request("get_block_range", rlp.encode([blknum, start, count]))
+        if encoded_txs is None:
+            return [bytes.fromhex(encoded_tx) for encoded_tx in self.get_block_range(blknum, start, count)]
+        return [encoded_txs[tx_start:tx_end] for tx_start, tx_end in split_list(encoded_txs, 0, len(encoded_txs))]
+
+    def get_proof(self, blknum, txindex):
+        return self.send_request("get_proof", [blknum, txindex])
+
+    def get_block_root(self, blknum):
+        return self.send_request("get_block_root", [blknum])
+
     def get_current_block_num(self):
         return self.send_request("get_current_block_num", [])
+
+    def get_tx_pos(self, transaction):
+        return self.send_request("get_tx_pos", [rlp.encode(transaction, Transaction).hex()])
+
+    def get_utxos(self, address, start=0, count=100):
+        return self.send_request("get_utxos", [address, start, count])
+
+    def get_balance(self, address, token):
+        return self.send_request("get_balance", [address, token])
+
+    def get_cache_stats(self):
+        return self.send_request("get_cache_stats", [])
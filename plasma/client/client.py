@@ -2,11 +2,14 @@ import rlp
 from ethereum import utils
 from web3 import HTTPProvider
 from plasma.child_chain.block import Block
+from plasma.child_chain.lazy_block import LazyBlock
 from plasma.config import plasma_config
 from plasma.root_chain.deployer import Deployer
 from plasma.child_chain.transaction import Transaction, UnsignedTransaction
 from .child_chain_service import ChildChainService
 
+NULL_ADDRESS_HEX = '0x' + '00' * 20
+
 
 class Client(object):
 
@@ -41,10 +44,15 @@ class Client(object):
     def apply_transaction(self, transaction):
         self.child_chain.apply_transaction(transaction)
 
+    def apply_transactions(self, transactions):
+        return self.child_chain.apply_transactions(transactions)
+
     def submit_block(self, block):
         self.child_chain.submit_block(block)
 
     def withdraw(self, blknum, txindex, oindex, tx, proof, sigs):
+        if proof is None:
+            proof = self.get_proof(blknum, txindex)
         utxo_pos = blknum * 1000000000 + txindex * 10000 + oindex * 1
         encoded_transaction = rlp.encode(tx, UnsignedTransaction)
         self.root_chain.startExit(utxo_pos, encoded_transaction, proof, sigs, transact={'from': '0x' + tx.newowner1.hex()})
@@ -53,16 +61,75 @@ class Client(object):
         self.root_chain.startDepositExit(deposit_pos, amount, transact={'from': owner})
 
     def get_transaction(self, blknum, txindex):
-        encoded_transaction = self.child_chain.get_transaction(blknum, txindex)
-        return rlp.decode(utils.decode_hex(encoded_transaction), Transaction)
+        encoded_transaction = self.child_chain.get_encoded_transaction(blknum, txindex)
+        return rlp.decode(encoded_transaction, Transaction)
 
     def get_current_block(self):
         encoded_block = self.child_chain.get_current_block()
         return rlp.decode(utils.decode_hex(encoded_block), Block)
 
+    def get_current_block_since(self, blknum, txcount):
+        """Returns the transactions added to the open block since a previous poll.
+
+        Args:
+            blknum (int): Block number returned by the previous poll, or 0.
+            txcount (int): Transaction count returned by the previous poll, or 0.
+
+        Returns:
+            dict: `blknum`, `txcount` and `root` of the open block, the
+                index `start` of the first new transaction, and the new
+                `transactions`, decoded. `start` is 0 when a new block was opened.
+        """
+
+        delta = self.child_chain.get_current_block_since(blknum, txcount)
+        delta['root'] = utils.decode_hex(delta['root'])
+        delta['transactions'] = [rlp.decode(utils.decode_hex(encoded_tx), Transaction) for encoded_tx in delta['transactions']]
+        return delta
+
     def get_block(self, blknum):
-        encoded_block = self.child_chain.get_block(blknum)
-        return rlp.decode(utils.decode_hex(encoded_block), Block)
+        encoded_block = self.child_chain.get_encoded_block(blknum)
+        return LazyBlock(encoded_block)
+
+    def get_block_transactions(self, blknum, page_size=1024):
+        """Yields a committed block's transactions, fetching them a page at a time.
+
+        Only one page is held in memory, so a full block can be processed
+        as it arrives.
+
+        Args:
+            blknum (int): Number of the block.
+            page_size (int): Number of transactions to fetch per request.
+
+        Yields:
+            Transaction: Each transaction of the block, in order.
+        """
+
+        if page_size < 1:
+            raise ValueError('page_size should be at least 1')
+
+        start = 0
+        while True:
+            encoded_txs = self.child_chain.get_encoded_block_range(blknum, start, page_size)
+            for encoded_tx in encoded_txs:
+                yield rlp.decode(encoded_tx, Transaction)
+            if len(encoded_txs) < page_size:
+                return
+            start += page_size
+
+    def get_proof(self, blknum, txindex):
+        return utils.decode_hex(self.child_chain.get_proof(blknum, txindex))
+
+    def get_block_root(self, blknum):
+        return utils.decode_hex(self.child_chain.get_block_root(blknum))
 
     def get_current_block_num(self):
         return self.child_chain.get_current_block_num()
+
+    def get_tx_pos(self, transaction):
+        return self.child_chain.get_tx_pos(transaction)
+
+    def get_utxos(self, address, start=0, count=100):
+        return self.child_chain.get_utxos(address, start, count)
+
+    def get_balance(self, address, token=NULL_ADDRESS_HEX):
+        return self.child_chain.get_balance(address, token)
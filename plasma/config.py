@@ -2,4 +2,41 @@ plasma_config = dict(
     ROOT_CHAIN_CONTRACT_ADDRESS="0xa3b2a1804203b75b494028966c0f62e677447a39",
     AUTHORITY=b'\xfd\x02\xec\xeeby~u\xd8k\xcf\xf1d.\xb0\x84J\xfb(\xc7',
     AUTHORITY_KEY=b';\xb3i\xfe\xcd\xc1k\x93\xb9\x95\x14\xd8\xed\x9c.\x87\xc5\x82L\xf4\xa6\xa9\x8d.\x8e\x91\xb7\xdd\x0c\x063\x04',
+    # LevelDB directory for child chain blocks, or None to keep them in memory
+    CHILD_CHAIN_DB=None,
+    BLOCK_CACHE_SIZE=1024,
+    # Write-ahead log for the open block, or None to disable it. Requires CHILD_CHAIN_DB
+    CHILD_CHAIN_WAL=None,
+    # Seconds of accepted transactions to group into a single fsync
+    WAL_COMMIT_WINDOW=0.005,
+    # Directory for state checkpoints, or None to rebuild state from every block on startup. Requires CHILD_CHAIN_DB
+    CHECKPOINT_DIR=None,
+    # Number of submitted blocks between checkpoints
+    CHECKPOINT_INTERVAL=100,
+    # Maximum number of pending transactions kept in the mempool
+    MEMPOOL_SIZE=2 ** 18,
+    # Processes to recover transaction signatures in; None uses one per CPU, 0 recovers them on the request thread
+    SIGNATURE_WORKERS=None,
+    # Number of recovered (hash, signature) signers kept in memory
+    SENDER_CACHE_SIZE=65536,
+    # Number of committed block merkle trees kept for get_proof
+    PROOF_CACHE_SIZE=64,
+    # Number of committed block encodings kept for get_block
+    ENCODED_CACHE_SIZE=256,
+    # Number of committed transaction encodings kept for get_transaction
+    ENCODED_TX_CACHE_SIZE=4096,
+    # RPC server to run: 'werkzeug' for the development server or 'asyncio'
+    RPC_SERVER='werkzeug',
+    # Threads the asyncio server runs request handlers on
+    RPC_WORKERS=8,
+    # Open connections the asyncio server accepts before answering 503
+    RPC_MAX_CONNECTIONS=1024,
+    # Largest request body the asyncio server accepts, in bytes
+    RPC_MAX_BODY_SIZE=2 ** 26,
+    # Seconds the asyncio server keeps an idle connection open
+    RPC_KEEPALIVE_TIMEOUT=15,
+    # Seconds the asyncio server waits for a request body before answering 408
+    RPC_BODY_TIMEOUT=60,
+    # keccak implementation to hash with, e.g. 'pysha3', or None to pick the fastest one installed
+    KECCAK_BACKEND=None,
 )
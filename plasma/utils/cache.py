@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """A bounded, thread-safe least-recently-used cache.
+
+    Args:
+        capacity (int): Maximum number of entries kept before the least
+            recently used entry is evicted.
+    """
+
+    def __init__(self, capacity=1024):
+        if capacity < 1:
+            raise ValueError('capacity should be at least 1')
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the cached value for a key and marks it as recently used.
+
+        Args:
+            key (obj): Key to look up.
+            default (obj): Value to return if the key isn't cached.
+
+        Returns:
+            obj: The cached value, or `default`.
+        """
+
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Caches a value, evicting the least recently used entry if full.
+
+        Args:
+            key (obj): Key to store the value under.
+            value (obj): Value to cache.
+        """
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """Removes a key from the cache.
+
+        Args:
+            key (obj): Key to remove.
+            default (obj): Value to return if the key isn't cached.
+
+        Returns:
+            obj: The removed value, or `default`.
+        """
+
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def resize(self, capacity):
+        """Changes the capacity of the cache, evicting entries if needed.
+
+        Args:
+            capacity (int): New maximum number of entries.
+        """
+
+        if capacity < 1:
+            raise ValueError('capacity should be at least 1')
+
+        with self._lock:
+            self.capacity = capacity
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Removes every entry and resets the counters.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Returns the cache counters.
+
+        Returns:
+            dict: Size, capacity, hit, miss and eviction counts.
+        """
+
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'capacity': self.capacity,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,169 @@
+import os
+import threading
+import time
+from plasma.config import plasma_config
+
+# keccak256(b'') and keccak256(b'abc'), to check a backend really is keccak and not SHA3-256
+EMPTY_KECCAK = bytes.fromhex('c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470')
+ABC_KECCAK = bytes.fromhex('4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45')
+
+
+def hash_each(keccak):
+    """Builds a `keccak_many` for a backend that only hashes one item per call.
+    """
+
+    def keccak_many(items):
+        return [keccak(item) for item in items]
+    return keccak_many
+
+
+def load_pysha3():
+    import sha3
+    new = sha3.keccak_256
+
+    def keccak(data):
+        return new(data).digest()
+
+    def keccak_many(items):
+        return [new(item).digest() for item in items]
+    return keccak, keccak_many
+
+
+def load_pycryptodome():
+    from Crypto.Hash import keccak as crypto_keccak
+    new = crypto_keccak.new
+
+    def keccak(data):
+        return new(digest_bits=256, data=data).digest()
+
+    def keccak_many(items):
+        return [new(digest_bits=256, data=item).digest() for item in items]
+    return keccak, keccak_many
+
+
+def load_eth_hash():
+    from eth_hash.auto import keccak
+    return keccak, hash_each(keccak)
+
+
+def load_ethereum():
+    from ethereum.utils import sha3
+    return sha3, hash_each(sha3)
+
+
+BACKENDS = {
+    'pysha3': load_pysha3,
+    'pycryptodome': load_pycryptodome,
+    'eth_hash': load_eth_hash,
+    'ethereum': load_ethereum,
+}
+
+
+def self_test(keccak, keccak_many):
+    expected = [EMPTY_KECCAK, ABC_KECCAK]
+    return [keccak(b''), keccak(b'abc')] == expected and keccak_many([b'', b'abc']) == expected
+
+
+def available_backends():
+    """Loads every keccak backend that's installed and passes the self-test.
+
+    Returns:
+        dict: Map of backend name to its (keccak, keccak_many) functions.
+    """
+
+    backends = {}
+    for name, load in BACKENDS.items():
+        try:
+            functions = load()
+        except Exception:
+            continue
+        if self_test(*functions):
+            backends[name] = functions
+    return backends
+
+
+def time_backend(keccak_many, rounds=20, level_size=256):
+    # Merkle levels are the common case: many 64-byte nodes, hashed to 32 bytes each
+    level = [os.urandom(64) for _ in range(level_size)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        keccak_many(level)
+    return time.perf_counter() - start
+
+
+def select_backend(name=None):
+    """Picks the keccak backend to use.
+
+    Args:
+        name (str): Backend to use, or None to pick the fastest available one.
+
+    Returns:
+        (str, function, function): Name, keccak and keccak_many functions of the backend.
+    """
+
+    backends = available_backends()
+    if name is not None:
+        if name not in backends:
+            raise ValueError('keccak backend {} is not available'.format(name))
+        return (name,) + backends[name]
+    if not backends:
+        raise ImportError('no keccak backend is available')
+    name = min(backends, key=lambda backend: time_backend(backends[backend][1]))
+    return (name,) + backends[name]
+
+
+selection_lock = threading.Lock()
+selected = None
+
+
+def get_backend():
+    """Returns the backend in use, selecting it on first use.
+
+    Selection benchmarks every installed backend, so it's done once, the
+    first time something is hashed, rather than on import.
+
+    Returns:
+        (str, function, function): Name, keccak and keccak_many functions of the backend.
+    """
+
+    global selected, _keccak, _keccak_many
+    with selection_lock:
+        if selected is None:
+            selected = select_backend(plasma_config.get('KECCAK_BACKEND'))
+            _, _keccak, _keccak_many = selected
+    return selected
+
+
+def _select_keccak(data):
+    get_backend()
+    return _keccak(data)
+
+
+def _select_keccak_many(items):
+    get_backend()
+    return _keccak_many(items)
+
+
+# Replaced by the selected backend's functions on first use
+_keccak = _select_keccak
+_keccak_many = _select_keccak_many
+
+
+def keccak(data):
+    """Returns the keccak256 digest of a byte string.
+    """
+
+    return _keccak(data)
+
+
+def keccak_many(items):
+    """Hashes each of a list of byte strings in one call to the backend.
+
+    Args:
+        items (list): Byte strings to hash.
+
+    Returns:
+        list: keccak256 digest of each item, in order.
+    """
+
+    return _keccak_many(items)
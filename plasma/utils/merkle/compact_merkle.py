@@ -0,0 +1,144 @@
+from plasma.utils.keccak import keccak, keccak_many
+
+from .exceptions import MemberNotExistException
+from .zero_hashes import get_zero_hashes
+
+
+class CompactMerkle(object):
+    """Fixed-depth merkle tree with the same root and proofs as `FixedMerkle`.
+
+    Each level is a single bytes buffer holding only its populated nodes,
+    32 bytes apiece. Nodes past the end of a level are roots of empty
+    subtrees and come from a precomputed zero-hash ladder, so a tree with
+    n leaves takes about 2n hashes and 64n bytes, whatever its depth.
+    Leaf positions are looked up through a map built on the first proof.
+
+    Args:
+        depth (int): Depth of the tree.
+        leaves (list): Leaves of the tree.
+        hashed (bool): Whether the leaves are already hashed.
+    """
+
+    def __init__(self, depth, leaves=[], hashed=False):
+        if depth < 1:
+            raise ValueError('depth should be at least 1')
+
+        self.depth = depth
+        self.leaf_count = 2 ** depth
+        self.hashed = hashed
+        self.zero_hashes = get_zero_hashes(depth)
+
+        if len(leaves) > self.leaf_count:
+            raise ValueError('num of leaves exceed max avaiable num with the depth')
+
+        if not hashed:
+            leaves = keccak_many(leaves)
+        self.count = len(leaves)
+        self.levels = [b''.join(leaves)]
+        self._leaf_indexes = None
+        for level in range(depth):
+            self.levels.append(self.hash_level(self.levels[level], self.zero_hashes[level]))
+        self.root = self.node(depth, 0)
+
+    @staticmethod
+    def hash_level(nodes, zero_hash):
+        if len(nodes) % 64:
+            nodes += zero_hash
+        return b''.join(keccak_many([nodes[i:i + 64] for i in range(0, len(nodes), 64)]))
+
+    def node(self, level, index):
+        start = index * 32
+        if start < len(self.levels[level]):
+            return self.levels[level][start:start + 32]
+        return self.zero_hashes[level]
+
+    @property
+    def leaves(self):
+        nodes = self.levels[0]
+        leaves = [nodes[i:i + 32] for i in range(0, len(nodes), 32)]
+        return leaves + [self.zero_hashes[0]] * (self.leaf_count - len(leaves))
+
+    def check_membership(self, leaf, index, proof):
+        if not self.hashed:
+            leaf = keccak(leaf)
+        computed_hash = leaf
+        for i in range(0, self.depth * 32, 32):
+            segment = proof[i:i + 32]
+            if index % 2 == 0:
+                computed_hash = keccak(computed_hash + segment)
+            else:
+                computed_hash = keccak(segment + computed_hash)
+            index = index // 2
+        return computed_hash == self.root
+
+    @property
+    def leaf_indexes(self):
+        """Map of each populated leaf to its first position, built on first use.
+        """
+
+        if self._leaf_indexes is None:
+            nodes = self.levels[0]
+            leaf_indexes = {}
+            for index in range(len(nodes) // 32):
+                leaf_indexes.setdefault(nodes[index * 32:index * 32 + 32], index)
+            self._leaf_indexes = leaf_indexes
+        return self._leaf_indexes
+
+    def create_membership_proof(self, leaf):
+        return self.create_membership_proofs([leaf])[0]
+
+    def create_membership_proofs(self, leaves):
+        """Creates membership proofs for many leaves in one pass over the tree.
+
+        Args:
+            leaves (list): Leaves to prove.
+
+        Returns:
+            list: Proof of each leaf, in order.
+        """
+
+        if not self.hashed:
+            leaves = keccak_many(leaves)
+        indexes = []
+        for leaf in leaves:
+            index = self.index(leaf)
+            if index is None:
+                raise MemberNotExistException('leaf is not in the merkle tree')
+            indexes.append(index)
+
+        return self.create_proofs_at(indexes)
+
+    def create_proofs_at(self, indexes):
+        """Creates membership proofs for the leaves at some positions.
+
+        Args:
+            indexes (list): Leaf positions.
+
+        Returns:
+            list: Proof of each position, in order.
+        """
+
+        indexes = list(indexes)
+        proofs = [[] for _ in indexes]
+        for level in range(self.depth):
+            for i, index in enumerate(indexes):
+                proofs[i].append(self.node(level, index ^ 1))
+                indexes[i] = index // 2
+        return [b''.join(proof) for proof in proofs]
+
+    def index(self, leaf):
+        """Returns the position of a hashed leaf, or None if it isn't in the tree.
+        """
+
+        index = self.leaf_indexes.get(leaf)
+        if index is not None:
+            return index
+        if leaf == self.zero_hashes[0] and len(self.levels[0]) < self.leaf_count * 32:
+            return len(self.levels[0]) // 32
+        return None
+
+    def is_member(self, leaf):
+        return self.index(leaf) is not None
+
+    def not_member(self, leaf):
+        return self.index(leaf) is None
@@ -1,4 +1,4 @@
-from ethereum.utils import sha3
+from plasma.utils.keccak import keccak, keccak_many
 
 from .exceptions import MemberNotExistException
 from .node import Node
@@ -18,8 +18,9 @@ class FixedMerkle(object):
             raise ValueError('num of leaves exceed max avaiable num with the depth')
 
         if not hashed:
-            leaves = [sha3(leaf) for leaf in leaves]
+            leaves = keccak_many(leaves)
         self.leaves = leaves + [b'\x00' * 32] * (self.leaf_count - len(leaves))
+        self._leaf_indexes = None
         self.tree = [self.create_nodes(self.leaves)]
         self.create_tree(self.tree[0])
 
@@ -31,46 +32,70 @@ class FixedMerkle(object):
             self.root = leaves[0].data
             return self.root
         next_level = len(leaves)
+        combined = keccak_many([leaves[i].data + leaves[i + 1].data for i in range(0, next_level, 2)])
         tree_level = []
         for i in range(0, next_level, 2):
-            combined = sha3(leaves[i].data + leaves[i + 1].data)
-            next_node = Node(combined, leaves[i], leaves[i + 1])
+            next_node = Node(combined[i // 2], leaves[i], leaves[i + 1])
             tree_level.append(next_node)
         self.tree.append(tree_level)
         self.create_tree(tree_level)
 
     def check_membership(self, leaf, index, proof):
         if not self.hashed:
-            leaf = sha3(leaf)
+            leaf = keccak(leaf)
         computed_hash = leaf
         for i in range(0, self.depth * 32, 32):
             segment = proof[i:i + 32]
             if index % 2 == 0:
-                computed_hash = sha3(computed_hash + segment)
+                computed_hash = keccak(computed_hash + segment)
             else:
-                computed_hash = sha3(segment + computed_hash)
+                computed_hash = keccak(segment + computed_hash)
             index = index // 2
         return computed_hash == self.root
 
+    @property
+    def leaf_indexes(self):
+        """Map of each leaf to its first position, built on first use.
+        """
+
+        if self._leaf_indexes is None:
+            leaf_indexes = {}
+            for index, leaf in enumerate(self.leaves):
+                leaf_indexes.setdefault(leaf, index)
+            self._leaf_indexes = leaf_indexes
+        return self._leaf_indexes
+
     def create_membership_proof(self, leaf):
+        return self.create_membership_proofs([leaf])[0]
+
+    def create_membership_proofs(self, leaves):
+        """Creates membership proofs for many leaves in one pass over the tree.
+
+        Args:
+            leaves (list): Leaves to prove.
+
+        Returns:
+            list: Proof of each leaf, in order.
+        """
+
         if not self.hashed:
-            leaf = sha3(leaf)
-        if not self.is_member(leaf):
-            raise MemberNotExistException('leaf is not in the merkle tree')
+            leaves = keccak_many(leaves)
+        indexes = []
+        for leaf in leaves:
+            index = self.leaf_indexes.get(leaf)
+            if index is None:
+                raise MemberNotExistException('leaf is not in the merkle tree')
+            indexes.append(index)
 
-        index = self.leaves.index(leaf)
-        proof = b''
-        for i in range(0, self.depth, 1):
-            if index % 2 == 0:
-                sibling_index = index + 1
-            else:
-                sibling_index = index - 1
-            index = index // 2
-            proof += self.tree[i][sibling_index].data
-        return proof
+        proofs = [[] for _ in indexes]
+        for level in self.tree[:self.depth]:
+            for i, index in enumerate(indexes):
+                proofs[i].append(level[index ^ 1].data)
+                indexes[i] = index // 2
+        return [b''.join(proof) for proof in proofs]
 
     def is_member(self, leaf):
-        return leaf in self.leaves
+        return leaf in self.leaf_indexes
 
     def not_member(self, leaf):
-        return leaf not in self.leaves
+        return leaf not in self.leaf_indexes
@@ -0,0 +1,74 @@
+from plasma.utils.keccak import keccak
+
+from .zero_hashes import get_zero_hashes
+
+
+class IncrementalMerkle(object):
+    """Append-only merkle tree with the same root as `FixedMerkle`.
+
+    Only the frontier is kept: for each level, the last left child whose
+    right sibling hasn't been filled in yet. Adding a leaf and computing
+    the root both take O(depth) hashes, with empty subtrees taken from a
+    precomputed zero-hash ladder.
+
+    Args:
+        depth (int): Depth of the tree.
+        leaves (list): Leaves to start with.
+        hashed (bool): Whether the leaves are already hashed.
+    """
+
+    def __init__(self, depth, leaves=(), hashed=False):
+        if depth < 1:
+            raise ValueError('depth should be at least 1')
+
+        self.depth = depth
+        self.leaf_count = 2 ** depth
+        self.hashed = hashed
+        self.zero_hashes = get_zero_hashes(depth)
+
+        self.count = 0
+        self.frontier = [None] * depth
+        self._root = None
+
+        for leaf in leaves:
+            self.add(leaf)
+
+    def add(self, leaf):
+        """Appends a leaf.
+
+        Args:
+            leaf (bytes): Leaf to append.
+        """
+
+        if self.count >= self.leaf_count:
+            raise ValueError('num of leaves exceed max avaiable num with the depth')
+        if not self.hashed:
+            leaf = keccak(leaf)
+
+        index = self.count
+        self.count += 1
+        self._root = None
+
+        node = leaf
+        for level in range(self.depth):
+            if index % 2 == 0:
+                self.frontier[level] = node
+                return
+            node = keccak(self.frontier[level] + node)
+            index = index // 2
+        # The last leaf completed the whole tree
+        self._root = node
+
+    @property
+    def root(self):
+        if self._root is None:
+            node = self.zero_hashes[0]
+            size = self.count
+            for level in range(self.depth):
+                if size % 2 == 1:
+                    node = keccak(self.frontier[level] + node)
+                else:
+                    node = keccak(node + self.zero_hashes[level])
+                size = size // 2
+            self._root = node
+        return self._root
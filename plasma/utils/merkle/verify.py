@@ -0,0 +1,66 @@
+from plasma.utils.keccak import keccak, keccak_many
+
+
+def verify_many(root, items, depth=16, hashed=False):
+    """Checks many membership proofs against the same root.
+
+    Gives the same answers as calling `check_membership` on each proof,
+    except that an index outside the tree is never a member. Every node
+    on a path that has been proven, and every sibling along it, is
+    remembered. A later proof only hashes up to the first node already
+    proven and then compares the rest of its segments, so proofs from the
+    same block mostly cost dict lookups rather than hashes.
+
+    Args:
+        root (bytes): Merkle root the proofs should lead to.
+        items (list): (leaf, index, proof) tuples, with proofs as returned
+            by `create_membership_proof`.
+        depth (int): Depth of the tree. Proofs of any other length are invalid.
+        hashed (bool): Whether the leaves are already hashed.
+
+    Returns:
+        list: Whether each proof is valid, in order.
+    """
+
+    items = list(items)
+    if not items:
+        return []
+
+    leaves = [leaf for leaf, _, _ in items]
+    if not hashed:
+        leaves = keccak_many(leaves)
+
+    # (level, index) of each node known to lie under the root, where level 0 holds the leaves
+    proven = {(depth, 0): root}
+
+    results = []
+    for computed_hash, (_, index, proof) in zip(leaves, items):
+        if len(proof) != depth * 32 or not 0 <= index < 2 ** depth:
+            results.append(False)
+            continue
+
+        path = []
+        level = 0
+        while (level, index) not in proven:
+            segment = proof[level * 32:level * 32 + 32]
+            path.append((level, index, computed_hash, segment))
+            if index % 2 == 0:
+                computed_hash = keccak(computed_hash + segment)
+            else:
+                computed_hash = keccak(segment + computed_hash)
+            index = index // 2
+            level += 1
+
+        valid = proven[(level, index)] == computed_hash
+        # Above the first proven node, the proof has to match the siblings already proven
+        while valid and level < depth:
+            valid = proof[level * 32:level * 32 + 32] == proven[(level, index ^ 1)]
+            index = index // 2
+            level += 1
+
+        if valid:
+            for node_level, node_index, node_hash, segment in path:
+                proven[(node_level, node_index)] = node_hash
+                proven[(node_level, node_index ^ 1)] = segment
+        results.append(valid)
+    return results
@@ -0,0 +1,19 @@
+from plasma.utils.keccak import keccak
+
+_zero_hashes = [b'\x00' * 32]
+
+
+def get_zero_hashes(depth):
+    """Returns the roots of empty subtrees of every height up to `depth`.
+
+    Args:
+        depth (int): Height of the tallest subtree.
+
+    Returns:
+        list: `depth + 1` hashes, where entry `i` is the root of an empty
+            subtree of height `i` and entry 0 is an empty leaf.
+    """
+
+    while len(_zero_hashes) <= depth:
+        _zero_hashes.append(keccak(_zero_hashes[-1] + _zero_hashes[-1]))
+    return _zero_hashes[:depth + 1]
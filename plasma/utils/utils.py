@@ -1,11 +1,16 @@
 from ethereum import utils as u
+from plasma.utils.cache import LRUCache
+from plasma.utils.keccak import keccak
 from plasma.utils.merkle.fixed_merkle import FixedMerkle
 
+# Signers recovered by get_sender, keyed by (hash, sig)
+sender_cache = LRUCache(65536)
+
 
 def get_empty_merkle_tree_hash(depth):
     zeroes_hash = b'\x00' * 32
     for i in range(depth):
-        zeroes_hash = u.sha3(zeroes_hash + zeroes_hash)
+        zeroes_hash = keccak(zeroes_hash + zeroes_hash)
     return zeroes_hash
 
 
@@ -21,11 +26,11 @@ ZEROS_BYTES = [b'\x00' * 32]
 
 
 def confirm_tx(tx, root, key):
-    return sign(u.sha3(tx.hash + root), key)
+    return sign(keccak(tx.hash + root), key)
 
 
 def get_deposit_hash(owner, token, value):
-    return u.sha3(owner + token + b'\x00' * 31 + u.int_to_bytes(value))
+    return keccak(owner + token + b'\x00' * 31 + u.int_to_bytes(value))
 
 
 def sign(hash, key):
@@ -36,13 +41,22 @@ def sign(hash, key):
 
 
 def get_sender(hash, sig):
+    key = (hash, sig)
+    sender = sender_cache.get(key)
+    if sender is None:
+        sender = recover_sender(hash, sig)
+        sender_cache.put(key, sender)
+    return sender
+
+
+def recover_sender(hash, sig):
     v = sig[64]
     if v < 27:
         v += 27
     r = u.bytes_to_int(sig[:32])
     s = u.bytes_to_int(sig[32:64])
     pub = u.ecrecover_to_pub(hash, v, r, s)
-    return u.sha3(pub)[-20:]
+    return keccak(pub)[-20:]
 
 
 def unpack_utxo_pos(utxo_pos):
@@ -6,7 +6,6 @@ from web3 import Web3, HTTPProvider
 from plasma.root_chain.deployer import Deployer
 from plasma.child_chain.child_chain import ChildChain
 from plasma.child_chain.transaction import Transaction, UnsignedTransaction
-from plasma.utils.merkle.fixed_merkle import FixedMerkle
 from plasma.utils.utils import confirm_tx
 from .constants import AUTHORITY, ACCOUNTS, NULL_ADDRESS, NULL_ADDRESS_HEX
 
@@ -101,6 +100,7 @@ class TestingLanguage(object):
         if signatory is not None:
             signing_key = signatory['key']
 
+        self.child_chain.assemble_block()
         block = self.child_chain.current_block
         block.make_mutable()
         if signing_key:
@@ -115,7 +115,7 @@ class TestingLanguage(object):
         encoded_tx = rlp.encode(tx).hex()
 
         blknum, _ = self.child_chain.get_tx_pos(encoded_tx)
-        block_root = self.child_chain.blocks[blknum].merkle.root
+        block_root = self.child_chain.blocks[blknum].root
 
         confirm_sigs = b''
         for signatory in [x for x in [signatory1, signatory2] if x is not None]:
@@ -141,10 +141,7 @@ class TestingLanguage(object):
                 'from': exitor['address']
             }).startDepositExit(utxo_pos + 1, NULL_ADDRESS_HEX, deposit_amount)
         else:
-            output_block = self.child_chain.blocks[blknum]
-            hashed_transaction_set = [transaction.merkle_hash for transaction in output_block.transaction_set]
-            merkle = FixedMerkle(16, hashed_transaction_set, hashed=True)
-            proof = merkle.create_membership_proof(tx.merkle_hash)
+            proof = bytes.fromhex(self.child_chain.get_proof(blknum, txindex))
 
             self.root_chain.transact({
                 'from': exitor['address']
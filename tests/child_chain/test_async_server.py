@@ -0,0 +1,112 @@
+import asyncio
+import json
+import pytest
+from jsonrpc import Dispatcher
+from plasma.child_chain.async_server import AsyncServer
+
+
+@pytest.fixture
+def server():
+    dispatcher = Dispatcher()
+    dispatcher['add'] = lambda a, b: a + b
+    binary_dispatcher = {'echo': lambda body: body}
+    return AsyncServer(dispatcher, binary_dispatcher, workers=2, max_body_size=1024)
+
+
+async def request(reader, writer, path, body, method='POST', headers=''):
+    writer.write('{} {} HTTP/1.1\r\nContent-Length: {}\r\n{}\r\n'.format(method, path, len(body), headers).encode() + body)
+    return await read_response(reader)
+
+
+async def read_response(reader):
+    head = (await reader.readuntil(b'\r\n\r\n')).decode().split('\r\n')
+    response_headers = dict(line.lower().split(': ', 1) for line in head[1:] if line)
+    content = await reader.readexactly(int(response_headers['content-length']))
+    return int(head[0].split(' ')[1]), response_headers, content
+
+
+def run(server, client):
+    async def main():
+        listener = await server.start('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            return await client(reader, writer)
+        finally:
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+    return asyncio.run(main())
+
+
+def test_keeps_connection_alive(server):
+    async def client(reader, writer):
+        responses = []
+        for a in range(3):
+            payload = json.dumps({'method': 'add', 'params': [a, 1], 'jsonrpc': '2.0', 'id': a}).encode()
+            responses.append(await request(reader, writer, '/', payload))
+        return responses
+
+    responses = run(server, client)
+    assert [json.loads(content)['result'] for _, _, content in responses] == [1, 2, 3]
+    assert all(status == 200 and headers['connection'] == 'keep-alive' for status, headers, _ in responses)
+
+
+def test_binary_endpoint(server):
+    async def client(reader, writer):
+        return [await request(reader, writer, '/binary/echo', b'\x01\x02'),
+                await request(reader, writer, '/binary/missing', b'')]
+
+    (status, headers, content), (missing_status, _, _) = run(server, client)
+    assert status == 200
+    assert headers['content-type'] == 'application/octet-stream'
+    assert content == b'\x01\x02'
+    assert missing_status == 404
+
+
+def test_json_errors(server):
+    async def client(reader, writer):
+        return await request(reader, writer, '/', b'\xff not json')
+
+    status, _, content = run(server, client)
+    assert status == 200
+    assert json.loads(content)['error']['code'] == -32700
+
+
+@pytest.mark.parametrize('method,body,extra_headers,expected_status', [
+    ('GET', b'', '', 405),
+    ('POST', b'x' * 2048, '', 413),
+    ('POST', b'', 'Content-Length: -1\r\n', 400),
+])
+def test_rejects_requests(server, method, body, extra_headers, expected_status):
+    async def client(reader, writer):
+        # A repeated header replaces the earlier one, e.g. to send a negative Content-Length
+        status, headers, _ = await request(reader, writer, '/', body, method, extra_headers)
+        closed = await reader.read() == b''
+        return status, headers, closed
+
+    status, headers, closed = run(server, client)
+    assert status == expected_status
+    assert headers['connection'] == 'close'
+    assert closed
+
+
+def test_body_timeout():
+    server = AsyncServer(Dispatcher(), {}, workers=1, keepalive_timeout=0.05, body_timeout=0.2)
+
+    async def client(reader, writer):
+        # A body that arrives after the keep-alive timeout is still read
+        writer.write(b'POST /binary/missing HTTP/1.1\r\nContent-Length: 4\r\n\r\nab')
+        await asyncio.sleep(0.1)
+        writer.write(b'cd')
+        status, _, _ = await read_response(reader)
+
+        # One that never completes is answered with 408
+        writer.write(b'POST /binary/missing HTTP/1.1\r\nContent-Length: 4\r\n\r\nab')
+        timeout_status, headers, _ = await read_response(reader)
+        return status, timeout_status, headers
+
+    status, timeout_status, headers = run(server, client)
+    assert status == 404
+    assert timeout_status == 408
+    assert headers['connection'] == 'close'
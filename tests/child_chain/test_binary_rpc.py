@@ -0,0 +1,99 @@
+from urllib.parse import urlparse
+import requests
+import rlp
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Request, Response
+from plasma.child_chain.binary_rpc import BINARY_MIMETYPE, handle_binary_request, make_binary_dispatcher
+from plasma.child_chain.rpc import make_application, make_dispatcher
+from plasma.child_chain.transaction import Transaction
+from plasma.client.child_chain_service import ChildChainService
+
+NULL_ADDRESS = b'\x00' * 20
+
+
+@pytest.fixture
+def client(test_lang):
+    binary_dispatcher = make_binary_dispatcher(test_lang.child_chain)
+
+    @Request.application
+    def application(request):
+        return handle_binary_request(binary_dispatcher, request)
+    return Client(application, Response)
+
+
+def test_get_block_and_transaction(test_lang, client):
+    owner = test_lang.get_account()
+    test_lang.deposit(owner, 100)
+
+    response = client.post('/binary/get_block', data=rlp.encode([1]))
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == BINARY_MIMETYPE
+    assert response.data == bytes.fromhex(test_lang.child_chain.get_block(1))
+
+    response = client.post('/binary/get_transaction', data=rlp.encode([1, 0]))
+    assert response.data == bytes.fromhex(test_lang.child_chain.get_transaction(1, 0))
+
+
+def test_apply_transaction(test_lang, client):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+    test_lang.deposit(owner_1, 100)
+
+    tx = Transaction(1, 0, 0, 0, 0, 0, NULL_ADDRESS, owner_2['address'], 100, NULL_ADDRESS, 0)
+    tx.sign1(owner_1['key'])
+    response = client.post('/binary/apply_transaction', data=rlp.encode(tx))
+    assert response.status_code == 200
+    assert response.data == b''
+    assert tx.hash in test_lang.child_chain.mempool.entries
+
+    response = client.post('/binary/apply_transaction', data=rlp.encode(tx))
+    assert response.status_code == 500
+    assert response.headers['Content-Type'] == BINARY_MIMETYPE
+
+
+def test_unknown_method(client):
+    response = client.post('/binary/get_balance', data=b'')
+    assert response.status_code == 404
+    assert response.headers['Content-Type'] == BINARY_MIMETYPE
+
+
+def test_get_block_range(test_lang, client):
+    owner = test_lang.get_account()
+    test_lang.deposit(owner, 100)
+
+    response = client.post('/binary/get_block_range', data=rlp.encode([1, 0, 10]))
+    assert response.status_code == 200
+    assert response.data == bytes.fromhex(test_lang.child_chain.get_transaction(1, 0))
+
+    response = client.post('/binary/get_block_range', data=rlp.encode([1, 1, 10]))
+    assert response.data == b''
+
+
+def test_service_uses_binary_endpoint(test_lang, monkeypatch):
+    child_chain = test_lang.child_chain
+    server = Client(make_application(make_dispatcher(child_chain), make_binary_dispatcher(child_chain)), Response)
+    paths = []
+
+    def post(url, data=None, json=None, headers=None):
+        path = urlparse(url).path
+        paths.append(path)
+        if json is not None:
+            server_response = server.post(path, data=requests.compat.json.dumps(json), content_type='application/json')
+        else:
+            server_response = server.post(path, data=data, headers=headers)
+        response = requests.Response()
+        response.status_code = server_response.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(server_response.headers)
+        response._content = server_response.data
+        return response
+    monkeypatch.setattr(requests, 'post', post)
+
+    owner = test_lang.get_account()
+    test_lang.deposit(owner, 100)
+
+    # The client's default URL points at the JSON-RPC path, not the server's root
+    service = ChildChainService('http://localhost:8546/jsonrpc')
+    assert service.get_encoded_block(1) == bytes.fromhex(child_chain.get_block(1))
+    assert service.binary is True
+    assert paths == ['/binary/get_block']
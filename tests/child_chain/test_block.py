@@ -1,5 +1,7 @@
 import pytest
+import rlp
 from plasma.child_chain.block import Block
+from plasma.child_chain.transaction import Transaction
 from plasma.utils.utils import sign, get_sender
 
 
@@ -18,3 +20,34 @@ def test_signature(t, block):
     block.sign(t.k0)
     assert block.sig == sign(block.hash, t.k0)
     assert block.sender == get_sender(block.hash, sign(block.hash, t.k0))
+
+
+def test_memoized_hash_follows_changes(t, block):
+    unsigned_hash = block.hash
+    block.sign(t.k0)
+    assert block.hash == unsigned_hash
+    assert block.sender == t.a0
+
+    block.add_transaction(Transaction(1, 0, 0, 0, 0, 0, b'\x00' * 20, t.a1, 100, t.a2, 0))
+    assert block.hash != unsigned_hash
+    assert block.sender != t.a0
+
+    block.sign(t.k0)
+    assert block.sender == t.a0
+
+
+def test_root_follows_added_transactions(t, block):
+    assert block.root == block.merklize_transaction_set()
+
+    for amount in range(1, 4):
+        block.add_transaction(Transaction(1, 0, 0, 0, 0, 0, b'\x00' * 20, t.a1, amount, t.a2, 0))
+        assert block.root == block.merklize_transaction_set()
+
+
+def test_encode_matches_rlp(t, block):
+    assert block.encode() == rlp.encode(block)
+
+    for amount in range(1, 4):
+        block.add_transaction(Transaction(1, 0, 0, 0, 0, 0, b'\x00' * 20, t.a1, amount, t.a2, 0))
+    block.sign(t.k0)
+    assert block.encode() == rlp.encode(block)
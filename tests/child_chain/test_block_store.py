@@ -0,0 +1,68 @@
+import pytest
+from plasma.child_chain.block import Block
+from plasma.child_chain.block_store import LevelDBBlockStore, MemoryBlockStore
+from plasma.child_chain.transaction import Transaction
+
+
+NULL_ADDRESS = b'\x00' * 20
+
+
+@pytest.fixture
+def block():
+    tx = Transaction(0, 0, 0, 0, 0, 0, NULL_ADDRESS, b'\x01' * 20, 100, NULL_ADDRESS, 0)
+    return Block([tx])
+
+
+@pytest.fixture(params=['memory', 'leveldb'])
+def store(request, tmpdir):
+    if request.param == 'memory':
+        store = MemoryBlockStore()
+    else:
+        store = LevelDBBlockStore(str(tmpdir.join('db')), cache_size=1)
+    yield store
+    store.close()
+
+
+def test_put_and_get(store, block):
+    store[1] = block
+    assert 1 in store
+    assert 2 not in store
+    assert store[1].transaction_set[0].hash == block.transaction_set[0].hash
+    with pytest.raises(KeyError):
+        store[2]
+
+
+def test_iterates_in_block_order(store, block):
+    for blknum in [2000, 1, 1000]:
+        store[blknum] = block
+    assert list(store) == [1, 1000, 2000]
+    assert len(store) == 3
+
+
+def test_leveldb_store_persists_blocks_and_spends(tmpdir, block):
+    path = str(tmpdir.join('db'))
+    store = LevelDBBlockStore(path)
+    store[1] = block
+    store.put_spent(1, b'\x01')
+    store.close()
+
+    store = LevelDBBlockStore(path)
+    assert store[1].transaction_set[0].hash == block.transaction_set[0].hash
+    assert list(store.spent_bitmaps()) == [(1, b'\x01')]
+    store.close()
+
+
+def test_archive(store, block):
+    store[1] = block
+    store[2] = block
+    store.archive(1)
+    store.archive(3)
+
+    assert 1 in store
+    assert list(store) == [1, 2]
+    assert store[1].transaction_set[0].hash == block.transaction_set[0].hash
+    assert store[1].transaction_set[0].hash == block.transaction_set[0].hash
+
+    stats = store.stats()
+    assert stats['hot']['blocks'] == 1
+    assert stats['cold']['blocks'] == 1
@@ -0,0 +1,78 @@
+import pytest
+from plasma.child_chain.block import Block
+from plasma.child_chain.block_store import MemoryBlockStore
+from plasma.child_chain.checkpoint import Checkpointer
+from plasma.child_chain.transaction import Transaction
+from plasma.child_chain.utxo_index import UtxoIndex
+
+
+NULL_ADDRESS = b'\x00' * 20
+
+
+class ChainState(object):
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.tx_index = {}
+        self.utxo_index = UtxoIndex()
+        self.current_block_number = 1000
+        self.root_chain_heights = {'Deposit': 0, 'ExitStarted': 0}
+
+    def add_block(self, blknum, owner, amount):
+        tx = Transaction(0, 0, 0, 0, 0, 0, NULL_ADDRESS, owner, amount, NULL_ADDRESS, 0)
+        self.blocks[blknum] = Block([tx])
+        self.tx_index[tx.hash] = (blknum, 0)
+        self.utxo_index.add_transaction(blknum, 0, tx)
+
+
+@pytest.fixture
+def blocks():
+    return MemoryBlockStore()
+
+
+def restore(directory, blocks):
+    restored = ChainState(blocks)
+    covered = Checkpointer(directory).load(restored)
+    return restored, covered
+
+
+def test_no_checkpoint(tmpdir, blocks):
+    restored, covered = restore(str(tmpdir), blocks)
+    assert covered == set()
+    assert restored.tx_index == {}
+
+
+def test_restores_full_and_delta_checkpoints(tmpdir, blocks):
+    state = ChainState(blocks)
+    checkpointer = Checkpointer(str(tmpdir), interval=1, full_interval=10)
+
+    state.add_block(1, b'\x01' * 20, 100)
+    state.root_chain_heights = {'Deposit': 5, 'ExitStarted': 3}
+    checkpointer.block_committed(state)
+
+    state.add_block(1000, b'\x02' * 20, 50)
+    state.current_block_number = 2000
+    state.root_chain_heights = {'Deposit': 9, 'ExitStarted': 4}
+    checkpointer.block_committed(state)
+    assert len(tmpdir.listdir()) == 2
+
+    restored, covered = restore(str(tmpdir), blocks)
+    assert covered == {1, 1000}
+    assert restored.tx_index == state.tx_index
+    assert restored.utxo_index.outputs == state.utxo_index.outputs
+    assert restored.current_block_number == 2000
+    assert restored.root_chain_heights == {'Deposit': 9, 'ExitStarted': 4}
+
+
+def test_full_checkpoint_replaces_older_files(tmpdir, blocks):
+    state = ChainState(blocks)
+    checkpointer = Checkpointer(str(tmpdir), interval=1, full_interval=2)
+
+    for blknum in range(1, 4):
+        state.add_block(blknum, b'\x01' * 20, blknum)
+        checkpointer.block_committed(state)
+
+    assert [path.basename for path in tmpdir.listdir()] == ['checkpoint-0000000003']
+    restored, covered = restore(str(tmpdir), blocks)
+    assert covered == {1, 2, 3}
+    assert restored.utxo_index.outputs == state.utxo_index.outputs
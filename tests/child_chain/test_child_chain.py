@@ -1,7 +1,14 @@
+import threading
+import rlp
 import pytest
+from plasma.child_chain.transaction import Transaction
 from plasma.child_chain.exceptions import (InvalidBlockSignatureException,
+                                           InvalidTxInputException,
                                            InvalidTxSignatureException,
-                                           TxAlreadySpentException)
+                                           TxAlreadySpentException,
+                                           TxFeeTooLowException)
+
+NULL_ADDRESS = b'\x00' * 20
 
 
 def test_apply_deposit(test_lang):
@@ -55,6 +62,30 @@ def test_send_tx_double_spend(test_lang):
         test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
 
 
+def test_send_tx_invalid_input(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+
+    def make_tx(oindex1, blknum2=0, oindex2=0):
+        tx = Transaction(deposit_id, 0, oindex1,
+                         blknum2, 0, oindex2,
+                         NULL_ADDRESS,
+                         owner_2['address'], 100,
+                         NULL_ADDRESS, 0)
+        tx.sign1(owner_1['key'])
+        tx.sign2(owner_1['key'])
+        return tx
+
+    # An oindex past 1 would mark a different bit than the output it pays out
+    for tx in [make_tx(3), make_tx(0, deposit_id, 0)]:
+        with pytest.raises(InvalidTxInputException):
+            test_lang.child_chain.apply_transaction(rlp.encode(tx).hex())
+    assert len(test_lang.child_chain.mempool) == 0
+    assert not test_lang.child_chain.is_spent(deposit_id, 0, 0)
+
+
 def test_submit_block(test_lang):
     old_block_number = test_lang.child_chain.current_block_number
     test_lang.submit_block()
@@ -71,3 +102,282 @@ def test_submit_block_invalid_sig(test_lang):
 
     with pytest.raises(InvalidBlockSignatureException):
         test_lang.submit_block(owner_1)
+
+
+def test_get_tx_pos(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    transfer_id = test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+
+    encoded_deposit = rlp.encode(test_lang.transactions[deposit_id]['tx']).hex()
+    encoded_transfer = rlp.encode(test_lang.transactions[transfer_id]['tx']).hex()
+    assert test_lang.child_chain.get_tx_pos(encoded_deposit) == (1, 0)
+    assert test_lang.child_chain.get_tx_pos(encoded_transfer) == (None, None)
+
+    blknum = test_lang.child_chain.current_block_number
+    test_lang.submit_block()
+    assert test_lang.child_chain.get_tx_pos(encoded_transfer) == (blknum, 0)
+
+
+def test_get_utxos(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    assert test_lang.child_chain.get_utxos(owner_1['address']) == [
+        {'blknum': 1, 'txindex': 0, 'oindex': 0, 'token': '0x' + '00' * 20, 'amount': 100}
+    ]
+
+    test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    test_lang.child_chain.assemble_block()
+    assert test_lang.child_chain.get_utxos(owner_1['address']) == []
+    assert test_lang.child_chain.get_balance(owner_2['address']) == 0
+
+    blknum = test_lang.child_chain.current_block_number
+    test_lang.submit_block()
+    assert test_lang.child_chain.get_utxos(owner_2['address']) == [
+        {'blknum': blknum, 'txindex': 0, 'oindex': 0, 'token': '0x' + '00' * 20, 'amount': 100}
+    ]
+    assert test_lang.child_chain.get_balance(owner_2['address']) == 100
+
+
+def test_archives_spent_blocks(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    assert test_lang.child_chain.get_storage_stats()['cold']['blocks'] == 0
+
+    test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    test_lang.child_chain.assemble_block()
+    assert test_lang.child_chain.get_storage_stats()['cold']['blocks'] == 1
+    assert len(test_lang.child_chain.blocks[1].transaction_set) == 1
+
+
+def test_persists_spends_on_commit(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    test_lang.child_chain.assemble_block()
+    assert test_lang.child_chain.is_spent(deposit_id, 0, 0)
+    assert not test_lang.child_chain.persisted_spent_outputs.is_spent(deposit_id, 0, 0)
+
+    test_lang.submit_block()
+    assert test_lang.child_chain.persisted_spent_outputs.is_spent(deposit_id, 0, 0)
+
+
+def test_assembles_block_by_fee(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_1 = test_lang.deposit(owner_1, 100)
+    deposit_2 = test_lang.deposit(owner_1, 100)
+    low_fee_id = test_lang.transfer(deposit_1, 0, owner_2, 99, owner_1)
+    high_fee_id = test_lang.transfer(deposit_2, 0, owner_2, 90, owner_1)
+    assert len(test_lang.child_chain.mempool) == 2
+
+    test_lang.child_chain.assemble_block()
+    transaction_set = test_lang.child_chain.current_block.transaction_set
+    assert [tx.hash for tx in transaction_set] == [test_lang.transactions[high_fee_id]['tx'].hash,
+                                                   test_lang.transactions[low_fee_id]['tx'].hash]
+    assert len(test_lang.child_chain.mempool) == 0
+
+
+def test_replace_pending_tx(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    test_lang.transfer(deposit_id, 0, owner_2, 99, owner_1)
+
+    with pytest.raises(TxFeeTooLowException):
+        test_lang.transfer(deposit_id, 0, owner_2, 99, owner_1)
+
+    replacement_id = test_lang.transfer(deposit_id, 0, owner_2, 95, owner_1)
+    test_lang.child_chain.assemble_block()
+    transaction_set = test_lang.child_chain.current_block.transaction_set
+    assert [tx.hash for tx in transaction_set] == [test_lang.transactions[replacement_id]['tx'].hash]
+
+
+def test_concurrent_double_spend(test_lang):
+    owner_1 = test_lang.get_account()
+    deposit_id = test_lang.deposit(owner_1, 100)
+    recipients = [test_lang.get_account() for _ in range(8)]
+
+    accepted = []
+    rejected = []
+
+    def transfer(recipient):
+        try:
+            accepted.append(test_lang.transfer(deposit_id, 0, recipient, 100, owner_1))
+        except TxAlreadySpentException:
+            rejected.append(recipient)
+
+    threads = [threading.Thread(target=transfer, args=(recipient,)) for recipient in recipients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(accepted) == 1
+    assert len(rejected) == 7
+    assert len(test_lang.child_chain.mempool) == 1
+
+
+def test_apply_transactions(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    test_lang.deposit(owner_1, 100)
+    test_lang.deposit(owner_1, 100)
+
+    def make_tx(blknum, amount, key):
+        tx = Transaction(blknum, 0, 0,
+                         0, 0, 0,
+                         NULL_ADDRESS,
+                         owner_2['address'], amount,
+                         NULL_ADDRESS, 0)
+        tx.sign1(key)
+        return rlp.encode(tx).hex()
+
+    results = test_lang.child_chain.apply_transactions([
+        make_tx(1, 100, owner_1['key']),
+        'not a transaction',
+        make_tx(2, 100, owner_2['key']),
+        make_tx(2, 101, owner_1['key']),
+        make_tx(2, 100, owner_1['key']),
+    ])
+
+    assert [result['success'] for result in results] == [True, False, False, False, True]
+    assert results[2]['error'] == 'InvalidTxSignatureException'
+    assert results[3]['error'] == 'TxAmountMismatchException'
+    assert len(test_lang.child_chain.mempool) == 2
+
+
+def test_apply_transactions_undecodable(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    empty_address = rlp.encode([deposit_id, 0, 0, 0, 0, 0, NULL_ADDRESS, b'', 100, NULL_ADDRESS, 0,
+                                b'\x00' * 65, b'\x00' * 65]).hex()
+    tx = Transaction(deposit_id, 0, 0,
+                     0, 0, 0,
+                     NULL_ADDRESS,
+                     owner_2['address'], 100,
+                     NULL_ADDRESS, 0)
+    tx.sign1(owner_1['key'])
+
+    out_of_range = Transaction(2 ** 64, 0, 0, 0, 0, 0, NULL_ADDRESS, owner_2['address'], 100, NULL_ADDRESS, 0)
+    out_of_range.sign1(owner_1['key'])
+
+    results = test_lang.child_chain.apply_transactions([1234, empty_address, rlp.encode(out_of_range).hex(),
+                                                        rlp.encode(tx).hex()])
+
+    assert [result['success'] for result in results] == [False, False, False, True]
+    assert results[0]['error'] == 'TypeError'
+    assert results[2]['error'] == 'InvalidTxInputException'
+    assert len(test_lang.child_chain.mempool) == 1
+
+
+def test_get_proof(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    transfer_id = test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    blknum = test_lang.child_chain.current_block_number
+    test_lang.submit_block()
+
+    tx = test_lang.transactions[transfer_id]['tx']
+    block = test_lang.child_chain.blocks[blknum]
+    block.merklize_transaction_set()
+    proof = test_lang.child_chain.get_proof(blknum, 0)
+    assert bytes.fromhex(proof) == block.merkle.create_membership_proof(tx.merkle_hash)
+    assert test_lang.child_chain.get_block_root(blknum) == block.root.hex()
+    assert test_lang.child_chain.get_cache_stats()['proofs']['size'] == 1
+
+    with pytest.raises(IndexError):
+        test_lang.child_chain.get_proof(blknum, 1)
+
+
+def test_serves_cached_encodings(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    blknum = test_lang.child_chain.current_block_number
+    test_lang.submit_block()
+
+    child_chain = test_lang.child_chain
+    block = child_chain.blocks[blknum]
+    assert child_chain.get_block(blknum) == rlp.encode(block).hex()
+    assert child_chain.get_block(blknum) is child_chain.get_block(blknum)
+    assert child_chain.get_transaction(blknum, 0) == rlp.encode(block.transaction_set[0]).hex()
+    assert child_chain.get_transaction(blknum, 0) is child_chain.get_transaction(blknum, 0)
+
+    # The block was cached when it was committed, and transactions have their own cache
+    stats = child_chain.get_cache_stats()
+    assert stats['encoded_blocks']['misses'] == 0
+    assert stats['encoded_blocks']['hits'] == 3
+    assert stats['encoded_transactions']['misses'] == 1
+    assert stats['encoded_transactions']['hits'] == 2
+
+
+def test_get_block_range(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+
+    for _ in range(3):
+        deposit_id = test_lang.deposit(owner_1, 100)
+        test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    blknum = test_lang.child_chain.current_block_number
+    test_lang.submit_block()
+
+    child_chain = test_lang.child_chain
+    encoded_txs = [child_chain.get_transaction(blknum, txindex) for txindex in range(3)]
+    assert child_chain.get_block_range(blknum) == encoded_txs
+    assert child_chain.get_block_range(blknum, 1, 1) == encoded_txs[1:2]
+    assert child_chain.get_block_range(blknum, 2, 5) == encoded_txs[2:]
+    assert child_chain.get_block_range(blknum, 3, 5) == []
+
+    with pytest.raises(ValueError):
+        child_chain.get_block_range(blknum, -1, 5)
+
+
+def test_get_current_block_since(test_lang):
+    owner_1 = test_lang.get_account()
+    owner_2 = test_lang.get_account()
+    child_chain = test_lang.child_chain
+    blknum = child_chain.current_block_number
+
+    delta = child_chain.get_current_block_since(0, 0)
+    assert delta['blknum'] == blknum
+    assert delta['txcount'] == 0
+    assert delta['transactions'] == []
+
+    for _ in range(2):
+        deposit_id = test_lang.deposit(owner_1, 100)
+        test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    delta = child_chain.get_current_block_since(blknum, 0)
+    assert delta['txcount'] == 2
+    assert delta['root'] == child_chain.current_block.root.hex()
+    assert delta['transactions'] == [rlp.encode(tx).hex() for tx in child_chain.current_block.transaction_set]
+
+    deposit_id = test_lang.deposit(owner_1, 100)
+    test_lang.transfer(deposit_id, 0, owner_2, 100, owner_1)
+    delta = child_chain.get_current_block_since(blknum, 2)
+    assert delta['start'] == 2
+    assert delta['txcount'] == 3
+    assert delta['transactions'] == [rlp.encode(child_chain.current_block.transaction_set[2]).hex()]
+
+    test_lang.submit_block()
+    delta = child_chain.get_current_block_since(blknum, 3)
+    assert delta['blknum'] == blknum + child_chain.child_block_interval
+    assert delta['start'] == 0
+    assert delta['txcount'] == 0
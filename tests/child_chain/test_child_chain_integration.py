@@ -37,6 +37,7 @@ def test_transfer(test_lang):
                      0)
 
     assert test_lang.transactions[transfer_id]['tx'].hash == tx.hash
+    test_lang.child_chain.assemble_block()
     assert test_lang.child_chain.current_block.transaction_set[0].hash == tx.hash
 
 
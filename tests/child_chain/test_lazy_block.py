@@ -0,0 +1,60 @@
+import pytest
+import rlp
+from plasma.child_chain.block import Block
+from plasma.child_chain.lazy_block import LazyBlock
+from plasma.child_chain.transaction import Transaction
+
+
+@pytest.fixture
+def block(t):
+    block = Block()
+    for amount in range(1, 4):
+        tx = Transaction(1, amount, 0, 0, 0, 0, b'\x00' * 20, t.a1, amount, t.a2, 0)
+        tx.sign1(t.k0)
+        block.add_transaction(tx)
+    block.sign(t.k0)
+    return block
+
+
+def test_matches_decoded_block(t, block):
+    lazy_block = LazyBlock(rlp.encode(block))
+    assert lazy_block.sig == block.sig
+    assert lazy_block.hash == block.hash
+    assert lazy_block.sender == t.a0
+    assert lazy_block.root == block.root
+    assert lazy_block.merkle_hashes == [tx.merkle_hash for tx in block.transaction_set]
+    assert rlp.encode(lazy_block.decode()) == rlp.encode(block)
+
+
+def test_decodes_transactions_on_access(block):
+    lazy_block = LazyBlock(rlp.encode(block))
+    transaction_set = lazy_block.transaction_set
+    assert len(transaction_set) == 3
+    assert transaction_set.decoded == [None] * 3
+
+    assert transaction_set[1].hash == block.transaction_set[1].hash
+    assert transaction_set[1] is transaction_set[1]
+    assert transaction_set.decoded[0] is None
+    assert transaction_set.raw(2) == rlp.encode(block.transaction_set[2])
+    assert [tx.amount1 for tx in transaction_set] == [1, 2, 3]
+    assert [tx.amount1 for tx in transaction_set[-2:]] == [2, 3]
+
+
+def test_empty_block():
+    block = Block()
+    lazy_block = LazyBlock(rlp.encode(block))
+    assert len(lazy_block.transaction_set) == 0
+    assert lazy_block.hash == block.hash
+    assert lazy_block.root == block.root
+
+
+def test_malformed_block(block):
+    encoded_block = rlp.encode(block)
+    with pytest.raises(rlp.DecodingError):
+        LazyBlock(encoded_block + b'\x00')
+    with pytest.raises(rlp.DecodingError):
+        LazyBlock(encoded_block[:-1])
+    with pytest.raises(rlp.DecodingError):
+        LazyBlock(rlp.encode([b'', b'']))
+    with pytest.raises(rlp.DecodingError):
+        LazyBlock(rlp.encode([[]]))
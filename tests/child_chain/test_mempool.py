@@ -0,0 +1,60 @@
+import pytest
+from plasma.child_chain.exceptions import MempoolFullException, TxFeeTooLowException
+from plasma.child_chain.mempool import Mempool
+from plasma.child_chain.transaction import Transaction
+
+NULL_ADDRESS = b'\x00' * 20
+OWNER = b'\x01' * 20
+
+
+def make_tx(blknum, amount):
+    return Transaction(blknum, 0, 0,
+                       0, 0, 0,
+                       NULL_ADDRESS,
+                       OWNER, amount,
+                       NULL_ADDRESS, 0)
+
+
+def test_pop_best_by_fee():
+    mempool = Mempool()
+    mempool.add(make_tx(1, 100), 1)
+    mempool.add(make_tx(2, 100), 5)
+    mempool.add(make_tx(3, 100), 5)
+    mempool.add(make_tx(4, 100), 3)
+
+    popped = [mempool.pop_best().tx.blknum1 for _ in range(4)]
+    assert popped == [2, 3, 4, 1]
+    assert mempool.pop_best() is None
+
+
+def test_replace_conflicting_tx():
+    mempool = Mempool()
+    mempool.add(make_tx(1, 100), 1)
+
+    with pytest.raises(TxFeeTooLowException):
+        mempool.add(make_tx(1, 99), 1)
+
+    replacement = make_tx(1, 98)
+    mempool.add(replacement, 2)
+    assert len(mempool) == 1
+    assert mempool.pop_best().tx_hash == replacement.hash
+
+
+def test_evicts_lowest_fee_when_full():
+    mempool = Mempool(max_size=2)
+    mempool.add(make_tx(1, 100), 1)
+    mempool.add(make_tx(2, 100), 2)
+
+    with pytest.raises(MempoolFullException):
+        mempool.add(make_tx(3, 100), 1)
+
+    mempool.add(make_tx(3, 100), 3)
+    assert [tx.blknum1 for tx in mempool] == [2, 3]
+
+
+def test_remove_spender():
+    mempool = Mempool()
+    mempool.add(make_tx(1, 100), 1)
+    mempool.remove_spender(1, 0, 0)
+    assert len(mempool) == 0
+    assert mempool.pop_best() is None
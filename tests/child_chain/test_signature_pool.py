@@ -0,0 +1,42 @@
+import rlp
+import pytest
+from plasma.child_chain.signature_pool import SignaturePool, recover_senders
+from plasma.child_chain.transaction import Transaction
+from plasma.utils.utils import sender_cache
+
+
+@pytest.fixture
+def signature_pool():
+    pool = SignaturePool(workers=2, chunk_size=2)
+    yield pool
+    pool.close()
+
+
+def make_tx(t, amount):
+    return Transaction(1, 0, 0,
+                       2, 0, 0,
+                       b'\x00' * 20,
+                       t.a1, amount,
+                       t.a2, 0)
+
+
+def test_recover_senders(t):
+    signed = make_tx(t, 100)
+    signed.sign1(t.k1)
+    signed.sign2(t.k2)
+    unsigned = make_tx(t, 100)
+
+    senders = recover_senders([rlp.encode(tx) for tx in [signed, unsigned]])
+    assert senders == [(t.a1, t.a2), (None, None)]
+
+
+def test_recover_in_order(t, signature_pool):
+    txs = []
+    for amount in range(5):
+        tx = make_tx(t, amount)
+        tx.sign1(t.k1 if amount % 2 == 0 else t.k2)
+        txs.append(tx)
+
+    senders = signature_pool.recover([rlp.encode(tx) for tx in txs])
+    assert [sender1 for sender1, _ in senders] == [t.a1, t.a2, t.a1, t.a2, t.a1]
+    assert sender_cache.get((txs[1].hash, txs[1].sig1)) == t.a2
@@ -0,0 +1,28 @@
+from plasma.child_chain.spent_outputs import SpentOutputs
+
+
+def test_mark_spent():
+    spent_outputs = SpentOutputs()
+    assert spent_outputs.is_spent(1000, 3, 1) is False
+
+    spent_outputs.mark_spent(1000, 3, 1)
+    assert spent_outputs.is_spent(1000, 3, 1) is True
+    assert spent_outputs.is_spent(1000, 3, 0) is False
+    assert spent_outputs.is_spent(1000, 4, 1) is False
+    assert spent_outputs.is_spent(2000, 3, 1) is False
+
+
+def test_bitmap_layout():
+    spent_outputs = SpentOutputs()
+    spent_outputs.mark_spent(1000, 0, 1)
+    bitmap = spent_outputs.mark_spent(1000, 4, 0)
+    assert bytes(bitmap) == b'\x02\x01'
+    assert spent_outputs.count_spent(1000) == 2
+    assert spent_outputs.nbytes() == 2
+
+
+def test_load():
+    spent_outputs = SpentOutputs()
+    spent_outputs.load(1, b'\x01')
+    assert spent_outputs.is_spent(1, 0, 0) is True
+    assert spent_outputs.is_spent(1, 0, 1) is False
@@ -29,3 +29,25 @@ def test_transaction(t):
     assert tx.sender1 == oldowner1
     tx.sign2(key2)
     assert tx.sender2 == oldowner2
+
+
+def test_memoized_values_follow_changes(t):
+    tx = Transaction(1, 0, 0,
+                     0, 0, 0,
+                     b'\x00' * 20,
+                     t.a1, 100,
+                     t.a2, 0)
+    unsigned_hash = tx.hash
+    unsigned_merkle_hash = tx.merkle_hash
+
+    tx.sign1(t.k1)
+    assert tx.hash == unsigned_hash
+    assert tx.merkle_hash != unsigned_merkle_hash
+    assert tx.sender1 == t.a1
+
+    tx.sign1(t.k2)
+    assert tx.sender1 == t.a2
+
+    tx.amount1 = 50
+    assert tx.hash != unsigned_hash
+    assert tx.sender1 != t.a2
@@ -0,0 +1,67 @@
+import pytest
+from plasma.child_chain.transaction import Transaction
+from plasma.child_chain.utxo_index import UtxoIndex
+from plasma.utils.utils import pack_utxo_pos
+
+
+NULL_ADDRESS = b'\x00' * 20
+OWNER_1 = b'\x01' * 20
+OWNER_2 = b'\x02' * 20
+TOKEN = b'\x03' * 20
+
+
+@pytest.fixture
+def utxo_index():
+    return UtxoIndex()
+
+
+def test_add_transaction(utxo_index):
+    tx = Transaction(1, 0, 0, 0, 0, 0, NULL_ADDRESS, OWNER_1, 60, OWNER_2, 40)
+    utxo_index.add_transaction(1000, 2, tx)
+    assert utxo_index.get_utxos(OWNER_1) == [(1000, 2, 0, NULL_ADDRESS, 60)]
+    assert utxo_index.get_utxos(OWNER_2) == [(1000, 2, 1, NULL_ADDRESS, 40)]
+
+
+def test_skips_empty_outputs(utxo_index):
+    tx = Transaction(1, 0, 0, 0, 0, 0, NULL_ADDRESS, OWNER_1, 100, NULL_ADDRESS, 0)
+    utxo_index.add_transaction(1000, 0, tx)
+    assert utxo_index.get_utxos(NULL_ADDRESS) == []
+    assert len(utxo_index.outputs) == 1
+
+
+def test_remove(utxo_index):
+    utxo_index.add(OWNER_1, pack_utxo_pos(1, 0, 0), NULL_ADDRESS, 100)
+    utxo_index.add(OWNER_1, pack_utxo_pos(2, 0, 0), NULL_ADDRESS, 50)
+    utxo_index.remove(pack_utxo_pos(1, 0, 0))
+    utxo_index.remove(pack_utxo_pos(3, 0, 0))
+    assert utxo_index.get_utxos(OWNER_1) == [(2, 0, 0, NULL_ADDRESS, 50)]
+    assert utxo_index.get_balance(OWNER_1) == 50
+
+    utxo_index.remove(pack_utxo_pos(2, 0, 0))
+    assert utxo_index.get_utxos(OWNER_1) == []
+    assert utxo_index.get_balance(OWNER_1) == 0
+
+
+def test_pagination(utxo_index):
+    for blknum in [5, 3, 1, 4, 2]:
+        utxo_index.add(OWNER_1, pack_utxo_pos(blknum, 0, 0), NULL_ADDRESS, blknum)
+    assert [utxo[0] for utxo in utxo_index.get_utxos(OWNER_1, 0, 2)] == [1, 2]
+    assert [utxo[0] for utxo in utxo_index.get_utxos(OWNER_1, 2, 2)] == [3, 4]
+    assert [utxo[0] for utxo in utxo_index.get_utxos(OWNER_1, 4, 2)] == [5]
+
+
+def test_balance_per_token(utxo_index):
+    utxo_index.add(OWNER_1, pack_utxo_pos(1, 0, 0), NULL_ADDRESS, 100)
+    utxo_index.add(OWNER_1, pack_utxo_pos(2, 0, 0), TOKEN, 7)
+    utxo_index.add(OWNER_1, pack_utxo_pos(3, 0, 0), TOKEN, 3)
+    assert utxo_index.get_balance(OWNER_1) == 100
+    assert utxo_index.get_balance(OWNER_1, TOKEN) == 10
+    assert utxo_index.get_balance(OWNER_2, TOKEN) == 0
+
+
+def test_remove_reports_fully_spent_block(utxo_index):
+    tx = Transaction(1, 0, 0, 0, 0, 0, NULL_ADDRESS, OWNER_1, 60, OWNER_2, 40)
+    utxo_index.add_transaction(1000, 0, tx)
+    assert utxo_index.remove(pack_utxo_pos(1000, 0, 0)) is False
+    assert utxo_index.remove(pack_utxo_pos(1000, 0, 0)) is False
+    assert utxo_index.remove(pack_utxo_pos(1000, 0, 1)) is True
@@ -0,0 +1,60 @@
+import threading
+import pytest
+from plasma.child_chain.write_ahead_log import WriteAheadLog
+
+
+@pytest.fixture(params=[0, 0.01])
+def wal(request, tmpdir):
+    wal = WriteAheadLog(str(tmpdir.join('wal')), commit_window=request.param)
+    yield wal
+    wal.close()
+
+
+def test_replays_committed_records(wal):
+    wal.append(WriteAheadLog.TRANSACTION, b'tx')
+    wal.wait(wal.append(WriteAheadLog.SPEND, b'\x01'))
+    assert list(wal.records()) == [(WriteAheadLog.TRANSACTION, b'tx'), (WriteAheadLog.SPEND, b'\x01')]
+
+
+def test_truncate(wal):
+    wal.wait(wal.append(WriteAheadLog.TRANSACTION, b'tx'))
+    wal.truncate()
+    assert list(wal.records()) == []
+    wal.wait(wal.append(WriteAheadLog.TRANSACTION, b'tx2'))
+    assert list(wal.records()) == [(WriteAheadLog.TRANSACTION, b'tx2')]
+
+
+def test_truncate_keeps_records(wal):
+    seq = wal.append(WriteAheadLog.TRANSACTION, b'tx')
+    wal.truncate([(WriteAheadLog.TRANSACTION, b'tx2')])
+    wal.wait(seq)
+    assert list(wal.records()) == [(WriteAheadLog.TRANSACTION, b'tx2')]
+
+    wal.wait(wal.append(WriteAheadLog.SPEND, b'\x01'))
+    assert list(wal.records()) == [(WriteAheadLog.TRANSACTION, b'tx2'), (WriteAheadLog.SPEND, b'\x01')]
+
+
+def test_group_commit_from_many_threads(wal):
+    def append(i):
+        wal.wait(wal.append(WriteAheadLog.TRANSACTION, bytes([i])))
+
+    threads = [threading.Thread(target=append, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(payload for _, payload in wal.records()) == [bytes([i]) for i in range(16)]
+
+
+def test_ignores_torn_record(tmpdir):
+    path = str(tmpdir.join('wal'))
+    wal = WriteAheadLog(path)
+    wal.wait(wal.append(WriteAheadLog.TRANSACTION, b'tx'))
+    wal.close()
+    with open(path, 'ab') as log_file:
+        log_file.write(b'\x00\x00\x00\x10\xc3')
+
+    wal = WriteAheadLog(path)
+    wal.wait(wal.append(WriteAheadLog.TRANSACTION, b'tx2'))
+    assert list(wal.records()) == [(WriteAheadLog.TRANSACTION, b'tx'), (WriteAheadLog.TRANSACTION, b'tx2')]
+    wal.close()
@@ -0,0 +1,39 @@
+import pytest
+from plasma.utils.cache import LRUCache
+
+
+def test_get_and_put():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('b', 2) == 2
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 2
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.evictions == 1
+
+
+def test_resize():
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache.put(key, key)
+    cache.resize(1)
+    assert len(cache) == 1
+    assert 'c' in cache
+    assert cache.evictions == 2
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(0)
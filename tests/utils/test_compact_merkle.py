@@ -0,0 +1,50 @@
+import pytest
+from ethereum.utils import sha3
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.merkle.exceptions import MemberNotExistException
+from plasma.utils.merkle.fixed_merkle import FixedMerkle
+
+
+def test_initialize_with_leaves():
+    leaves = [b'a', b'c', b'c', b'd', b'e']
+    assert CompactMerkle(3, leaves).leaves == FixedMerkle(3, leaves).leaves
+
+
+def test_initialize_with_leaves_more_than_depth_permits():
+    with pytest.raises(ValueError):
+        CompactMerkle(1, [sha3(b'dummy leaf')] * 3, True)
+
+
+@pytest.mark.parametrize('num_leaves', [0, 1, 3, 4, 7, 8])
+def test_root_matches_fixed_merkle(num_leaves):
+    leaves = [sha3(bytes([i])) for i in range(num_leaves)]
+    assert CompactMerkle(3, leaves, True).root == FixedMerkle(3, leaves, True).root
+    assert CompactMerkle(16, leaves, True).root == FixedMerkle(16, leaves, True).root
+
+
+def test_create_membership_proof():
+    leaves = [b'a', b'b', b'c']
+    merkle = CompactMerkle(16, leaves)
+    fixed_merkle = FixedMerkle(16, leaves)
+    for index, leaf in enumerate(leaves):
+        proof = merkle.create_membership_proof(leaf)
+        assert proof == fixed_merkle.create_membership_proof(leaf)
+        assert merkle.check_membership(leaf, index, proof) is True
+
+    with pytest.raises(MemberNotExistException):
+        merkle.create_membership_proof(b'd')
+
+
+def test_is_member_ignores_unaligned_matches():
+    leaf = b'\x01' * 32
+    leaves = [b'\x02' * 16 + b'\x01' * 16, b'\x01' * 16 + b'\x03' * 16, leaf]
+    merkle = CompactMerkle(2, leaves, True)
+    assert merkle.index(leaf) == 2
+    assert merkle.is_member(b'\x01' * 16 + b'\x03' * 16) is True
+    assert merkle.not_member(b'\x03' * 32) is True
+
+
+def test_create_membership_proofs():
+    leaves = [sha3(bytes([i])) for i in range(5)]
+    merkle = CompactMerkle(16, leaves, True)
+    assert merkle.create_membership_proofs(leaves) == FixedMerkle(16, leaves, True).create_membership_proofs(leaves)
@@ -1,5 +1,6 @@
 import pytest
 from ethereum.utils import sha3
+from plasma.utils.merkle.exceptions import MemberNotExistException
 from plasma.utils.merkle.fixed_merkle import FixedMerkle
 from plasma.utils.utils import get_empty_merkle_tree_hash
 
@@ -75,3 +76,15 @@ def test_non_member():
     merkle = FixedMerkle(2, leaves, True)
     assert merkle.not_member(b'b') is False
     assert merkle.not_member(b'd') is True
+
+
+def test_create_membership_proofs():
+    leaves = [b'a', b'b', b'c']
+    merkle = FixedMerkle(16, leaves)
+    proofs = merkle.create_membership_proofs(leaves)
+    assert proofs == [merkle.create_membership_proof(leaf) for leaf in leaves]
+    for index, (leaf, proof) in enumerate(zip(leaves, proofs)):
+        assert merkle.check_membership(leaf, index, proof) is True
+
+    with pytest.raises(MemberNotExistException):
+        merkle.create_membership_proofs([b'a', b'd'])
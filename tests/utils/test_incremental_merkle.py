@@ -0,0 +1,28 @@
+import pytest
+from ethereum.utils import sha3
+from plasma.utils.merkle.fixed_merkle import FixedMerkle
+from plasma.utils.merkle.incremental_merkle import IncrementalMerkle
+
+
+def test_hash_empty_tree():
+    assert IncrementalMerkle(1).root == FixedMerkle(1).root
+    assert IncrementalMerkle(16).root == FixedMerkle(16).root
+
+
+@pytest.mark.parametrize('depth', [1, 2, 3])
+def test_root_matches_fixed_merkle(depth):
+    leaves = [sha3(bytes([i])) for i in range(2 ** depth)]
+    merkle = IncrementalMerkle(depth, hashed=True)
+    for i, leaf in enumerate(leaves):
+        merkle.add(leaf)
+        assert merkle.root == FixedMerkle(depth, leaves[:i + 1], True).root
+
+
+def test_unhashed_leaves():
+    assert IncrementalMerkle(2, [b'a', b'b', b'c']).root == FixedMerkle(2, [b'a', b'b', b'c']).root
+
+
+def test_add_more_than_depth_permits():
+    merkle = IncrementalMerkle(1, [b'a', b'b'])
+    with pytest.raises(ValueError):
+        merkle.add(b'c')
@@ -0,0 +1,34 @@
+import os
+import pytest
+from plasma.utils.keccak import (ABC_KECCAK, EMPTY_KECCAK, available_backends, get_backend, keccak, keccak_many,
+                                 select_backend)
+
+
+def test_selected_backend_is_keccak():
+    assert keccak(b'') == EMPTY_KECCAK
+    assert keccak(b'abc') == ABC_KECCAK
+
+
+def test_available_backends_agree():
+    backends = available_backends()
+    assert get_backend()[0] in backends
+    data = os.urandom(200)
+    assert len(set(backend_keccak(data) for backend_keccak, _ in backends.values())) == 1
+
+
+def test_keccak_many():
+    items = [os.urandom(64) for _ in range(10)]
+    assert keccak_many(items) == [keccak(item) for item in items]
+    assert keccak_many([]) == []
+    for _, backend_keccak_many in available_backends().values():
+        assert backend_keccak_many(items) == keccak_many(items)
+
+
+def test_select_named_backend():
+    name = get_backend()[0]
+    assert select_backend(name)[0] == name
+
+
+def test_select_unknown_backend():
+    with pytest.raises(ValueError):
+        select_backend('md5')
@@ -0,0 +1,17 @@
+from ethereum import utils as u
+from plasma.utils.utils import get_sender, sender_cache, sign
+
+
+def test_get_sender_is_cached(t):
+    msg_hash = u.sha3(b'plasma')
+    sig = sign(msg_hash, t.k0)
+    sender_cache.clear()
+
+    assert get_sender(msg_hash, sig) == t.a0
+    assert get_sender(msg_hash, sig) == t.a0
+    stats = sender_cache.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+    assert get_sender(msg_hash, sign(msg_hash, t.k1)) == t.a1
+    assert sender_cache.stats()['size'] == 2
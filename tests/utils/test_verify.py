@@ -0,0 +1,55 @@
+from plasma.utils.merkle.compact_merkle import CompactMerkle
+from plasma.utils.merkle.verify import verify_many
+
+
+def test_verify_many_valid_proofs():
+    leaves = [bytes([i]) for i in range(10)]
+    merkle = CompactMerkle(4, leaves)
+    items = [(leaf, index, proof) for index, (leaf, proof)
+             in enumerate(zip(leaves, merkle.create_membership_proofs(leaves)))]
+    assert verify_many(merkle.root, items, 4) == [True] * len(leaves)
+    assert verify_many(merkle.root, items[::-1], 4) == [True] * len(leaves)
+
+
+def test_verify_many_matches_check_membership():
+    leaves = [bytes([i]) for i in range(6)]
+    merkle = CompactMerkle(3, leaves)
+    proofs = merkle.create_membership_proofs(leaves)
+    forged = proofs[1][:32] + b'\x00' * 32 + proofs[1][64:]
+    items = [
+        (leaves[0], 0, proofs[0]),
+        (leaves[1], 1, forged),
+        (b'x', 2, proofs[2]),
+        (leaves[3], 4, proofs[3]),
+        (leaves[4], 4, proofs[4]),
+        (leaves[1], 1, proofs[1]),
+    ]
+    expected = [merkle.check_membership(*item) for item in items]
+    assert expected == [True, False, False, False, True, True]
+    assert verify_many(merkle.root, items, 3) == expected
+
+
+def test_verify_many_rejects_bad_shapes():
+    leaves = [b'a', b'b']
+    merkle = CompactMerkle(2, leaves)
+    proof = merkle.create_membership_proof(b'a')
+    assert verify_many(merkle.root, [(b'a', 0, proof + b'\x00' * 32)], 2) == [False]
+    assert verify_many(merkle.root, [(b'a', 0, proof), (b'a', 4, proof)], 2) == [True, False]
+    assert verify_many(merkle.root, [], 2) == []
+
+
+def test_verify_many_bad_first_proof():
+    leaves = [bytes([i]) for i in range(4)]
+    merkle = CompactMerkle(16, leaves)
+    proofs = merkle.create_membership_proofs(leaves)
+    items = [(leaves[0], 0, proofs[0][:32])] + [(leaf, index, proof)
+                                                for index, (leaf, proof) in enumerate(zip(leaves, proofs))]
+    assert verify_many(merkle.root, items) == [False, True, True, True, True]
+
+
+def test_verify_many_hashed_leaves():
+    leaves = [bytes([i]) * 32 for i in range(5)]
+    merkle = CompactMerkle(16, leaves, hashed=True)
+    proofs = merkle.create_membership_proofs(leaves)
+    assert verify_many(merkle.root, zip(leaves, range(5), proofs), hashed=True) == [True] * 5
+    assert verify_many(merkle.root, zip(leaves, range(5), proofs)) == [False] * 5